@@ -3,8 +3,9 @@
 import logging
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Deque, Dict, Iterable, List, Optional, Any, Union
 from dataclasses import dataclass
+from collections import deque
 import time
 
 from .base import Tool, ToolResult, ExecutionContext, LLMProvider, ToolRegistry
@@ -14,6 +15,10 @@ from ..tools import (
     UpdateTool, TodoTool, TaskTool
 )
 
+# Conversation history keeps only this many of the most recent messages
+MAX_HISTORY_MESSAGES = 50
+
+
 @dataclass
 class AgentConfig:
     """Configuration for the agent."""
@@ -76,7 +81,7 @@ class Agent:
         self._register_default_tools()
         
         # Conversation state
-        self.conversation_history: List[ConversationMessage] = []
+        self.conversation_history: Deque[ConversationMessage] = deque(maxlen=MAX_HISTORY_MESSAGES)
         self.execution_context = ExecutionContext(
             working_directory=self.working_directory,
             session_id=config.session_id or f"session_{int(time.time())}"
@@ -94,6 +99,21 @@ class Agent:
     def _add_message(self, role: str, msg: str):
             msg = ConversationMessage(role, msg, "timestamp")
             self.conversation_history.append(msg)
+    
+    def _extend_messages(self, role: str, contents: Iterable[str]):
+        """Append several messages from one role in a single batch.
+        
+        The history is bounded, so older messages fall off the front as the
+        batch is appended.
+        
+        Args:
+            role: Role of every message ('user', 'assistant', 'system', 'tool')
+            contents: Message contents, oldest first
+        """
+        timestamp = time.time()
+        self.conversation_history.extend(
+            ConversationMessage(role, content, timestamp) for content in contents
+        )
 
     def _register_default_tools(self):
         """Register default tools."""
@@ -167,7 +187,7 @@ class Agent:
     
     def _get_conversation_context(self) -> str:
         """Get conversation context for task planning."""
-        recent_messages = self.conversation_history[-5:]  # Last 5 messages
+        recent_messages = list(self.conversation_history)[-5:]  # Last 5 messages
         context_parts = []
         
         for msg in recent_messages:
@@ -366,7 +386,7 @@ class Agent:
                 session_data = json.load(f)
             
             # Restore conversation history
-            self.conversation_history = []
+            self.conversation_history.clear()
             for msg_data in session_data.get("conversation_history", []):
                 self._add_message(
                     role=msg_data["role"],
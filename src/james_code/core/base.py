@@ -42,7 +42,15 @@ class Tool(ABC):
         pass
     
     def get_schema(self) -> Dict[str, Any]:
-        """Get the tool's parameter schema."""
+        """Get the tool's parameter schema.
+        
+        The schema is built on first use and cached on the instance, so
+        callers must not mutate the returned dict.
+        """
+        schema = getattr(self, "_schema", None)
+        if schema is not None:
+            return schema
+        
         schema = {
             "name": self.name,
             "description": self.description,
@@ -53,7 +61,8 @@ class Tool(ABC):
         examples = self._get_examples()
         if examples:
             schema["examples"] = examples
-            
+        
+        self._schema = schema
         return schema
     
     @abstractmethod
@@ -3,21 +3,36 @@
 import subprocess
 import signal
 import os
+import re
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from threading import Timer
 
 from ..core.base import Tool, ToolResult, ExecutionContext
 
 
+# Substrings that make a command unsafe to run, reported in this order
+DANGEROUS_PATTERNS = (
+    "&&", "||", ";", "|", ">", ">>", "<",
+    "$(", "`", "eval", "exec", "source", ".",
+    "rm -rf", ":(){ :|:& };:"  # Fork bomb pattern
+)
+
+# All dangerous patterns in one alternation, so safe commands are cleared
+# in a single scan instead of one substring search per pattern
+_DANGEROUS_PATTERN_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)))
+
+
 class ExecuteTool(Tool):
     """Tool for executing shell commands."""
     
-    def __init__(self, allowed_commands: Optional[List[str]] = None, blocked_commands: Optional[List[str]] = None):
+    def __init__(self, allowed_commands: Optional[List[str]] = None, blocked_commands: Optional[List[str]] = None,
+                 kill_grace: float = 2.0):
         super().__init__(
             name="execute",
             description="Execute shell commands"
         )
+        # Seconds a timed-out process group gets to exit after SIGTERM before SIGKILL
+        self.kill_grace = kill_grace
         self.allowed_commands = allowed_commands or []
         self.blocked_commands = blocked_commands or [
             "rm", "rmdir", "del", "format", "fdisk", "mkfs",
@@ -32,7 +47,7 @@ class ExecuteTool(Tool):
         command = kwargs.get("command")
         timeout = kwargs.get("timeout", 30)
         
-        if not command or not isinstance(command, str):
+        if not command or not isinstance(command, str) or not command.strip():
             return False
         
         if not isinstance(timeout, (int, float)) or timeout <= 0 or timeout > 300:
@@ -114,20 +129,15 @@ class ExecuteTool(Tool):
                     error=f"Command not in allowed list: {command_base}"
                 )
         
-        # Check for dangerous patterns
-        dangerous_patterns = [
-            "&&", "||", ";", "|", ">", ">>", "<",
-            "$(", "`", "eval", "exec", "source", ".",
-            "rm -rf", ":(){ :|:& };:"  # Fork bomb pattern
-        ]
-        
-        for pattern in dangerous_patterns:
-            if pattern in command_lower:
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error=f"Command contains dangerous pattern: {pattern}"
-                )
+        # Check for dangerous patterns; only a hit needs the per-pattern pass,
+        # which reports the first pattern in list order
+        if _DANGEROUS_PATTERN_RE.search(command_lower):
+            pattern = next(p for p in DANGEROUS_PATTERNS if p in command_lower)
+            return ToolResult(
+                success=False,
+                data=None,
+                error=f"Command contains dangerous pattern: {pattern}"
+            )
         
         return ToolResult(success=True, data=None)
     
@@ -150,13 +160,8 @@ class ExecuteTool(Tool):
                 preexec_fn=os.setsid if os.name != 'nt' else None
             )
             
-            # Set up timeout
-            timer = Timer(timeout, self._kill_process, [process])
-            timer.start()
-            
             try:
-                stdout, stderr = process.communicate()
-                timer.cancel()
+                stdout, stderr = process.communicate(timeout=timeout)
                 
                 # Check output size limits (1MB each)
                 if len(stdout) > 1024 * 1024:
@@ -182,8 +187,9 @@ class ExecuteTool(Tool):
                 )
                 
             except subprocess.TimeoutExpired:
-                timer.cancel()
                 self._kill_process(process)
+                # Reap the process and drain its pipes
+                process.communicate()
                 return ToolResult(
                     success=False,
                     data=None,
@@ -199,19 +205,27 @@ class ExecuteTool(Tool):
             )
     
     def _kill_process(self, process: subprocess.Popen):
-        """Kill a process and its children."""
+        """Kill a process and its children, escalating from SIGTERM to SIGKILL."""
         try:
             if os.name == 'nt':
                 # Windows
                 process.terminate()
+                try:
+                    process.wait(timeout=self.kill_grace)
+                except subprocess.TimeoutExpired:
+                    process.kill()
             else:
                 # Unix-like systems
-                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                pgid = os.getpgid(process.pid)
+                os.killpg(pgid, signal.SIGTERM)
                 # Give it a moment to terminate gracefully
                 try:
-                    process.wait(timeout=2)
+                    process.wait(timeout=self.kill_grace)
                 except subprocess.TimeoutExpired:
-                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    pass
+                # Kill whatever is left of the group, including children that
+                # ignore SIGTERM or outlive the shell, so the pipes close
+                os.killpg(pgid, signal.SIGKILL)
         except (ProcessLookupError, OSError):
             # Process already terminated
             pass
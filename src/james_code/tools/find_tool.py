@@ -1,44 +1,135 @@
 """FIND tool for advanced search capabilities."""
 
+import ast
+import bisect
 import os
 import re
+import mmap
 import fnmatch
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from ..core.base import Tool, ToolResult, ExecutionContext
 
+try:
+    from re import _parser as regex_parser  # Python 3.11+
+except ImportError:
+    import sre_parse as regex_parser
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+
+# Characters that make a query more than a plain literal when used as a regex
+REGEX_METACHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+# Top-level entry count above which subtrees are searched in parallel
+PARALLEL_ENTRY_THRESHOLD = 64
+
+# Default cap on the number of entries find_files returns
+FIND_FILES_MAX_RESULTS = 10000
+
+# Files below this size are read with a single os.read() instead of buffered IO
+SMALL_FILE_MAX_BYTES = 64 * 1024
+
+# Chunk size for streaming scans of files that are not memory-mapped
+SCAN_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Avoid access-time updates while scanning, where the platform supports it
+O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+# Line-based definition matcher for Python files that fail to parse
+PYTHON_DEFINITION_RE = re.compile(r"\s*(?:async\s+def|def|class)\s+(\w+)")
+
+# Source files find_function searches with regex patterns
+FUNCTION_FILE_TYPES = ["*.js", "*.java", "*.c", "*.cpp", "*.h"]
+
+# Parameters each action requires; at least one of the listed names must be set
+ACTION_REQUIRED_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "find_files": ("pattern",),
+    "search_content": ("query", "queries"),
+    "find_function": ("function_name",),
+    "grep_recursive": ("pattern",),
+    "find_by_size": (),
+    "find_by_date": (),
+}
+
+
+class ContentMatch(NamedTuple):
+    """A matching line found by content search; returned to callers as a dict."""
+    file: str
+    line: int
+    content: str
+    match_type: str
+
+
+@functools.lru_cache(maxsize=64)
+def _workspace_realpath(working_directory: str) -> str:
+    """Resolve an absolute working directory, reusing the result across calls."""
+    return os.path.realpath(working_directory)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex, reusing the result for repeated queries."""
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob_tuple(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compile glob patterns into one regex, reusing the result for repeated calls."""
+    if not patterns:
+        # An empty list matches nothing
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
 
 class FindTool(Tool):
     """Tool for finding files and searching content."""
     
+    # Directory names no search descends into; override per call with ``skip_dirs``
+    SKIP_DIRS: FrozenSet[str] = frozenset({"__pycache__", "node_modules", ".git", ".venv"})
+    
     def __init__(self):
         super().__init__(
             name="find",
             description="Find files and search content with advanced patterns"
         )
+        # Python definitions per file path, keyed on (mtime_ns, size); each maps a
+        # lowercased name to its (line, content) pairs
+        self._definition_cache: Dict[str, Tuple[int, int, Dict[str, List[Tuple[int, str]]]]] = {}
+        # Compiled Hyperscan databases keyed on (expressions, case_sensitive)
+        self._hs_databases: Dict[Tuple[Tuple[str, ...], bool], Any] = {}
+        # Handlers are bound once so execute() dispatches with a dict lookup
+        self._handlers: Dict[str, Callable[..., ToolResult]] = {
+            "find_files": self._find_files,
+            "search_content": self._search_content,
+            "find_function": self._find_function,
+            "grep_recursive": self._grep_recursive,
+            "find_by_size": self._find_by_size,
+            "find_by_date": self._find_by_date,
+        }
     
     def validate_input(self, **kwargs) -> bool:
         """Validate input parameters."""
         action = kwargs.get("action")
         
-        if not action or action not in [
-            "find_files", "search_content", "find_function", 
-            "grep_recursive", "find_by_size", "find_by_date"
-        ]:
-            return False
-        
-        # Action-specific validation
-        if action == "find_files" and not kwargs.get("pattern"):
-            return False
-        
-        if action == "search_content" and not kwargs.get("query"):
+        if not isinstance(action, str):
             return False
         
-        if action == "find_function" and not kwargs.get("function_name"):
+        required = ACTION_REQUIRED_PARAMS.get(action)
+        if required is None:
             return False
         
-        if action == "grep_recursive" and not kwargs.get("pattern"):
+        # Action-specific validation
+        if required and not any(kwargs.get(name) for name in required):
             return False
         
         return True
@@ -52,21 +143,12 @@ class FindTool(Tool):
                 error="Invalid input parameters"
             )
         
-        action = kwargs["action"]
+        # "path" is accepted as an alias for "directory"
+        if "path" in kwargs and "directory" not in kwargs:
+            kwargs["directory"] = kwargs.pop("path")
         
         try:
-            if action == "find_files":
-                return self._find_files(context, **kwargs)
-            elif action == "search_content":
-                return self._search_content(context, **kwargs)
-            elif action == "find_function":
-                return self._find_function(context, **kwargs)
-            elif action == "grep_recursive":
-                return self._grep_recursive(context, **kwargs)
-            elif action == "find_by_size":
-                return self._find_by_size(context, **kwargs)
-            elif action == "find_by_date":
-                return self._find_by_date(context, **kwargs)
+            return self._handlers[kwargs["action"]](context, **kwargs)
             
         except Exception as e:
             return ToolResult(
@@ -80,54 +162,40 @@ class FindTool(Tool):
         pattern = kwargs["pattern"]
         directory = kwargs.get("directory", ".")
         max_depth = kwargs.get("max_depth", 10)
+        max_results = kwargs.get("max_results", FIND_FILES_MAX_RESULTS)
         include_hidden = kwargs.get("include_hidden", False)
+        skip_dirs = kwargs.get("skip_dirs")
+        parallel = kwargs.get("parallel")
         
         try:
-            search_dir = Path(context.working_directory) / directory
-            search_dir = search_dir.resolve()
-            
             # Security check
-            if not str(search_dir).startswith(str(context.working_directory.resolve())):
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error="Search directory outside working directory"
-                )
-            
-            if not search_dir.exists():
+            workspace, search_dir, error = self._validate_path(context, directory)
+            if error:
                 return ToolResult(
                     success=False,
                     data=None,
-                    error=f"Directory does not exist: {search_dir}"
+                    error=error
                 )
             
-            matches = []
-            self._find_files_recursive(search_dir, pattern, matches, 0, max_depth, include_hidden)
-            
-            # Convert paths to relative paths
-            relative_matches = []
-            for match in matches:
-                try:
-                    rel_path = match.relative_to(context.working_directory)
-                    relative_matches.append({
-                        "path": str(rel_path),
-                        "absolute_path": str(match),
-                        "type": "directory" if match.is_dir() else "file",
-                        "size": match.stat().st_size if match.is_file() else None,
-                        "modified": match.stat().st_mtime
-                    })
-                except ValueError:
-                    # Skip files outside working directory
-                    continue
+            # Take one extra match to tell whether the cap cut results off
+            relative_matches = list(itertools.islice(
+                self._iter_find_files(search_dir, workspace, pattern, max_depth,
+                                      include_hidden, max_results + 1, parallel, skip_dirs),
+                max_results + 1
+            ))
+            truncated = len(relative_matches) > max_results
+            del relative_matches[max_results:]
             
             return ToolResult(
                 success=True,
                 data=relative_matches,
                 metadata={
                     "pattern": pattern,
-                    "search_directory": str(search_dir),
+                    "search_directory": search_dir,
                     "match_count": len(relative_matches),
-                    "max_depth": max_depth
+                    "max_depth": max_depth,
+                    "max_results": max_results,
+                    "truncated": truncated
                 }
             )
             
@@ -138,63 +206,242 @@ class FindTool(Tool):
                 error=f"Error finding files: {str(e)}"
             )
     
-    def _find_files_recursive(self, directory: Path, pattern: str, matches: List[Path], 
-                            current_depth: int, max_depth: int, include_hidden: bool):
-        """Recursively find files matching pattern."""
-        if current_depth > max_depth:
-            return
+    def _iter_find_files(self, search_dir: str, workspace: str, pattern: Union[str, List[str]],
+                         max_depth: int, include_hidden: bool, limit: Optional[int] = None,
+                         parallel: Optional[bool] = None,
+                         skip_dirs: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield a result for each entry whose name matches the pattern.
+        
+        Args:
+            search_dir: Resolved directory to search
+            workspace: Resolved working directory results are relative to
+            pattern: Glob pattern or list of glob patterns
+            max_depth: Maximum directory depth
+            include_hidden: Whether to include hidden files and directories
+            limit: Number of results the caller will consume, if bounded
+            parallel: Whether to search subdirectories on a thread pool
+            skip_dirs: Directory names not to descend into, or None for SKIP_DIRS
+            
+        Returns:
+            Iterator of result dicts
+        """
+        name_regex = self._compile_globs(pattern)
+        descend = self._descend_filter(include_hidden, skip_dirs)
+        prefix = os.path.join(workspace, "")
+        
+        def visit(path: str, entry: os.DirEntry) -> List[Dict]:
+            # Skip hidden files unless requested
+            if not include_hidden and entry.name.startswith('.'):
+                return []
+            
+            if not name_regex.match(entry.name):
+                return []
+            
+            try:
+                rel_path = self._relative_path(path, prefix)
+            except ValueError:
+                # Skip files outside working directory
+                return []
+            
+            stat = entry.stat()
+            return [{
+                "path": rel_path,
+                "absolute_path": path,
+                "type": "directory" if entry.is_dir() else "file",
+                "size": stat.st_size if entry.is_file() else None,
+                "modified": stat.st_mtime
+            }]
+        
+        return self._iter_walk(search_dir, visit, max_depth, descend, limit, parallel)
+    
+    @staticmethod
+    def _validate_path(context: ExecutionContext,
+                       directory: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Resolve a search directory and check that it stays inside the workspace.
+        
+        Args:
+            context: Execution context
+            directory: Directory relative to the working directory
+            
+        Returns:
+            Tuple of (resolved working directory, resolved search directory,
+            error message); the search directory is None when there is an error
+        """
+        workspace = _workspace_realpath(os.path.abspath(context.working_directory))
+        search_dir = os.path.realpath(os.path.join(workspace, os.fspath(directory)))
         
         try:
-            for item in directory.iterdir():
-                # Skip hidden files unless requested
-                if not include_hidden and item.name.startswith('.'):
-                    continue
-                
-                # Check if item matches pattern
-                if fnmatch.fnmatch(item.name, pattern):
-                    matches.append(item)
-                
-                # Recurse into directories
-                if item.is_dir() and current_depth < max_depth:
-                    self._find_files_recursive(item, pattern, matches, current_depth + 1, max_depth, include_hidden)
+            inside = os.path.commonpath([search_dir, workspace]) == workspace
+        except ValueError:
+            # Paths on different drives
+            inside = False
+        
+        if not inside:
+            return workspace, None, "Search directory outside working directory"
+        
+        if not os.path.exists(search_dir):
+            return workspace, None, f"Directory does not exist: {search_dir}"
+        
+        return workspace, search_dir, None
+    
+    @staticmethod
+    def _relative_path(path: str, prefix: str) -> str:
+        """Strip a directory prefix from a path without building ``Path`` objects.
+        
+        Args:
+            path: Normalized path string
+            prefix: Directory path ending in a separator
+            
+        Returns:
+            Path relative to the directory
+            
+        Raises:
+            ValueError: If the path is not inside the directory
+        """
+        if not path.startswith(prefix):
+            raise ValueError(f"{path!r} is not in the subpath of {prefix!r}")
+        return path[len(prefix):]
+    
+    @staticmethod
+    def _compile_globs(patterns: Union[str, List[str]]) -> re.Pattern:
+        """Compile one or more glob patterns into a single regex.
+        
+        Args:
+            patterns: Glob pattern or list of glob patterns
+            
+        Returns:
+            Compiled regex matching names against any of the patterns
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return _compile_glob_tuple(tuple(patterns))
+    
+    def _iter_entries(self, root: Union[str, Path], max_depth: Optional[int] = None,
+                      descend: Optional[Callable[[os.DirEntry], bool]] = None,
+                      _depth: int = 0) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Walk a directory tree with ``os.scandir``.
+        
+        Yields each entry before descending into it. Directories are entered
+        without following symlinks, and the ``DirEntry`` type and stat
+        information is reused instead of issuing extra ``stat`` calls.
+        
+        Args:
+            root: Directory to walk
+            max_depth: Deepest level to descend into, or None for no limit
+            descend: Optional predicate deciding whether to enter a directory
+            
+        Returns:
+            Iterator of ``(path, entry)`` pairs
+        """
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    yield entry.path, entry
                     
+                    if self._should_descend(entry, max_depth, descend, _depth):
+                        yield from self._iter_entries(entry.path, max_depth, descend, _depth + 1)
         except PermissionError:
             # Skip directories we can't read
-            pass
+            return
+    
+    @staticmethod
+    def _should_descend(entry: os.DirEntry, max_depth: Optional[int],
+                        descend: Optional[Callable[[os.DirEntry], bool]], depth: int) -> bool:
+        """Return whether the walk should enter a directory entry at ``depth``."""
+        return (entry.is_dir(follow_symlinks=False)
+                and (max_depth is None or depth < max_depth)
+                and (descend is None or descend(entry)))
+    
+    def _iter_walk(self, root: Union[str, Path],
+                   visit: Callable[[str, os.DirEntry], Iterable[Any]],
+                   max_depth: Optional[int] = None,
+                   descend: Optional[Callable[[os.DirEntry], bool]] = None,
+                   limit: Optional[int] = None,
+                   parallel: Optional[bool] = None) -> Iterator[Any]:
+        """Yield ``visit`` results over a directory tree in walk order.
+        
+        Sequential walks are fully lazy, so a caller that stops consuming
+        stops the traversal. Parallel walks hand each top-level subdirectory
+        to a thread pool and merge the partial results in walk order.
+        
+        Args:
+            root: Directory to walk
+            visit: Function returning the results for one entry
+            max_depth: Deepest level to descend into, or None for no limit
+            descend: Optional predicate deciding whether to enter a directory
+            limit: Per-subtree result cap for parallel walks, or None
+            parallel: Whether to use threads; by default only when the root
+                has more than PARALLEL_ENTRY_THRESHOLD entries
+            
+        Returns:
+            Iterator of results
+        """
+        try:
+            with os.scandir(root) as it:
+                top_entries = list(it)
+        except PermissionError:
+            # Skip directories we can't read
+            return
+        
+        if parallel is None:
+            parallel = len(top_entries) > PARALLEL_ENTRY_THRESHOLD
+        
+        if not parallel:
+            for entry in top_entries:
+                yield from visit(entry.path, entry)
+                if self._should_descend(entry, max_depth, descend, 0):
+                    for path, child in self._iter_entries(entry.path, max_depth, descend, 1):
+                        yield from visit(path, child)
+            return
+        
+        def walk_subtree(entry: os.DirEntry) -> List[Any]:
+            results = []
+            if self._should_descend(entry, max_depth, descend, 0):
+                for path, child in self._iter_entries(entry.path, max_depth, descend, 1):
+                    results.extend(visit(path, child))
+                    if limit is not None and len(results) >= limit:
+                        break
+            return results
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            subtrees = list(pool.map(walk_subtree, top_entries))
+        
+        for entry, subtree in zip(top_entries, subtrees):
+            yield from visit(entry.path, entry)
+            yield from subtree
     
     def _search_content(self, context: ExecutionContext, **kwargs) -> ToolResult:
         """Search for content within files."""
-        query = kwargs["query"]
+        queries = kwargs.get("queries") or [kwargs["query"]]
+        query = queries[0]
         directory = kwargs.get("directory", ".")
         file_types = kwargs.get("file_types", ["*"])
         max_results = kwargs.get("max_results", 100)
         case_sensitive = kwargs.get("case_sensitive", False)
         use_regex = kwargs.get("use_regex", False)
+        parallel = kwargs.get("parallel")
+        skip_dirs = kwargs.get("skip_dirs")
         
         try:
-            search_dir = Path(context.working_directory) / directory
-            search_dir = search_dir.resolve()
-            
             # Security check
-            if not str(search_dir).startswith(str(context.working_directory.resolve())):
+            workspace, search_dir, error = self._validate_path(context, directory)
+            if error:
                 return ToolResult(
                     success=False,
                     data=None,
-                    error="Search directory outside working directory"
+                    error=error
                 )
             
-            if not search_dir.exists():
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error=f"Directory does not exist: {search_dir}"
-                )
+            # Several queries are matched together as one alternation
+            expressions = queries if use_regex else [re.escape(q) for q in queries]
+            multi_query = len(queries) > 1
             
             # Compile regex pattern if needed
-            if use_regex:
+            if use_regex or multi_query:
                 flags = 0 if case_sensitive else re.IGNORECASE
                 try:
-                    pattern = re.compile(query, flags)
+                    pattern = _compile_regex("|".join(f"(?:{e})" for e in expressions)
+                                             if multi_query else query, flags)
                 except re.error as e:
                     return ToolResult(
                         success=False,
@@ -205,15 +452,26 @@ class FindTool(Tool):
                 pattern = query if case_sensitive else query.lower()
             
             matches = []
-            self._search_content_recursive(search_dir, pattern, file_types, matches, 
-                                         max_results, case_sensitive, use_regex, context.working_directory)
+            if multi_query:
+                self._search_content_recursive(search_dir, pattern, file_types, matches,
+                                             max_results, case_sensitive, True, workspace,
+                                             parallel=parallel,
+                                             match_type="regex" if use_regex else "string",
+                                             hs_database=self._hyperscan_database(expressions, case_sensitive),
+                                             skip_dirs=skip_dirs)
+            else:
+                self._search_content_recursive(search_dir, pattern, file_types, matches, 
+                                             max_results, case_sensitive, use_regex, workspace,
+                                             literal=self._literal_bytes(query, case_sensitive, use_regex),
+                                             parallel=parallel, skip_dirs=skip_dirs)
             
             return ToolResult(
                 success=True,
-                data=matches,
+                data=[match._asdict() for match in matches],
                 metadata={
                     "query": query,
-                    "search_directory": str(search_dir),
+                    "queries": queries,
+                    "search_directory": search_dir,
                     "match_count": len(matches),
                     "file_types": file_types,
                     "case_sensitive": case_sensitive,
@@ -228,69 +486,458 @@ class FindTool(Tool):
                 error=f"Error searching content: {str(e)}"
             )
     
-    def _search_content_recursive(self, directory: Path, pattern: Union[str, re.Pattern], 
-                                file_types: List[str], matches: List[Dict], max_results: int,
-                                case_sensitive: bool, use_regex: bool, working_dir: Path):
-        """Recursively search content in files."""
-        if len(matches) >= max_results:
+    def _search_content_recursive(self, directory: Union[str, Path], pattern: Union[str, re.Pattern], 
+                                file_types: List[str], matches: List[ContentMatch], max_results: int,
+                                case_sensitive: bool, use_regex: bool, working_dir: Union[str, Path],
+                                literal: Optional[bytes] = None, parallel: Optional[bool] = None,
+                                match_type: Optional[str] = None, hs_database: Any = None,
+                                skip_dirs: Optional[Iterable[str]] = None):
+        """Recursively search content in files.
+        
+        When ``literal`` is given, files are scanned as raw bytes for it
+        instead of being decoded and matched line by line. When
+        ``hs_database`` is given, Hyperscan finds the candidate lines for
+        the regex ``pattern``.
+        """
+        remaining = max_results - len(matches)
+        if remaining <= 0:
             return
         
-        try:
-            for item in directory.iterdir():
-                if len(matches) >= max_results:
-                    break
+        type_regex = self._compile_globs(file_types)
+        prefix = os.path.join(str(working_dir), "")
+        if match_type is None:
+            match_type = "regex" if use_regex else "string"
+        min_size = self._min_match_size(pattern, use_regex, literal)
+        # Per-line anchors must still match at every line start in a whole-file search
+        buffer_regex = _compile_regex(pattern.pattern, pattern.flags | re.MULTILINE) if use_regex else None
+        
+        def visit(path: str, entry: os.DirEntry) -> List[ContentMatch]:
+            file_matches = []
+            
+            if not entry.is_file():
+                return file_matches
+            
+            # Check if file type matches
+            if not type_regex.match(entry.name):
+                return file_matches
+            
+            # Skip files too small to hold a match, and large files (>10MB)
+            stat = entry.stat()
+            if stat.st_size < min_size or stat.st_size > 10 * 1024 * 1024:
+                return file_matches
+            
+            try:
+                if literal is not None:
+                    self._scan_literal(path, stat.st_size, literal, case_sensitive, file_matches, remaining,
+                                       self._relative_path(path, prefix), match_type)
+                    return file_matches
                 
-                if item.is_file():
-                    # Check if file type matches
-                    if not any(fnmatch.fnmatch(item.name, ft) for ft in file_types):
-                        continue
-                    
-                    # Skip large files (>10MB)
-                    if item.stat().st_size > 10 * 1024 * 1024:
-                        continue
-                    
-                    try:
-                        with open(item, 'r', encoding='utf-8') as f:
-                            for line_num, line in enumerate(f, 1):
-                                if use_regex:
-                                    if pattern.search(line):
-                                        rel_path = item.relative_to(working_dir)
-                                        matches.append({
-                                            "file": str(rel_path),
-                                            "line": line_num,
-                                            "content": line.strip(),
-                                            "match_type": "regex"
-                                        })
-                                else:
-                                    search_line = line if case_sensitive else line.lower()
-                                    if pattern in search_line:
-                                        rel_path = item.relative_to(working_dir)
-                                        matches.append({
-                                            "file": str(rel_path),
-                                            "line": line_num,
-                                            "content": line.strip(),
-                                            "match_type": "string"
-                                        })
-                                
-                                if len(matches) >= max_results:
-                                    break
-                    except (UnicodeDecodeError, PermissionError):
-                        # Skip binary files or files we can't read
-                        continue
+                if hs_database is not None:
+                    self._scan_hyperscan(path, stat.st_size, hs_database, pattern, file_matches, remaining,
+                                         self._relative_path(path, prefix), match_type)
+                    return file_matches
                 
-                elif item.is_dir() and not item.name.startswith('.'):
-                    self._search_content_recursive(item, pattern, file_types, matches, 
-                                                 max_results, case_sensitive, use_regex, working_dir)
-                    
+                if use_regex:
+                    self._scan_regex(path, stat.st_size, pattern, buffer_regex, file_matches, remaining,
+                                     self._relative_path(path, prefix), match_type)
+                    return file_matches
+                
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line_num, line in enumerate(f, 1):
+                        search_line = line if case_sensitive else line.lower()
+                        if pattern in search_line:
+                            file_matches.append(ContentMatch(
+                                file=self._relative_path(path, prefix),
+                                line=line_num,
+                                content=line.strip(),
+                                match_type=match_type
+                            ))
+                        
+                        if len(file_matches) >= remaining:
+                            break
+            except (UnicodeDecodeError, PermissionError):
+                # Skip binary files or files we can't read
+                pass
+            
+            return file_matches
+        
+        matches.extend(itertools.islice(
+            self._iter_walk(str(directory), visit, descend=self._descend_filter(False, skip_dirs),
+                            limit=remaining, parallel=parallel),
+            remaining
+        ))
+    
+    @staticmethod
+    def _min_match_size(pattern: Union[str, re.Pattern], use_regex: bool,
+                        literal: Optional[bytes]) -> int:
+        """Get the smallest file size in bytes that could contain a match.
+        
+        Args:
+            pattern: Search string or compiled regex
+            use_regex: Whether ``pattern`` is a compiled regex
+            literal: Encoded literal query, if the query is a plain literal
+            
+        Returns:
+            Minimum file size, never less than 1 so empty files are skipped
+        """
+        if literal is not None:
+            return max(len(literal), 1)
+        
+        if use_regex:
+            # Every character takes at least one byte, so the regex's minimum
+            # width in characters is a lower bound on the file size
+            try:
+                return max(regex_parser.parse(pattern.pattern, pattern.flags).getwidth()[0], 1)
+            except Exception:
+                return 1
+        
+        # Lowercasing can change a string's length, so only rule out empty files
+        return 1
+    
+    @staticmethod
+    def _literal_bytes(query: str, case_sensitive: bool, use_regex: bool) -> Optional[bytes]:
+        """Get the byte string to scan for when a query is a plain literal.
+        
+        Args:
+            query: Search query
+            case_sensitive: Whether the search is case sensitive
+            use_regex: Whether the query is a regex
+            
+        Returns:
+            Encoded query, lowercased for case-insensitive searches, or None
+            if the query needs line-by-line matching
+        """
+        if use_regex and REGEX_METACHARACTERS.search(query):
+            return None
+        
+        if case_sensitive:
+            return query.encode('utf-8')
+        
+        # bytes.lower() only folds ASCII, so non-ASCII queries take the slow path
+        if not query.isascii():
+            return None
+        return query.lower().encode('utf-8')
+    
+    @staticmethod
+    def _scan_literal(path: str, size: int, literal: bytes, case_sensitive: bool,
+                      matches: List[ContentMatch], max_results: int, rel_path: str, match_type: str):
+        """Scan a file's bytes for a literal, one match per line.
+        
+        Small files are read directly. Larger ones are memory-mapped for
+        case-sensitive searches, and otherwise streamed in chunks so that
+        lowercasing never copies the whole file.
+        
+        Args:
+            path: File to scan
+            size: File size in bytes
+            literal: Encoded query, lowercased if not case sensitive
+            case_sensitive: Whether the search is case sensitive
+            matches: List to append matches to
+            max_results: Maximum number of matches to collect
+            rel_path: Path reported in each match
+            match_type: Match type reported in each match
+        """
+        if size < SMALL_FILE_MAX_BYTES:
+            FindTool._scan_literal_buffer(FindTool._read_file(path, size), literal, case_sensitive,
+                                          matches, max_results, rel_path, match_type)
+            return
+        
+        if case_sensitive:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                try:
+                    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Not mappable on this platform or filesystem
+                    mm = None
+                
+                if mm is not None:
+                    with mm:
+                        FindTool._scan_literal_buffer(mm, literal, case_sensitive,
+                                                      matches, max_results, rel_path, match_type)
+                    return
+            finally:
+                os.close(fd)
+        
+        FindTool._scan_literal_chunks(path, literal, case_sensitive,
+                                      matches, max_results, rel_path, match_type)
+    
+    @staticmethod
+    def _scan_literal_chunks(path: str, literal: bytes, case_sensitive: bool, matches: List[ContentMatch],
+                             max_results: int, rel_path: str, match_type: str):
+        """Scan a file for a literal in SCAN_CHUNK_BYTES reads.
+        
+        Each chunk is cut at its last line break and the partial line is
+        carried into the next one, so a match never straddles two scans.
+        A trailing ``\r`` is carried too, in case a ``\n`` follows it.
+        """
+        first_line = 1
+        carry = b""
+        
+        with open(path, 'rb') as f:
+            while len(matches) < max_results:
+                chunk = f.read(SCAN_CHUNK_BYTES)
+                buffer = carry + chunk
+                if not chunk:
+                    FindTool._scan_literal_buffer(buffer, literal, case_sensitive, matches,
+                                                  max_results, rel_path, match_type, first_line)
+                    break
+                
+                end = len(buffer) - 1 if buffer.endswith(b"\r") else len(buffer)
+                cut = max(buffer.rfind(b"\n", 0, end), buffer.rfind(b"\r", 0, end)) + 1
+                block, carry = buffer[:cut], buffer[cut:]
+                if block:
+                    FindTool._scan_literal_buffer(block, literal, case_sensitive, matches,
+                                                  max_results, rel_path, match_type, first_line)
+                    first_line += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+    
+    @staticmethod
+    def _scan_literal_buffer(buffer: Union[bytes, mmap.mmap], literal: bytes, case_sensitive: bool,
+                             matches: List[ContentMatch], max_results: int, rel_path: str, match_type: str,
+                             first_line: int = 1):
+        """Find a literal in a bytes-like buffer, one match per line."""
+        if buffer.find(b"\r") != -1:
+            # Match the universal newline handling of text-mode line iteration
+            buffer = buffer[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        haystack = buffer if case_sensitive else buffer[:].lower()
+        line_num = first_line
+        counted = 0
+        pos = haystack.find(literal)
+        
+        while pos != -1 and len(matches) < max_results:
+            line_num += haystack[counted:pos].count(b"\n")
+            counted = pos
+            
+            start = haystack.rfind(b"\n", 0, pos) + 1
+            end = haystack.find(b"\n", pos)
+            if end == -1:
+                end = len(haystack)
+            
+            matches.append(ContentMatch(
+                file=rel_path,
+                line=line_num,
+                content=buffer[start:end].decode('utf-8').strip(),
+                match_type=match_type
+            ))
+            
+            # Only report the first match on each line
+            pos = haystack.find(literal, end + 1)
+    
+    @staticmethod
+    def _read_file(path: str, size: int) -> bytes:
+        """Read a whole file, using raw ``os.read`` calls for small files.
+        
+        Args:
+            path: File to read
+            size: Expected file size in bytes
+            
+        Returns:
+            File content
+        """
+        if size >= SMALL_FILE_MAX_BYTES:
+            with open(path, 'rb') as f:
+                return f.read()
+        
+        try:
+            fd = os.open(path, os.O_RDONLY | O_NOATIME)
         except PermissionError:
-            # Skip directories we can't read
-            pass
+            if not O_NOATIME:
+                raise
+            # O_NOATIME is only allowed on files we own
+            fd = os.open(path, os.O_RDONLY)
+        
+        try:
+            # A short read means EOF, so asking for one extra byte usually
+            # avoids a second read just to confirm it
+            chunks = [os.read(fd, size + 1)]
+            if len(chunks[0]) > size:
+                while True:
+                    chunk = os.read(fd, SMALL_FILE_MAX_BYTES)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _scan_regex(path: str, size: int, line_regex: re.Pattern, buffer_regex: re.Pattern,
+                    matches: List[ContentMatch], max_results: int, rel_path: str,
+                    match_type: str = "regex"):
+        """Run a regex over a whole decoded file, one match per line.
+        
+        Line-by-line semantics are kept: a hit that spans lines is only
+        reported if ``line_regex`` also matches its first line.
+        
+        Args:
+            path: File to scan
+            size: File size in bytes
+            line_regex: Regex as matched against a single line
+            buffer_regex: Same regex compiled with ``re.MULTILINE``
+            matches: List to append matches to
+            max_results: Maximum number of matches to collect
+            rel_path: Path reported in each match
+            match_type: Match type reported in each match
+        """
+        text = FindTool._read_file(path, size).decode('utf-8')
+        if '\r' in text:
+            # Match the universal newline handling of text-mode line iteration
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        
+        line_num = 1
+        counted = 0
+        pos = 0
+        
+        while len(matches) < max_results:
+            match = buffer_regex.search(text, pos)
+            # An empty match after the final newline (or in an empty file) is not on any line
+            if match is None or (match.start() == len(text) and text[-1:] in ('', '\n')):
+                break
+            
+            start = text.rfind('\n', 0, match.start()) + 1
+            end = text.find('\n', match.start())
+            end = len(text) if end == -1 else end + 1
+            line = text[start:end]
+            
+            if match.end() <= end or line_regex.search(line):
+                line_num += text.count('\n', counted, start)
+                counted = start
+                matches.append(ContentMatch(
+                    file=rel_path,
+                    line=line_num,
+                    content=line.strip(),
+                    match_type=match_type
+                ))
+            
+            if end >= len(text):
+                break
+            pos = end
+    
+    def _hyperscan_database(self, expressions: List[str], case_sensitive: bool) -> Any:
+        """Get a compiled Hyperscan database for several expressions.
+        
+        Args:
+            expressions: Regex expressions to match simultaneously
+            case_sensitive: Whether matching is case sensitive
+            
+        Returns:
+            Compiled database, or None if Hyperscan is unavailable or
+            cannot compile the expressions
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        key = (tuple(expressions), case_sensitive)
+        if key not in self._hs_databases:
+            flags = (hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST
+                     | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+            if not case_sensitive:
+                flags |= hyperscan.HS_FLAG_CASELESS
+            
+            database = hyperscan.Database()
+            try:
+                database.compile(
+                    expressions=[e.encode('utf-8') for e in expressions],
+                    ids=list(range(len(expressions))),
+                    elements=len(expressions),
+                    flags=[flags] * len(expressions)
+                )
+            except hyperscan.error:
+                # Fall back to Python regex for syntax Hyperscan doesn't support
+                database = None
+            self._hs_databases[key] = database
+        
+        return self._hs_databases[key]
+    
+    @staticmethod
+    def _scan_hyperscan(path: str, size: int, database: Any, line_regex: re.Pattern, matches: List[ContentMatch],
+                        max_results: int, rel_path: str, match_type: str):
+        """Scan a file with a Hyperscan database, one match per line.
+        
+        Hyperscan reports where matches start in a single pass over the
+        file, and each candidate line is then confirmed with ``line_regex``
+        so results match line-by-line searching.
+        
+        Args:
+            path: File to scan
+            size: File size in bytes
+            database: Compiled Hyperscan database
+            line_regex: Combined regex as matched against a single line
+            matches: List to append matches to
+            max_results: Maximum number of matches to collect
+            rel_path: Path reported in each match
+            match_type: Match type reported in each match
+        """
+        data = FindTool._read_file(path, size)
+        data.decode('utf-8')  # Skip non-UTF-8 files like the text-mode paths
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        starts = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            starts.add(start)
+        
+        database.scan(data, match_event_handler=on_match)
+        
+        offsets = sorted(starts)
+        line_num = 1
+        counted = 0
+        index = 0
+        
+        while index < len(offsets):
+            start = offsets[index]
+            # An empty match after the final newline (or in an empty file) is not on any line
+            if start == len(data) and data[-1:] in (b'', b'\n'):
+                break
+            
+            line_start = data.rfind(b'\n', 0, start) + 1
+            line_end = data.find(b'\n', start)
+            line_end = len(data) if line_end == -1 else line_end + 1
+            # Skip the remaining offsets on this line in one step
+            if line_end >= len(data):
+                index = len(offsets)
+            else:
+                index = bisect.bisect_left(offsets, line_end, index + 1)
+            
+            line = data[line_start:line_end].decode('utf-8')
+            if not line_regex.search(line):
+                continue
+            
+            line_num += data.count(b'\n', counted, line_start)
+            counted = line_start
+            matches.append(ContentMatch(
+                file=rel_path,
+                line=line_num,
+                content=line.strip(),
+                match_type=match_type
+            ))
+            
+            if len(matches) >= max_results:
+                break
+    
+    def _descend_filter(self, include_hidden: bool,
+                        skip_dirs: Optional[Iterable[str]] = None) -> Callable[[os.DirEntry], bool]:
+        """Build the predicate deciding which directories a walk enters.
+        
+        Args:
+            include_hidden: Whether to enter hidden directories
+            skip_dirs: Directory names never entered, or None for SKIP_DIRS
+            
+        Returns:
+            Predicate taking a directory entry
+        """
+        skip = self.SKIP_DIRS if skip_dirs is None else frozenset(skip_dirs)
+        if include_hidden:
+            return lambda entry: entry.name not in skip
+        return lambda entry: entry.name not in skip and not entry.name.startswith('.')
     
     def _find_function(self, context: ExecutionContext, **kwargs) -> ToolResult:
         """Find function definitions in code files."""
         function_name = kwargs["function_name"]
         language = kwargs.get("language", "auto")
         directory = kwargs.get("directory", ".")
+        skip_dirs = kwargs.get("skip_dirs")
         
         # Language-specific function patterns
         patterns = {
@@ -317,32 +964,53 @@ class FindTool(Tool):
             ]
         }
         
+        # Python files are searched through their parsed definitions instead
+        use_python_ast = language in ("auto", "python")
+        patterns.pop("python")
+        
         if language == "auto":
             # Use all patterns
             search_patterns = []
             for lang_patterns in patterns.values():
                 search_patterns.extend(lang_patterns)
+        elif language == "python":
+            search_patterns = []
         else:
             search_patterns = patterns.get(language, [rf"{re.escape(function_name)}"])
         
+        file_types = FUNCTION_FILE_TYPES if use_python_ast else ["*.py"] + FUNCTION_FILE_TYPES
+        
         try:
+            workspace, search_dir, error = self._validate_path(context, directory)
+            if error:
+                return ToolResult(
+                    success=False,
+                    data=None,
+                    error=error
+                )
+            
             matches = []
-            search_dir = Path(context.working_directory) / directory
+            if use_python_ast:
+                matches.extend(itertools.islice(
+                    self._iter_python_definitions(search_dir, workspace, function_name, skip_dirs), 50
+                ))
             
             for pattern_str in search_patterns:
-                pattern = re.compile(pattern_str, re.IGNORECASE)
-                result = self._search_content_recursive(
-                    search_dir, pattern, ["*.py", "*.js", "*.java", "*.c", "*.cpp", "*.h"],
-                    matches, 50, False, True, context.working_directory
+                pattern = _compile_regex(pattern_str, re.IGNORECASE)
+                self._search_content_recursive(
+                    search_dir, pattern, file_types,
+                    matches, 50, False, True, workspace,
+                    skip_dirs=skip_dirs
                 )
             
             return ToolResult(
                 success=True,
-                data=matches,
+                data=[match._asdict() for match in matches],
                 metadata={
                     "function_name": function_name,
                     "language": language,
-                    "patterns_used": search_patterns
+                    "patterns_used": search_patterns,
+                    "python_ast": use_python_ast
                 }
             )
             
@@ -353,6 +1021,83 @@ class FindTool(Tool):
                 error=f"Error finding function: {str(e)}"
             )
     
+    def _iter_python_definitions(self, search_dir: str, workspace: str, name: str,
+                                 skip_dirs: Optional[Iterable[str]] = None) -> Iterator[ContentMatch]:
+        """Yield functions and classes with a given name from Python files.
+        
+        Args:
+            search_dir: Resolved directory to search
+            workspace: Resolved working directory results are relative to
+            name: Definition name, matched case-insensitively
+            skip_dirs: Directory names not to descend into, or None for SKIP_DIRS
+            
+        Returns:
+            Iterator of matches
+        """
+        prefix = os.path.join(workspace, "")
+        key = name.lower()
+        
+        def visit(path: str, entry: os.DirEntry) -> List[ContentMatch]:
+            if not entry.name.endswith(".py") or not entry.is_file():
+                return []
+            
+            try:
+                definitions = self._python_definitions(path, entry.stat())
+            except (UnicodeDecodeError, PermissionError):
+                # Skip binary files or files we can't read
+                return []
+            
+            rel_path = self._relative_path(path, prefix)
+            return [ContentMatch(
+                file=rel_path,
+                line=line_num,
+                content=content,
+                match_type="ast"
+            ) for line_num, content in definitions.get(key, ())]
+        
+        return self._iter_walk(search_dir, visit, descend=self._descend_filter(False, skip_dirs))
+    
+    def _python_definitions(self, path: str,
+                            stat: os.stat_result) -> Dict[str, List[Tuple[int, str]]]:
+        """Get the functions and classes defined in a Python file.
+        
+        The file is parsed with ``ast``, or matched line by line if it has
+        syntax errors, and the result is cached until its mtime or size
+        changes.
+        
+        Args:
+            path: Python file path
+            stat: Current stat result for the file
+            
+        Returns:
+            Mapping of lowercased names to sorted (line, content) pairs
+        """
+        cached = self._definition_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        source = self._read_file(path, stat.st_size).decode('utf-8')
+        # Split on the same line endings the parser counts
+        lines = source.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        
+        line_numbers: Dict[str, List[int]] = {}
+        try:
+            for node in ast.walk(ast.parse(source, filename=path)):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    line_numbers.setdefault(node.name.lower(), []).append(node.lineno)
+        except (SyntaxError, ValueError, RecursionError):
+            for line_num, line in enumerate(lines, 1):
+                match = PYTHON_DEFINITION_RE.match(line)
+                if match:
+                    line_numbers.setdefault(match.group(1).lower(), []).append(line_num)
+        
+        definitions = {
+            name: [(line_num, lines[line_num - 1].strip()) for line_num in sorted(numbers)]
+            for name, numbers in line_numbers.items()
+        }
+        self._definition_cache[path] = (stat.st_mtime_ns, stat.st_size, definitions)
+        return definitions
+    
     def _grep_recursive(self, context: ExecutionContext, **kwargs) -> ToolResult:
         """Grep-like recursive search."""
         pattern = kwargs["pattern"]
@@ -366,7 +1111,8 @@ class FindTool(Tool):
             directory=directory,
             file_types=file_types,
             max_results=max_results,
-            use_regex=True
+            use_regex=True,
+            skip_dirs=kwargs.get("skip_dirs")
         )
     
     def _find_by_size(self, context: ExecutionContext, **kwargs) -> ToolResult:
@@ -374,29 +1120,34 @@ class FindTool(Tool):
         min_size = kwargs.get("min_size", 0)
         max_size = kwargs.get("max_size", float('inf'))
         directory = kwargs.get("directory", ".")
+        skip_dirs = kwargs.get("skip_dirs")
         
         try:
-            search_dir = Path(context.working_directory) / directory
-            search_dir = search_dir.resolve()
-            
-            if not str(search_dir).startswith(str(context.working_directory.resolve())):
+            # Security check
+            workspace, search_dir, error = self._validate_path(context, directory)
+            if error:
                 return ToolResult(
                     success=False,
                     data=None,
-                    error="Search directory outside working directory"
+                    error=error
                 )
             
-            matches = []
-            for item in search_dir.rglob("*"):
-                if item.is_file():
-                    size = item.stat().st_size
-                    if min_size <= size <= max_size:
-                        rel_path = item.relative_to(context.working_directory)
-                        matches.append({
-                            "path": str(rel_path),
-                            "size": size,
-                            "modified": item.stat().st_mtime
-                        })
+            prefix = os.path.join(workspace, "")
+            
+            def visit(path: str, entry: os.DirEntry) -> List[Dict]:
+                if not entry.is_file():
+                    return []
+                stat = entry.stat()
+                if not min_size <= stat.st_size <= max_size:
+                    return []
+                return [{
+                    "path": self._relative_path(path, prefix),
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime
+                }]
+            
+            matches = list(self._iter_walk(search_dir, visit, descend=self._descend_filter(True, skip_dirs),
+                                           parallel=kwargs.get("parallel")))
             
             return ToolResult(
                 success=True,
@@ -420,30 +1171,36 @@ class FindTool(Tool):
         min_date = kwargs.get("min_date")  # Unix timestamp
         max_date = kwargs.get("max_date")  # Unix timestamp
         directory = kwargs.get("directory", ".")
+        skip_dirs = kwargs.get("skip_dirs")
         
         try:
-            search_dir = Path(context.working_directory) / directory
-            search_dir = search_dir.resolve()
-            
-            if not str(search_dir).startswith(str(context.working_directory.resolve())):
+            # Security check
+            workspace, search_dir, error = self._validate_path(context, directory)
+            if error:
                 return ToolResult(
                     success=False,
                     data=None,
-                    error="Search directory outside working directory"
+                    error=error
                 )
             
-            matches = []
-            for item in search_dir.rglob("*"):
-                if item.is_file():
-                    mtime = item.stat().st_mtime
-                    if (min_date is None or mtime >= min_date) and \
-                       (max_date is None or mtime <= max_date):
-                        rel_path = item.relative_to(context.working_directory)
-                        matches.append({
-                            "path": str(rel_path),
-                            "size": item.stat().st_size,
-                            "modified": mtime
-                        })
+            prefix = os.path.join(workspace, "")
+            
+            def visit(path: str, entry: os.DirEntry) -> List[Dict]:
+                if not entry.is_file():
+                    return []
+                stat = entry.stat()
+                mtime = stat.st_mtime
+                if not ((min_date is None or mtime >= min_date) and
+                        (max_date is None or mtime <= max_date)):
+                    return []
+                return [{
+                    "path": self._relative_path(path, prefix),
+                    "size": stat.st_size,
+                    "modified": mtime
+                }]
+            
+            matches = list(self._iter_walk(search_dir, visit, descend=self._descend_filter(True, skip_dirs),
+                                           parallel=kwargs.get("parallel")))
             
             return ToolResult(
                 success=True,
@@ -469,17 +1226,23 @@ class FindTool(Tool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["find_files", "search_content", "find_function", "grep_recursive", "find_by_size", "find_by_date"],
+                    "enum": list(ACTION_REQUIRED_PARAMS),
                     "description": "Type of search to perform"
                 },
                 "pattern": {
-                    "type": "string",
-                    "description": "Search pattern (for find_files, grep_recursive)"
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "Search pattern (for find_files, grep_recursive); find_files also accepts a list of glob patterns"
                 },
                 "query": {
                     "type": "string",
                     "description": "Search query (for search_content)"
                 },
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Several search queries matched in one pass (for search_content)"
+                },
                 "function_name": {
                     "type": "string",
                     "description": "Function name to find (for find_function)"
@@ -489,6 +1252,10 @@ class FindTool(Tool):
                     "description": "Directory to search in (default: current)",
                     "default": "."
                 },
+                "path": {
+                    "type": "string",
+                    "description": "Alias for directory"
+                },
                 "file_types": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -497,7 +1264,7 @@ class FindTool(Tool):
                 },
                 "max_results": {
                     "type": "integer",
-                    "description": "Maximum number of results",
+                    "description": f"Maximum number of results (default: 100, or {FIND_FILES_MAX_RESULTS} for find_files)",
                     "default": 100
                 },
                 "max_depth": {
@@ -515,6 +1282,15 @@ class FindTool(Tool):
                     "description": "Use regex patterns",
                     "default": False
                 },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Search subdirectories on a thread pool (default: only for large directories)"
+                },
+                "skip_dirs": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Directory names not to descend into (default: __pycache__, node_modules, .git, .venv)"
+                },
                 "language": {
                     "type": "string",
                     "description": "Programming language (for find_function)",
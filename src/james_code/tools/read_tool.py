@@ -1,13 +1,34 @@
 """READ tool for file system operations."""
 
 import os
+import re
 import json
+import mmap
+import stat
+import functools
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from ..core.base import Tool, ToolResult, ExecutionContext
 
 
+# Actions accepted by ReadTool; each requires a path
+READ_ACTIONS = frozenset({"read_file", "list_directory", "file_exists", "get_file_info"})
+
+# Files at least this large are decoded straight from a memory map
+MMAP_MIN_BYTES = 64 * 1024
+
+# Drive-letter and UNC paths, and ".." next to a backslash, which are
+# Windows escapes that realpath would treat as plain names on POSIX
+PATH_TRAVERSAL_RE = re.compile(r"^[A-Za-z]:|^\\\\|\.\.\\|\\\.\.(?:[\\/]|$)")
+
+
+@functools.lru_cache(maxsize=64)
+def _workspace_realpath(working_directory: str) -> str:
+    """Resolve an absolute working directory, reusing the result across calls."""
+    return os.path.realpath(working_directory)
+
+
 class ReadTool(Tool):
     """Tool for reading files and directories."""
     
@@ -22,7 +43,7 @@ class ReadTool(Tool):
         action = kwargs.get("action")
         path = kwargs.get("path")
         
-        if not action or action not in ["read_file", "list_directory", "file_exists", "get_file_info"]:
+        if not isinstance(action, str) or action not in READ_ACTIONS:
             return False
         
         if not path:
@@ -42,13 +63,17 @@ class ReadTool(Tool):
         action = kwargs["action"]
         path = kwargs["path"]
         
+        if PATH_TRAVERSAL_RE.search(str(path)):
+            return ToolResult(
+                success=False,
+                data=None,
+                error="Path outside working directory not allowed"
+            )
+        
         try:
-            # Convert to absolute path relative to working directory
-            target_path = Path(context.working_directory) / path
-            target_path = target_path.resolve()
-            
             # Security check: ensure path is within working directory
-            if not str(target_path).startswith(str(context.working_directory.resolve())):
+            target_path = self._resolve_target(context, str(path))
+            if target_path is None:
                 return ToolResult(
                     success=False,
                     data=None,
@@ -71,17 +96,52 @@ class ReadTool(Tool):
                 error=f"Error executing read tool: {str(e)}"
             )
     
+    @staticmethod
+    def _resolve_target(context: ExecutionContext, path: str) -> Optional[Path]:
+        """Resolve a relative path against the working directory.
+        
+        A single name other than ``..`` that ``lstat`` shows is not a
+        symlink cannot leave the workspace and is used as is. Anything
+        else, including absolute paths and ``..`` components, is resolved
+        and checked for containment.
+        
+        Args:
+            context: Execution context holding the working directory
+            path: Absolute path, or path relative to the working directory
+            
+        Returns:
+            Absolute target path, or None if it lies outside the workspace
+        """
+        workspace = _workspace_realpath(os.path.abspath(context.working_directory))
+        candidate = os.path.join(workspace, path)
+        
+        if path != ".." and os.sep not in path and (os.altsep is None or os.altsep not in path):
+            try:
+                if not stat.S_ISLNK(os.lstat(candidate).st_mode):
+                    return Path(candidate)
+            except FileNotFoundError:
+                return Path(candidate)
+            except OSError:
+                pass
+        
+        target = os.path.realpath(candidate)
+        if os.path.commonpath([target, workspace]) != workspace:
+            return None
+        return Path(target)
+    
     def _read_file(self, path: Path) -> ToolResult:
         """Read contents of a file."""
         try:
-            if not path.exists():
+            try:
+                file_stat = path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 return ToolResult(
                     success=False,
                     data=None,
                     error=f"File does not exist: {path}"
                 )
             
-            if not path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 return ToolResult(
                     success=False,
                     data=None,
@@ -89,20 +149,28 @@ class ReadTool(Tool):
                 )
             
             # Check file size (limit to 10MB)
-            if path.stat().st_size > 10 * 1024 * 1024:
+            if file_stat.st_size > 10 * 1024 * 1024:
                 return ToolResult(
                     success=False,
                     data=None,
                     error="File too large (>10MB)"
                 )
             
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if file_stat.st_size >= MMAP_MIN_BYTES:
+                # Decode from the mapping without an intermediate bytes copy
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, 'utf-8')
+                if '\r' in content:
+                    # Match the universal newline handling of text-mode reads
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             return ToolResult(
                 success=True,
                 data=content,
-                metadata={"file_size": path.stat().st_size}
+                metadata={"file_size": file_stat.st_size}
             )
             
         except UnicodeDecodeError:
@@ -115,28 +183,22 @@ class ReadTool(Tool):
     def _list_directory(self, path: Path) -> ToolResult:
         """List contents of a directory."""
         try:
-            if not path.exists():
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error=f"Directory does not exist: {path}"
-                )
-            
-            if not path.is_dir():
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error=f"Path is not a directory: {path}"
-                )
-            
+            # DirEntry reuses the type from the directory listing and caches stat()
             items = []
-            for item in path.iterdir():
-                items.append({
-                    "name": item.name,
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None,
-                    "modified": item.stat().st_mtime
-                })
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        entry_stat = entry.stat()
+                    except FileNotFoundError:
+                        # Dangling symlink: report the link itself
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    is_file = entry.is_file()
+                    items.append({
+                        "name": entry.name,
+                        "type": "directory" if entry.is_dir() else "file",
+                        "size": entry_stat.st_size if is_file else None,
+                        "modified": entry_stat.st_mtime
+                    })
             
             return ToolResult(
                 success=True,
@@ -144,6 +206,18 @@ class ReadTool(Tool):
                 metadata={"item_count": len(items)}
             )
             
+        except FileNotFoundError:
+            return ToolResult(
+                success=False,
+                data=None,
+                error=f"Directory does not exist: {path}"
+            )
+        except NotADirectoryError:
+            return ToolResult(
+                success=False,
+                data=None,
+                error=f"Path is not a directory: {path}"
+            )
         except PermissionError:
             return ToolResult(
                 success=False,
@@ -199,7 +273,7 @@ class ReadTool(Tool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["read_file", "list_directory", "file_exists", "get_file_info"],
+                    "enum": sorted(READ_ACTIONS),
                     "description": "Action to perform"
                 },
                 "path": {
@@ -1,12 +1,74 @@
 """Pytest configuration and fixtures for James Code tests."""
 
+import os
 import pytest
+import shutil
 import tempfile
+import time
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List, Tuple
 
 from james_code import Agent, AgentConfig
-from james_code.safety import SafetyConfig
+from james_code.safety import SafetyConfig, SafetyManager
+
+from tests.fixtures.security_vectors import get_path_traversal_vectors
+
+# Shared fixtures defined next to the mocks they build
+pytest_plugins = ["tests.mocks.llm_mock"]
+
+
+# tmpfs used for pytest's temporary directories when it has this much free space
+TMPFS_ROOT = "/dev/shm"
+TMPFS_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+# Set by pytest_configure when it exported PYTEST_DEBUG_TEMPROOT itself
+TEMPROOT_EXPORTED = pytest.StashKey[bool]()
+
+# Files created by the sample_files fixture, keyed by workspace-relative path
+SAMPLE_FILES = {
+    "hello.py": "def hello():\n    print('Hello, World!')\n",
+    "config.json": '{"setting": "value", "debug": true}',
+    "readme.txt": "This is a sample readme file.\nIt has multiple lines.\n",
+    "empty.txt": "",
+    "subdir/nested.py": "# Nested file\nprint('nested')\n",
+}
+
+# pytest-benchmark options that ask for timings to be collected
+BENCHMARK_RUN_OPTIONS = ("benchmark_only", "benchmark_autosave", "benchmark_save", "benchmark_json")
+
+
+def pytest_configure(config):
+    """Put tmp_path and tmp_path_factory directories on tmpfs when available.
+    
+    Only applies when neither ``--basetemp`` nor ``PYTEST_DEBUG_TEMPROOT`` is
+    set, and skips small tmpfs mounts such as Docker's default 64MB /dev/shm.
+    The variable is removed again in ``pytest_unconfigure``.
+    """
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if not (os.path.isdir(TMPFS_ROOT) and os.access(TMPFS_ROOT, os.W_OK)):
+        return
+    stats = os.statvfs(TMPFS_ROOT)
+    if stats.f_bavail * stats.f_frsize >= TMPFS_MIN_FREE_BYTES:
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = TMPFS_ROOT
+        config.stash[TEMPROOT_EXPORTED] = True
+
+
+def pytest_unconfigure(config):
+    """Drop the PYTEST_DEBUG_TEMPROOT exported by pytest_configure."""
+    if config.stash.get(TEMPROOT_EXPORTED, False):
+        os.environ.pop("PYTEST_DEBUG_TEMPROOT", None)
+
+
+def pytest_xdist_auto_num_workers(config):
+    """Resolve ``-n auto`` to a serial run when benchmarks are requested.
+    
+    pytest-benchmark disables itself while xdist distributes tests, so with
+    ``-n auto`` in addopts ``pytest --benchmark-only`` would measure nothing.
+    """
+    if any(config.getoption(name, None) for name in BENCHMARK_RUN_OPTIONS):
+        return 0
+    return None
 
 
 @pytest.fixture
@@ -16,6 +78,51 @@ def temp_workspace() -> Generator[Path, None, None]:
         yield Path(temp_dir)
 
 
+@pytest.fixture(scope="class")
+def class_tmp_path(request, tmp_path_factory) -> Path:
+    """Temporary directory shared by all tests of a class.
+    
+    For classes whose tests only read from their workspace; tests that
+    write to it should keep using ``tmp_path``.
+    """
+    return tmp_path_factory.mktemp(request.node.name)
+
+
+@pytest.fixture(scope="session")
+def path_traversal_vectors() -> Tuple[str, ...]:
+    """Path traversal attack patterns, loaded once per session."""
+    return get_path_traversal_vectors()
+
+
+@pytest.fixture(scope="session")
+def shared_project_root(tmp_path_factory) -> Path:
+    """Create a small read-only project skeleton once per session."""
+    root = tmp_path_factory.mktemp("complex_codebase")
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text('def main():\n    print("Hello World")\n')
+    return root
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> List[float]:
+    """Replace wall-clock reads and sleeps with a manually advanced clock.
+    
+    ``time.time``, ``time.monotonic`` and ``time.monotonic_ns`` all read the
+    returned one-element list, and ``time.sleep`` advances it instead of
+    blocking, so timing logic is exercised without real waits.
+    """
+    now = [1000.0]
+    
+    def sleep(seconds: float):
+        now[0] += seconds
+    
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(time, "monotonic_ns", lambda: int(now[0] * 1_000_000_000))
+    monkeypatch.setattr(time, "sleep", sleep)
+    return now
+
+
 @pytest.fixture
 def safe_config(temp_workspace: Path) -> SafetyConfig:
     """Create a safe configuration for testing."""
@@ -28,6 +135,19 @@ def safe_config(temp_workspace: Path) -> SafetyConfig:
     )
 
 
+@pytest.fixture
+def safety_manager(temp_workspace: Path) -> SafetyManager:
+    """Provide a permissive SafetyManager for the test workspace, with audit logging disabled.
+    
+    Tests that change the manager's policy should build their own instance.
+    """
+    return SafetyManager(SafetyConfig(
+        base_directory=str(temp_workspace),
+        enable_audit_logging=False,  # Disable for tests
+        strict_mode=False
+    ))
+
+
 @pytest.fixture
 def agent_config(temp_workspace: Path, safe_config: SafetyConfig) -> AgentConfig:
     """Create an agent configuration for testing."""
@@ -45,28 +165,19 @@ def agent(agent_config: AgentConfig) -> Agent:
     return Agent(agent_config)
 
 
-@pytest.fixture
-def sample_files(temp_workspace: Path) -> dict:
-    """Create sample files for testing."""
-    files = {
-        "hello.py": "def hello():\n    print('Hello, World!')\n",
-        "config.json": '{"setting": "value", "debug": true}',
-        "readme.txt": "This is a sample readme file.\nIt has multiple lines.\n",
-        "empty.txt": "",
-    }
-    
-    created_files = {}
-    for filename, content in files.items():
-        file_path = temp_workspace / filename
+@pytest.fixture(scope="session")
+def sample_files_template(tmp_path_factory) -> Path:
+    """Write the sample files once per session for sample_files to copy."""
+    root = tmp_path_factory.mktemp("sample_files")
+    for relative_path, content in SAMPLE_FILES.items():
+        file_path = root / relative_path
+        file_path.parent.mkdir(exist_ok=True)
         file_path.write_text(content, encoding='utf-8')
-        created_files[filename] = file_path
-    
-    # Create a subdirectory with files
-    subdir = temp_workspace / "subdir"
-    subdir.mkdir()
-    
-    sub_file = subdir / "nested.py"
-    sub_file.write_text("# Nested file\nprint('nested')\n", encoding='utf-8')
-    created_files["subdir/nested.py"] = sub_file
-    
-    return created_files
\ No newline at end of file
+    return root
+
+
+@pytest.fixture
+def sample_files(temp_workspace: Path, sample_files_template: Path) -> dict:
+    """Create sample files for testing by copying the session template."""
+    shutil.copytree(sample_files_template, temp_workspace, dirs_exist_ok=True)
+    return {relative_path: temp_workspace / relative_path for relative_path in SAMPLE_FILES}
@@ -2,17 +2,21 @@
 
 import pytest
 import base64
+import functools
 import urllib.parse
-from typing import Dict, List, Any
+from typing import Dict, List, Tuple, Any
 from pathlib import Path
 
 
-@pytest.fixture
-def security_vectors() -> Dict[str, List[str]]:
+@pytest.fixture(scope="session")
+def security_vectors() -> Dict[str, Tuple[str, ...]]:
     """Comprehensive security attack vectors for testing.
     
+    The vector loaders return tuples, so the same immutable sequences are
+    shared by every test in the session.
+    
     Returns:
-        Dict mapping attack types to lists of attack patterns
+        Dict mapping attack types to tuples of attack patterns
     """
     return {
         'path_traversal': get_path_traversal_vectors(),
@@ -26,9 +30,10 @@ def security_vectors() -> Dict[str, List[str]]:
     }
 
 
-def get_path_traversal_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_path_traversal_vectors() -> Tuple[str, ...]:
     """Path traversal attack patterns."""
-    return [
+    return (
         # Basic path traversal
         "../../../etc/passwd",
         "..\\..\\..\\windows\\system32\\config\\sam",
@@ -99,12 +104,13 @@ def get_path_traversal_vectors() -> List[str]:
         # Symlink traversal
         "../../../tmp/symlink_to_passwd",
         "..\\..\\..\\temp\\symlink_to_sam",
-    ]
+    )
 
 
-def get_command_injection_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_command_injection_vectors() -> Tuple[str, ...]:
     """Command injection attack patterns."""
-    return [
+    return (
         # Basic command injection
         "ls; rm -rf /",
         "dir && del /Q /S C:\\*",
@@ -217,12 +223,13 @@ def get_command_injection_vectors() -> List[str]:
         "ls; WhOaMi",
         "ls; WHOAMI",
         "ls; wHoAmI",
-    ]
+    )
 
 
-def get_file_permission_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_file_permission_vectors() -> Tuple[str, ...]:
     """File permission bypass attack patterns."""
-    return [
+    return (
         # Setuid/setgid exploitation
         "/usr/bin/sudo",
         "/bin/su",
@@ -314,16 +321,12 @@ def get_file_permission_vectors() -> List[str]:
         # Memory mapped files
         "/tmp/mmap_file",
         "/dev/shm/shared_memory",
-    ]
+    )
 
 
-def get_resource_exhaustion_vectors() -> List[str]:
+def get_resource_exhaustion_vectors() -> Tuple[str, ...]:
     """Resource exhaustion attack patterns."""
-    return [
-        # Large file creation
-        "A" * 1024 * 1024 * 100,  # 100MB string
-        "B" * 1024 * 1024 * 500,  # 500MB string
-        
+    return (
         # Infinite loops in filenames
         "../" * 10000,
         "..\\" * 10000,
@@ -385,12 +388,13 @@ def get_resource_exhaustion_vectors() -> List[str]:
         
         # Disk space exhaustion
         "disk_fill_" + "large_file_" * 1000,
-    ]
+    )
 
 
-def get_unicode_attack_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_unicode_attack_vectors() -> Tuple[str, ...]:
     """Unicode-based attack patterns."""
-    return [
+    return (
         # Right-to-left override
         "file\u202Etxt.exe",
         "safe\u202Exe.txt",
@@ -481,12 +485,13 @@ def get_unicode_attack_vectors() -> List[str]:
         # Mathematical alphanumeric symbols
         "file\U0001D400.txt",  # Mathematical bold A
         "file\U0001D468.txt",  # Mathematical bold italic A
-    ]
+    )
 
 
-def get_encoding_attack_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_encoding_attack_vectors() -> Tuple[str, ...]:
     """Encoding-based attack patterns."""
-    return [
+    return (
         # URL encoding variations
         "%2e%2e%2f",      # ../
         "%2e%2e%5c",      # ..\
@@ -612,12 +617,13 @@ def get_encoding_attack_vectors() -> List[str]:
         
         # Tilde encoding
         "%7e",  # ~
-    ]
+    )
 
 
-def get_filename_attack_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_filename_attack_vectors() -> Tuple[str, ...]:
     """Filename-based attack patterns."""
-    return [
+    return (
         # Reserved Windows names
         "CON",
         "PRN", 
@@ -779,12 +785,13 @@ def get_filename_attack_vectors() -> List[str]:
         "file.txt.",      # Windows trailing dot
         "file.txt ",      # Windows trailing space
         "file.txt\t",     # Windows trailing tab
-    ]
+    )
 
 
-def get_content_attack_vectors() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_content_attack_vectors() -> Tuple[str, ...]:
     """Content-based attack patterns."""
-    return [
+    return (
         # Script injection
         "<script>alert('xss')</script>",
         "<script src='http://evil.com/script.js'></script>",
@@ -915,7 +922,7 @@ def get_content_attack_vectors() -> List[str]:
         
         # Response splitting
         "test\r\nHTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n<script>alert('xss')</script>",
-    ]
+    )
 
 
 @pytest.fixture
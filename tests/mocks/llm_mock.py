@@ -1,11 +1,12 @@
 """LLM mocking infrastructure for deterministic testing."""
 
+import copy
+import functools
 import json
 import re
 import time
-import hashlib
-from typing import Dict, List, Any, Optional, Union, Callable
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Union, Callable, Iterable, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import threading
 import random
@@ -13,6 +14,61 @@ import random
 import pytest
 
 
+# Regex flags that can be scoped to one alternative of the combined dispatch pattern
+_INLINE_FLAGS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+# Numbered or named backreferences and conditional groups change meaning
+# once patterns are combined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+@functools.lru_cache(maxsize=4096)
+def _default_response_fields(prompt: str) -> tuple:
+    """Compute the parts of the default response that depend only on the prompt.
+    
+    The result is cached and shared, so callers must copy the tool calls
+    before handing them out.
+    
+    Args:
+        prompt: User prompt
+        
+    Returns:
+        Tuple of (content, tool_calls, input_tokens, output_tokens)
+    """
+    # Simple pattern matching for common operations
+    prompt_lower = prompt.lower()
+    
+    if "read" in prompt_lower and "file" in prompt_lower:
+        content = 'I need to read a file. Let me use the read tool.'
+        tool_calls = ({
+            "name": "read",
+            "parameters": {"action": "read_file", "path": "example.txt"}
+        },)
+    elif "write" in prompt_lower and "file" in prompt_lower:
+        content = 'I need to write to a file. Let me use the write tool.'
+        tool_calls = ({
+            "name": "write", 
+            "parameters": {"action": "write_file", "path": "output.txt", "content": "Hello"}
+        },)
+    elif "execute" in prompt_lower or "run" in prompt_lower:
+        content = 'I need to execute a command. Let me use the execute tool.'
+        tool_calls = ({
+            "name": "execute",
+            "parameters": {"command": "echo Hello"}
+        },)
+    else:
+        content = f'I understand you want me to help with: {prompt[:100]}...'
+        tool_calls = ()
+    
+    return content, tool_calls, len(prompt.split()), len(content.split())
+
+
 class LLMErrorType(Enum):
     """Types of LLM errors to simulate."""
     NETWORK_ERROR = "network_error"
@@ -26,7 +82,7 @@ class LLMErrorType(Enum):
     CONTEXT_LENGTH_EXCEEDED = "context_length_exceeded"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockLLMResponse:
     """Mock LLM response for testing."""
     content: str
@@ -38,7 +94,7 @@ class MockLLMResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponseScenario:
     """Scenario for generating mock LLM responses."""
     name: str
@@ -65,6 +121,10 @@ class MockLLMProvider:
         self.error_simulation: Optional[LLMErrorType] = None
         self.response_delay: float = 0.0
         self._lock = threading.Lock()
+        
+        # Combined scenario regex and the scenario patterns it was built from
+        self._dispatch: Optional[re.Pattern] = None
+        self._dispatch_patterns: Optional[tuple] = None
     
     def add_scenario(self, scenario: LLMResponseScenario):
         """Add a response scenario.
@@ -72,10 +132,19 @@ class MockLLMProvider:
         Args:
             scenario: Scenario to add
         """
+        self.add_scenarios((scenario,))
+    
+    def add_scenarios(self, scenarios: Iterable[LLMResponseScenario]):
+        """Add several response scenarios, sorting and invalidating once.
+        
+        Args:
+            scenarios: Scenarios to add
+        """
         with self._lock:
-            self.scenarios.append(scenario)
+            self.scenarios.extend(scenarios)
             # Sort by priority (lower number = higher priority)
             self.scenarios.sort(key=lambda s: s.priority)
+            self._dispatch_patterns = None
     
     def add_simple_scenario(self, 
                           pattern: str, 
@@ -157,6 +226,9 @@ class MockLLMProvider:
                               context: Optional[Dict[str, Any]]) -> MockLLMResponse:
         """Find matching response scenario for prompt.
         
+        Called with ``self._lock`` held, so the combined regex is checked
+        and rebuilt under the lock.
+        
         Args:
             prompt: User prompt
             context: Optional context
@@ -164,7 +236,21 @@ class MockLLMProvider:
         Returns:
             Mock LLM response
         """
-        for scenario in self.scenarios:
+        # Scenarios can be replaced or edited in place, so compare patterns
+        # rather than relying on the mutators to invalidate the regex
+        patterns = tuple(scenario.pattern for scenario in self.scenarios)
+        if patterns != self._dispatch_patterns:
+            self._dispatch = self._build_dispatch()
+            self._dispatch_patterns = patterns
+        
+        # The combined regex yields the first scenario whose pattern matches;
+        # scanning from there only continues past it if it is disabled
+        start = 0
+        if self._dispatch is not None:
+            match = self._dispatch.match(prompt)
+            start = int(match.lastgroup[1:]) if match else len(self.scenarios)
+        
+        for scenario in self.scenarios[start:]:
             if not scenario.enabled:
                 continue
                 
@@ -184,11 +270,43 @@ class MockLLMProvider:
                 if callable(scenario.response):
                     return scenario.response(prompt)
                 else:
-                    return scenario.response
+                    return _copy_response(scenario.response)
         
         # No matching scenario found, return default
         return self._generate_default_response(prompt)
     
+    def _build_dispatch(self) -> Optional[re.Pattern]:
+        """Compile all scenario patterns into one priority-ordered regex.
+        
+        Each scenario becomes a lookahead alternative followed by an empty
+        group named after its index. Matched at position 0, the alternatives
+        are tried in priority order, so the group that matches names the same
+        scenario the linear scan would pick first.
+        
+        Returns:
+            Combined pattern, or None if the patterns cannot be combined
+        """
+        alternatives = []
+        for index, scenario in enumerate(self.scenarios):
+            pattern = scenario.pattern
+            if isinstance(pattern, str):
+                body = f"(?i:{re.escape(pattern)})"
+            else:
+                if not isinstance(pattern.pattern, str) or _BACKREFERENCE.search(pattern.pattern):
+                    return None
+                flags = "".join(letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag)
+                body = f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+            alternatives.append(f"(?=[\\s\\S]*?{body})(?P<s{index}>)")
+        
+        if not alternatives:
+            return None
+        
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            # e.g. global inline flags or duplicate group names
+            return None
+    
     def _generate_default_response(self, prompt: str) -> MockLLMResponse:
         """Generate a default response when no scenario matches.
         
@@ -198,38 +316,18 @@ class MockLLMProvider:
         Returns:
             Default mock response
         """
-        # Simple pattern matching for common operations
-        prompt_lower = prompt.lower()
-        
-        if "read" in prompt_lower and "file" in prompt_lower:
-            content = 'I need to read a file. Let me use the read tool.'
-            tool_calls = [{
-                "name": "read",
-                "parameters": {"action": "read_file", "path": "example.txt"}
-            }]
-        elif "write" in prompt_lower and "file" in prompt_lower:
-            content = 'I need to write to a file. Let me use the write tool.'
-            tool_calls = [{
-                "name": "write", 
-                "parameters": {"action": "write_file", "path": "output.txt", "content": "Hello"}
-            }]
-        elif "execute" in prompt_lower or "run" in prompt_lower:
-            content = 'I need to execute a command. Let me use the execute tool.'
-            tool_calls = [{
-                "name": "execute",
-                "parameters": {"command": "echo Hello"}
-            }]
-        else:
-            content = f'I understand you want me to help with: {prompt[:100]}...'
-            tool_calls = []
+        content, tool_calls, input_tokens, output_tokens = _default_response_fields(prompt)
         
         return MockLLMResponse(
             content=content,
-            tool_calls=tool_calls,
+            tool_calls=[
+                {"name": call["name"], "parameters": dict(call["parameters"])}
+                for call in tool_calls
+            ],
             usage={
-                "input_tokens": len(prompt.split()),
-                "output_tokens": len(content.split()),
-                "total_tokens": len(prompt.split()) + len(content.split())
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens
             },
             response_time=0.1,
             model=self.model_name,
@@ -300,6 +398,12 @@ class MockLLMProvider:
             for scenario in self.scenarios:
                 scenario.usage_count = 0
     
+    def clear_scenarios(self):
+        """Remove all response scenarios."""
+        with self._lock:
+            self.scenarios.clear()
+            self._dispatch_patterns = None
+    
     def enable_error_simulation(self, error_type: LLMErrorType):
         """Enable error simulation.
         
@@ -327,12 +431,15 @@ class DeterministicLLMProvider(MockLLMProvider):
     def __init__(self, model_name: str = "deterministic-mock"):
         """Initialize deterministic provider."""
         super().__init__(model_name)
-        self.response_cache: Dict[str, MockLLMResponse] = {}
+        self.response_cache: Dict[tuple, MockLLMResponse] = {}
     
     def generate_response(self, 
                          prompt: str, 
                          context: Optional[Dict[str, Any]] = None) -> MockLLMResponse:
-        """Generate deterministic response based on prompt hash.
+        """Generate deterministic response based on prompt and context.
+        
+        Cached responses are copied on the way out, so callers can modify
+        what they get back without affecting later calls.
         
         Args:
             prompt: User prompt
@@ -356,14 +463,14 @@ class DeterministicLLMProvider(MockLLMProvider):
                     "model": self.model_name,
                     "cached": True
                 })
-            return cached_response
+            return _copy_response(cached_response)
         
         # Generate new response and cache it
         response = super().generate_response(prompt, context)
         self.response_cache[key] = response
-        return response
+        return _copy_response(response)
     
-    def _create_cache_key(self, prompt: str, context: Optional[Dict[str, Any]]) -> str:
+    def _create_cache_key(self, prompt: str, context: Optional[Dict[str, Any]]) -> tuple:
         """Create deterministic cache key.
         
         Args:
@@ -371,14 +478,31 @@ class DeterministicLLMProvider(MockLLMProvider):
             context: Optional context
             
         Returns:
-            Cache key string
+            Cache key tuple
         """
-        # Create hash of prompt and context
-        content = prompt
-        if context:
-            content += json.dumps(context, sort_keys=True)
+        if not context:
+            return (prompt, None)
+        return (prompt, json.dumps(context, sort_keys=True))
+
+
+def _copy_response(response: MockLLMResponse) -> MockLLMResponse:
+    """Copy a response so that the copy can be modified independently.
+    
+    Args:
+        response: Response to copy
         
-        return hashlib.sha256(content.encode()).hexdigest()
+    Returns:
+        Independent copy of the response
+    """
+    return MockLLMResponse(
+        content=response.content,
+        tool_calls=copy.deepcopy(response.tool_calls),
+        usage=dict(response.usage),
+        model=response.model,
+        finish_reason=response.finish_reason,
+        response_time=response.response_time,
+        metadata=copy.deepcopy(response.metadata)
+    )
 
 
 class ErrorSimulatingLLMProvider(MockLLMProvider):
@@ -588,12 +712,12 @@ def create_mock_llm_provider(provider_type: str = "standard", **kwargs) -> MockL
 
 
 # Pre-configured scenarios for common testing patterns
-def get_code_analysis_scenarios() -> List[LLMResponseScenario]:
-    """Get scenarios for code analysis testing."""
-    scenarios = []
-    
+# Scenario templates are built once; the getters hand out fresh scenario
+# objects (usage counts and enabled flags are per provider) that share the
+# compiled patterns and responses, which should be treated as read-only.
+_CODE_ANALYSIS_SCENARIOS = (
     # File reading scenario
-    scenarios.append(LLMResponseScenario(
+    LLMResponseScenario(
         name="file_reading",
         pattern=re.compile(r"read.*file", re.IGNORECASE),
         response=MockLLMResponse(
@@ -605,10 +729,10 @@ def get_code_analysis_scenarios() -> List[LLMResponseScenario]:
             usage={"input_tokens": 20, "output_tokens": 10}
         ),
         priority=10
-    ))
+    ),
     
     # Code modification scenario
-    scenarios.append(LLMResponseScenario(
+    LLMResponseScenario(
         name="code_modification",
         pattern=re.compile(r"(modify|change|update).*code", re.IGNORECASE),
         response=MockLLMResponse(
@@ -626,17 +750,12 @@ def get_code_analysis_scenarios() -> List[LLMResponseScenario]:
             usage={"input_tokens": 30, "output_tokens": 15}
         ),
         priority=20
-    ))
-    
-    return scenarios
+    ),
+)
 
-
-def get_security_testing_scenarios() -> List[LLMResponseScenario]:
-    """Get scenarios for security testing."""
-    scenarios = []
-    
+_SECURITY_TESTING_SCENARIOS = (
     # Security violation detection
-    scenarios.append(LLMResponseScenario(
+    LLMResponseScenario(
         name="security_violation",
         pattern=re.compile(r"(\.\.\/|\/etc\/|rm -rf|sudo)", re.IGNORECASE),
         response=MockLLMResponse(
@@ -646,9 +765,18 @@ def get_security_testing_scenarios() -> List[LLMResponseScenario]:
             finish_reason="content_filter"
         ),
         priority=1  # Highest priority
-    ))
-    
-    return scenarios
+    ),
+)
+
+
+def get_code_analysis_scenarios() -> Tuple[LLMResponseScenario, ...]:
+    """Get scenarios for code analysis testing."""
+    return tuple(replace(scenario) for scenario in _CODE_ANALYSIS_SCENARIOS)
+
+
+def get_security_testing_scenarios() -> Tuple[LLMResponseScenario, ...]:
+    """Get scenarios for security testing."""
+    return tuple(replace(scenario) for scenario in _SECURITY_TESTING_SCENARIOS)
 
 
 @pytest.fixture
@@ -667,14 +795,37 @@ def deterministic_llm_provider():
     provider.reset()
 
 
+@pytest.fixture(scope="class")
+def shared_llm_provider_pool():
+    """Provide one set of mock LLM providers shared by a test class."""
+    return {
+        "basic": MockLLMProvider("test-model"),
+        "deterministic": DeterministicLLMProvider("deterministic"),
+        "error": ErrorSimulatingLLMProvider("error-test"),
+    }
+
+
+@pytest.fixture
+def llm_provider_pool(shared_llm_provider_pool):
+    """Provide the shared provider pool, returned to a clean state after each test."""
+    yield shared_llm_provider_pool
+    for provider in shared_llm_provider_pool.values():
+        provider.reset()
+        provider.clear_scenarios()
+        provider.disable_error_simulation()
+        provider.set_response_delay(0.0)
+    shared_llm_provider_pool["deterministic"].response_cache.clear()
+    shared_llm_provider_pool["error"].set_error_probability(0.0)
+    shared_llm_provider_pool["error"].set_error_sequence([])
+
+
 @pytest.fixture
 def code_analysis_llm_provider():
     """Provide an LLM provider configured for code analysis testing."""
     provider = MockLLMProvider("code-analysis-mock")
     
     # Add code analysis scenarios
-    for scenario in get_code_analysis_scenarios():
-        provider.add_scenario(scenario)
+    provider.add_scenarios(get_code_analysis_scenarios())
     
     yield provider
     provider.reset()
@@ -686,8 +837,7 @@ def security_aware_llm_provider():
     provider = MockLLMProvider("security-aware-mock")
     
     # Add security scenarios
-    for scenario in get_security_testing_scenarios():
-        provider.add_scenario(scenario)
+    provider.add_scenarios(get_security_testing_scenarios())
     
     yield provider
     provider.reset()
\ No newline at end of file
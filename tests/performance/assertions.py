@@ -1,7 +1,7 @@
 """Performance assertion utilities for James Code testing."""
 
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, BinaryIO
 from pathlib import Path
 import json
 
@@ -62,14 +62,16 @@ def assert_performance_within_limits(result: Union[BenchmarkResult, BenchmarkSta
 
 
 def assert_no_performance_regression(current_result: Union[BenchmarkResult, BenchmarkStats],
-                                   baseline_file: Path,
+                                   baseline_file: Union[Path, BinaryIO],
                                    tolerance_percent: float = 10.0,
                                    save_new_baseline: bool = False):
     """Assert that performance has not regressed compared to baseline.
     
     Args:
         current_result: Current benchmark result
-        baseline_file: Path to baseline performance file
+        baseline_file: Path to baseline performance file, or a seekable binary
+            stream (e.g. ``io.BytesIO``) holding it; an empty stream counts as
+            no baseline
         tolerance_percent: Allowed performance degradation percentage
         save_new_baseline: Whether to save current result as new baseline
         
@@ -86,11 +88,11 @@ def assert_no_performance_regression(current_result: Union[BenchmarkResult, Benc
         current_memory = current_result.memory_usage.get("rss_mb", 0)
         current_ops_per_sec = current_result.operations_per_second
     
+    is_path = isinstance(baseline_file, Path)
+    
     # Load baseline if exists
-    if baseline_file.exists():
-        with open(baseline_file, 'r') as f:
-            baseline = json.load(f)
-        
+    baseline = _read_baseline(baseline_file)
+    if baseline is not None:
         baseline_duration = baseline.get("duration", 0)
         baseline_memory = baseline.get("memory_mb", 0)
         baseline_ops_per_sec = baseline.get("ops_per_second", 0)
@@ -112,8 +114,9 @@ def assert_no_performance_regression(current_result: Union[BenchmarkResult, Benc
                 f"Throughput regression detected: {ops_decrease:.1f}% fewer ops/sec than baseline"
     
     # Save new baseline if requested or if no baseline exists
-    if save_new_baseline or not baseline_file.exists():
-        baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    if save_new_baseline or baseline is None:
+        if is_path:
+            baseline_file.parent.mkdir(parents=True, exist_ok=True)
         
         new_baseline = {
             "duration": current_duration,
@@ -123,8 +126,26 @@ def assert_no_performance_regression(current_result: Union[BenchmarkResult, Benc
             "benchmark_name": getattr(current_result, 'name', 'unknown')
         }
         
-        with open(baseline_file, 'w') as f:
-            json.dump(new_baseline, f, indent=2)
+        if is_path:
+            with open(baseline_file, 'w') as f:
+                json.dump(new_baseline, f, indent=2)
+        else:
+            baseline_file.seek(0)
+            baseline_file.truncate()
+            baseline_file.write(json.dumps(new_baseline, indent=2).encode())
+
+
+def _read_baseline(baseline_file: Union[Path, BinaryIO]) -> Optional[Dict[str, Any]]:
+    """Load a baseline from a path or binary stream, or None if there is none."""
+    if isinstance(baseline_file, Path):
+        if not baseline_file.exists():
+            return None
+        with open(baseline_file, 'r') as f:
+            return json.load(f)
+    
+    baseline_file.seek(0)
+    data = baseline_file.read()
+    return json.loads(data) if data else None
 
 
 def assert_memory_usage_stable(metrics: PerformanceMetrics,
@@ -140,11 +161,10 @@ def assert_memory_usage_stable(metrics: PerformanceMetrics,
     Raises:
         AssertionError: If memory usage is unstable
     """
-    if len(metrics.snapshots) < 2:
+    _, memory_values = metrics.get_memory_trend()
+    if len(memory_values) < 2:
         return  # Not enough data
     
-    memory_values = [snapshot.memory_usage["rss_mb"] for snapshot in metrics.snapshots]
-    
     # Check total growth
     memory_growth = memory_values[-1] - memory_values[0]
     assert memory_growth <= max_growth_mb, \
@@ -265,8 +285,8 @@ def assert_no_memory_leaks(initial_snapshot: PerformanceSnapshot,
     Raises:
         AssertionError: If memory leak detected
     """
-    initial_memory = initial_snapshot.memory_usage["rss_mb"]
-    final_memory = final_snapshot.memory_usage["rss_mb"]
+    initial_memory = initial_snapshot.rss_mb
+    final_memory = final_snapshot.rss_mb
     memory_growth = final_memory - initial_memory
     
     assert memory_growth <= max_growth_mb, \
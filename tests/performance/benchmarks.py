@@ -1,6 +1,12 @@
 """Performance benchmarking utilities for James Code testing."""
 
+import gc
+import os
+import sys
 import time
+import signal
+import ctypes
+import ctypes.util
 import psutil
 import threading
 from pathlib import Path
@@ -9,11 +15,37 @@ from dataclasses import dataclass, field
 from contextlib import contextmanager
 import statistics
 import json
+from bisect import bisect_left, bisect_right
 
 import pytest
 
+from .metrics import current_process
 
-@dataclass
+
+# prctl(2) option controlling the per-thread timer slack on Linux
+PR_SET_TIMERSLACK = 29
+
+
+def _set_thread_timer_slack(slack_ns: int = 1) -> bool:
+    """Set the calling thread's timer slack (Linux only).
+    
+    Args:
+        slack_ns: Timer slack in nanoseconds
+        
+    Returns:
+        True if the timer slack was applied
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        return libc.prctl(PR_SET_TIMERSLACK, slack_ns, 0, 0, 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result of a performance benchmark."""
     name: str
@@ -22,6 +54,7 @@ class BenchmarkResult:
     cpu_usage: float
     iterations: int
     metadata: Dict[str, Any] = field(default_factory=dict)
+    run_number: int = 0
     
     @property
     def operations_per_second(self) -> float:
@@ -114,26 +147,35 @@ class PerformanceBenchmark:
         self._start_cpu: Optional[float] = None
     
     @contextmanager
-    def measure(self, iterations: int = 1, metadata: Optional[Dict[str, Any]] = None):
+    def measure(self, iterations: int = 1, metadata: Optional[Dict[str, Any]] = None,
+                run_number: int = 0):
         """Context manager for measuring performance.
         
         Args:
             iterations: Number of operations being measured
-            metadata: Additional metadata to store
+            metadata: Additional metadata to store (stored by reference)
+            run_number: Run number within a multi-run benchmark
             
         Yields:
             None
         """
         # Start measurement
-        self._start_time = time.time()
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
         self._start_memory = self._get_memory_usage()
         self._start_cpu = psutil.cpu_percent()
         
+        # Keep the cyclic collector from firing inside the measured block
+        gc.disable()
+        self._start_time = time.time()
+        
         try:
             yield
         finally:
             # End measurement
             end_time = time.time()
+            if gc_was_enabled:
+                gc.enable()
             end_memory = self._get_memory_usage()
             end_cpu = psutil.cpu_percent()
             
@@ -152,7 +194,8 @@ class PerformanceBenchmark:
                 memory_usage=memory_usage,
                 cpu_usage=cpu_usage,
                 iterations=iterations,
-                metadata=metadata or {}
+                metadata=metadata if metadata is not None else {},
+                run_number=run_number
             )
             
             self.results.append(result)
@@ -179,12 +222,11 @@ class PerformanceBenchmark:
         for _ in range(warmup_runs):
             operation()
         
-        # Measured runs
+        # Measured runs share one metadata dict; only the run number differs
+        shared_metadata = metadata if metadata is not None else {}
         for run_num in range(runs):
-            run_metadata = (metadata or {}).copy()
-            run_metadata.update({"run_number": run_num + 1})
-            
-            with self.measure(iterations=iterations, metadata=run_metadata):
+            with self.measure(iterations=iterations, metadata=shared_metadata,
+                              run_number=run_num + 1):
                 for _ in range(iterations):
                     operation()
         
@@ -196,7 +238,7 @@ class PerformanceBenchmark:
         Returns:
             Memory usage dictionary in MB
         """
-        process = psutil.Process()
+        process = current_process()
         memory_info = process.memory_info()
         
         return {
@@ -221,35 +263,44 @@ class PerformanceBenchmark:
 class BenchmarkSuite:
     """Suite of performance benchmarks."""
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, sample_interval: float = 0.01):
         """Initialize benchmark suite.
         
         Args:
             name: Name of the suite
+            sample_interval: Resource sampling interval used by run_suite
         """
         self.name = name
+        self.sample_interval = sample_interval
         self.benchmarks: Dict[str, PerformanceBenchmark] = {}
+        self.operations: Dict[str, Callable] = {}
         self.suite_results: Dict[str, BenchmarkStats] = {}
     
-    def add_benchmark(self, benchmark: PerformanceBenchmark):
+    def add_benchmark(self, benchmark: PerformanceBenchmark,
+                      operation: Optional[Callable] = None):
         """Add a benchmark to the suite.
         
         Args:
             benchmark: Benchmark to add
+            operation: Operation run for this benchmark by run_suite
         """
         self.benchmarks[benchmark.name] = benchmark
+        if operation is not None:
+            self.operations[benchmark.name] = operation
     
-    def create_benchmark(self, name: str) -> PerformanceBenchmark:
+    def create_benchmark(self, name: str,
+                         operation: Optional[Callable] = None) -> PerformanceBenchmark:
         """Create and add a new benchmark.
         
         Args:
             name: Name of the benchmark
+            operation: Operation run for this benchmark by run_suite
             
         Returns:
             Created benchmark
         """
         benchmark = PerformanceBenchmark(name)
-        self.add_benchmark(benchmark)
+        self.add_benchmark(benchmark, operation)
         return benchmark
     
     def run_suite(self, 
@@ -258,6 +309,11 @@ class BenchmarkSuite:
                   warmup_runs: int = 1) -> Dict[str, BenchmarkStats]:
         """Run all benchmarks in the suite.
         
+        Benchmarks registered with an operation are run under a single
+        ContinuousPerformanceMonitor shared by the whole suite; each run's
+        resource usage is sliced from the samples by time window afterwards.
+        Benchmarks without an operation report their existing results.
+        
         Args:
             iterations: Iterations per benchmark run
             runs: Number of runs per benchmark
@@ -266,16 +322,92 @@ class BenchmarkSuite:
         Returns:
             Dictionary of benchmark statistics
         """
-        results = {}
+        windows: Dict[str, List[tuple]] = {}
         
+        if self.operations:
+            monitor = ContinuousPerformanceMonitor(sample_interval=self.sample_interval)
+            monitor.start_monitoring()
+            try:
+                for name, operation in self.operations.items():
+                    for _ in range(warmup_runs):
+                        operation()
+                    
+                    windows[name] = []
+                    for _ in range(runs):
+                        start_time = time.time()
+                        for _ in range(iterations):
+                            operation()
+                        windows[name].append((start_time, time.time()))
+            finally:
+                samples = monitor.stop_monitoring()
+            
+            timestamps = [sample["timestamp"] for sample in samples]
+            for name, run_windows in windows.items():
+                benchmark = self.benchmarks[name]
+                for run_number, (start_time, end_time) in enumerate(run_windows, 1):
+                    benchmark.results.append(self._result_from_samples(
+                        name, samples, timestamps, start_time, end_time,
+                        iterations, run_number
+                    ))
+        
+        results = {}
         for name, benchmark in self.benchmarks.items():
-            # This would need to be implemented based on specific benchmark needs
-            # For now, we'll just get existing stats
-            results[name] = benchmark.get_stats()
+            if name in windows:
+                results[name] = BenchmarkStats(name=name, results=benchmark.results[-runs:])
+            else:
+                results[name] = benchmark.get_stats()
         
         self.suite_results = results
         return results
     
+    @staticmethod
+    def _result_from_samples(name: str,
+                             samples: List[Dict[str, Any]],
+                             timestamps: List[float],
+                             start_time: float,
+                             end_time: float,
+                             iterations: int,
+                             run_number: int) -> BenchmarkResult:
+        """Build a benchmark result from the monitor samples of one run.
+        
+        Args:
+            name: Benchmark name
+            samples: Samples collected for the whole suite
+            timestamps: Sample timestamps, in order
+            start_time: Run start time
+            end_time: Run end time
+            iterations: Iterations in the run
+            run_number: Run number within the benchmark
+            
+        Returns:
+            Benchmark result
+        """
+        # Include the samples bracketing the run so short runs still get a delta
+        lo = max(bisect_right(timestamps, start_time) - 1, 0)
+        hi = min(bisect_left(timestamps, end_time) + 1, len(samples))
+        window = samples[lo:hi]
+        
+        if window:
+            first, last = window[0], window[-1]
+            memory_usage = {
+                "rss_mb": last["memory_rss_mb"] - first["memory_rss_mb"],
+                "vms_mb": last["memory_vms_mb"] - first["memory_vms_mb"],
+                "percent": last["memory_percent"] - first["memory_percent"],
+            }
+            cpu_usage = statistics.mean(sample["cpu_percent"] for sample in window)
+        else:
+            memory_usage = {"rss_mb": 0.0, "vms_mb": 0.0, "percent": 0.0}
+            cpu_usage = 0.0
+        
+        return BenchmarkResult(
+            name=name,
+            duration=end_time - start_time,
+            memory_usage=memory_usage,
+            cpu_usage=cpu_usage,
+            iterations=iterations,
+            run_number=run_number
+        )
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of suite results.
         
@@ -393,18 +525,34 @@ def benchmark_agent_workflow(agent,
 
 
 class ContinuousPerformanceMonitor:
-    """Monitor performance continuously during testing."""
+    """Monitor performance continuously during testing.
     
-    def __init__(self, sample_interval: float = 0.1):
+    Samples are taken by a background thread. With ``use_interval_timer``,
+    a monitor started from the main thread on a platform with interval
+    timers samples from a SIGALRM handler driven by ``setitimer`` instead,
+    so no sampler thread competes with the code under test for the GIL.
+    """
+    
+    def __init__(self, sample_interval: float = 0.1, use_interval_timer: bool = False):
         """Initialize continuous monitor.
         
         Args:
             sample_interval: Sampling interval in seconds
+            use_interval_timer: Sample from a SIGALRM handler when started on
+                the main thread. This replaces any SIGALRM handler while
+                monitoring and interrupts blocking calls, so it is opt-in
         """
         self.sample_interval = sample_interval
+        self.use_interval_timer = use_interval_timer
         self.samples: List[Dict[str, Any]] = []
         self.monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
+        self._process: Optional[psutil.Process] = None
+        self._previous_handler: Any = None
+        self._timer_active = False
+        self._last_cpu_times: Optional[float] = None
+        self._last_cpu_ns: Optional[int] = None
+        self._proc_dir_fds: Dict[str, int] = {}
     
     def start_monitoring(self):
         """Start continuous monitoring."""
@@ -412,8 +560,17 @@ class ContinuousPerformanceMonitor:
             return
         
         self.monitoring = True
-        self._monitor_thread = threading.Thread(target=self._monitor_loop)
-        self._monitor_thread.start()
+        self._process = current_process()
+        self._last_cpu_times = None
+        self._open_proc_dirs()
+        
+        if self._can_use_interval_timer():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_timer)
+            self._timer_active = True
+            signal.setitimer(signal.ITIMER_REAL, self.sample_interval, self.sample_interval)
+        else:
+            self._monitor_thread = threading.Thread(target=self._monitor_loop)
+            self._monitor_thread.start()
     
     def stop_monitoring(self) -> List[Dict[str, Any]]:
         """Stop monitoring and return samples.
@@ -423,32 +580,171 @@ class ContinuousPerformanceMonitor:
         """
         self.monitoring = False
         
+        if self._timer_active:
+            self._stop_interval_timer()
+        
         if self._monitor_thread:
             self._monitor_thread.join(timeout=1.0)
         
+        self._close_proc_dirs()
         return self.samples.copy()
     
+    def _can_use_interval_timer(self) -> bool:
+        """Check whether samples can be driven by an ITIMER_REAL signal.
+        
+        Returns:
+            True if the interval timer was requested and can be used
+        """
+        if not self.use_interval_timer or not hasattr(signal, "setitimer"):
+            return False
+        
+        # Signal handlers only run on the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        
+        # Do not clobber an interval timer someone else already armed
+        return signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    
+    def _stop_interval_timer(self):
+        """Disarm the interval timer and restore the previous SIGALRM handler."""
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self._previous_handler)
+        self._previous_handler = None
+        self._timer_active = False
+    
+    def _on_timer(self, signum, frame):
+        """SIGALRM handler taking a single sample."""
+        if not self.monitoring:
+            return
+        
+        try:
+            self.samples.append(self._collect_sample(self._process))
+        except Exception:
+            # Process might have ended or access denied
+            self.monitoring = False
+            self._stop_interval_timer()
+            self._close_proc_dirs()
+    
+    def _open_proc_dirs(self):
+        """Open /proc/self/task and /proc/self/fd once for the monitoring session."""
+        if not sys.platform.startswith("linux") or os.scandir not in os.supports_fd:
+            return
+        
+        try:
+            for name in ("task", "fd"):
+                self._proc_dir_fds[name] = os.open(f"/proc/self/{name}",
+                                                   os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            self._close_proc_dirs()
+    
+    def _close_proc_dirs(self):
+        """Close the persistent /proc directory descriptors."""
+        for fd in self._proc_dir_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._proc_dir_fds.clear()
+    
+    @staticmethod
+    def _count_dir_entries(dir_fd: int) -> int:
+        """Count entries of an open directory without stat-ing or resolving them.
+        
+        Args:
+            dir_fd: Open directory file descriptor
+            
+        Returns:
+            Number of directory entries
+        """
+        with os.scandir(dir_fd) as entries:
+            return sum(1 for _ in entries)
+    
+    @staticmethod
+    def _count_regular_files(dir_fd: int) -> int:
+        """Count entries of an open /proc fd directory that are regular files.
+        
+        Like ``psutil.Process.open_files()``, sockets, pipes, anonymous inodes
+        and directories (including the monitor's own /proc descriptors) are
+        excluded. Only the count is needed, so the per-fd readlink psutil does
+        is skipped; files unlinked while open are therefore still counted,
+        where psutil drops them because their path no longer resolves.
+        
+        Args:
+            dir_fd: Open /proc/<pid>/fd directory file descriptor
+            
+        Returns:
+            Number of descriptors open on regular files
+        """
+        with os.scandir(dir_fd) as entries:
+            return sum(1 for entry in entries if entry.is_file())
+    
+    def _cpu_percent(self) -> float:
+        """Get process CPU usage since the previous sample from ``os.times``.
+        
+        Returns:
+            CPU percentage (0 for the first sample)
+        """
+        times = os.times()
+        cpu_time = times.user + times.system
+        now_ns = time.monotonic_ns()
+        
+        percent = 0.0
+        if self._last_cpu_times is not None and now_ns > self._last_cpu_ns:
+            elapsed = (now_ns - self._last_cpu_ns) / 1_000_000_000
+            percent = (cpu_time - self._last_cpu_times) / elapsed * 100
+        
+        self._last_cpu_times = cpu_time
+        self._last_cpu_ns = now_ns
+        return percent
+    
+    def _collect_sample(self, process: psutil.Process) -> Dict[str, Any]:
+        """Collect a single performance sample.
+        
+        Args:
+            process: Process to sample
+            
+        Returns:
+            Sample dictionary
+        """
+        if self._proc_dir_fds:
+            num_threads = self._count_dir_entries(self._proc_dir_fds["task"])
+            open_files = self._count_regular_files(self._proc_dir_fds["fd"])
+        else:
+            num_threads = process.num_threads()
+            open_files = len(process.open_files())
+        
+        memory_info = process.memory_info()
+        return {
+            "timestamp": time.time(),
+            "memory_rss_mb": memory_info.rss / 1024 / 1024,
+            "memory_vms_mb": memory_info.vms / 1024 / 1024,
+            "memory_percent": process.memory_percent(),
+            "cpu_percent": self._cpu_percent(),
+            "num_threads": num_threads,
+            "open_files": open_files,
+        }
+    
     def _monitor_loop(self):
         """Main monitoring loop."""
-        process = psutil.Process()
+        process = self._process
+        
+        # Keep wake-ups close to their deadline at high sample rates
+        _set_thread_timer_slack()
+        interval_ns = int(self.sample_interval * 1_000_000_000)
+        next_deadline = time.monotonic_ns() + interval_ns
         
         while self.monitoring:
             try:
-                # Collect sample
-                memory_info = process.memory_info()
-                sample = {
-                    "timestamp": time.time(),
-                    "memory_rss_mb": memory_info.rss / 1024 / 1024,
-                    "memory_vms_mb": memory_info.vms / 1024 / 1024,
-                    "memory_percent": process.memory_percent(),
-                    "cpu_percent": process.cpu_percent(),
-                    "num_threads": process.num_threads(),
-                    "open_files": len(process.open_files()),
-                }
-                
-                self.samples.append(sample)
+                self.samples.append(self._collect_sample(process))
                 
-                time.sleep(self.sample_interval)
+                # Sleep until an absolute deadline so the schedule does not drift
+                delay_ns = next_deadline - time.monotonic_ns()
+                if delay_ns > 0:
+                    time.sleep(delay_ns / 1_000_000_000)
+                    next_deadline += interval_ns
+                else:
+                    # Sampling overran the interval; restart the schedule from now
+                    next_deadline = time.monotonic_ns() + interval_ns
                 
             except Exception:
                 # Process might have ended or access denied
@@ -1,95 +1,376 @@
 """Performance metrics collection and analysis for James Code testing."""
 
+import os
+import sys
 import time
+import signal
 import psutil
 import threading
-from typing import Dict, List, Any, Optional, Union
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
-import statistics
+from collections import deque
+from array import array
+import operator
+import struct
 import json
 
 import pytest
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
-@dataclass
+
+# Physical memory size never changes during a test run
+TOTAL_MEMORY_MB = psutil.virtual_memory().total / 1024 / 1024
+
+# Epoch seconds at monotonic time zero, fixed at import so converted
+# timestamps keep the spacing of the monotonic readings
+WALL_CLOCK_OFFSET = time.time() - time.monotonic_ns() / 1e9
+
+# Most recent system-wide and slow-changing values, refreshed every Nth capture
+_system_cache: Dict[str, Any] = {}
+
+# psutil handle for this process, shared by all captures
+_PROC: Optional[psutil.Process] = None
+
+
+def current_process() -> psutil.Process:
+    """Get the shared psutil handle for the current process.
+    
+    Reusing one handle skips re-reading the process identity on every call
+    and lets ``cpu_percent()`` report usage since its previous call instead
+    of the constant 0.0 a fresh handle returns. The handle is rebuilt if the
+    pid changes, e.g. in a forked child.
+    
+    Returns:
+        psutil Process for os.getpid()
+    """
+    global _PROC
+    if _PROC is None or _PROC.pid != os.getpid():
+        _PROC = psutil.Process()
+    return _PROC
+
+
+# /proc/self files read directly on Linux, bypassing psutil
+PROC_FAST_PATH_FILES = ("statm", "io")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if sys.platform.startswith("linux") else 0
+
+
+def open_proc_files() -> Dict[str, int]:
+    """Open the /proc/self files used by the snapshot fast path.
+    
+    Returns:
+        File descriptors keyed by file name (empty off Linux)
+    """
+    proc_fds: Dict[str, int] = {}
+    if not sys.platform.startswith("linux"):
+        return proc_fds
+    
+    for name in PROC_FAST_PATH_FILES:
+        try:
+            proc_fds[name] = os.open(f"/proc/self/{name}", os.O_RDONLY)
+        except OSError:
+            # e.g. /proc/self/io is not readable in some containers
+            continue
+    return proc_fds
+
+
+def close_proc_files(proc_fds: Dict[str, int]):
+    """Close descriptors returned by open_proc_files.
+    
+    Args:
+        proc_fds: File descriptors to close
+    """
+    for fd in proc_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    proc_fds.clear()
+
+
+def _read_proc_memory(fd: int) -> tuple:
+    """Read RSS and VMS in bytes from an open /proc/self/statm.
+    
+    Args:
+        fd: Descriptor of /proc/self/statm
+        
+    Returns:
+        Tuple of (rss_bytes, vms_bytes)
+    """
+    fields = os.pread(fd, 128, 0).split()
+    return int(fields[1]) * PAGE_SIZE, int(fields[0]) * PAGE_SIZE
+
+
+def _read_proc_io(fd: int) -> tuple:
+    """Read disk I/O counters from an open /proc/self/io.
+    
+    Args:
+        fd: Descriptor of /proc/self/io
+        
+    Returns:
+        Tuple of (read_bytes, write_bytes, read_count, write_count)
+    """
+    counters = dict(line.split(b": ") for line in os.pread(fd, 512, 0).splitlines())
+    return (
+        int(counters[b"read_bytes"]),
+        int(counters[b"write_bytes"]),
+        int(counters[b"syscr"]),
+        int(counters[b"syscw"])
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceSnapshot:
-    """Snapshot of performance metrics at a point in time."""
-    timestamp: float
-    memory_usage: Dict[str, float]
-    cpu_usage: float
-    disk_io: Dict[str, int]
-    network_io: Dict[str, int]
-    process_info: Dict[str, Any]
+    """Snapshot of performance metrics at a point in time.
+    
+    ``timestamp`` is a ``time.monotonic_ns()`` reading, so differences between
+    snapshots are immune to wall-clock adjustments; ``wall_time`` gives the
+    same instant in epoch seconds for reporting. All values are stored as
+    scalar slots; ``memory_usage``, ``disk_io``, ``network_io`` and
+    ``process_info`` build the grouped dictionaries on access.
+    """
+    timestamp: int
+    rss_mb: float = 0.0
+    vms_mb: float = 0.0
+    memory_percent: float = 0.0
+    available_mb: float = 0.0
+    total_mb: float = 0.0
+    cpu_usage: float = 0.0
+    read_bytes: int = 0
+    write_bytes: int = 0
+    read_count: int = 0
+    write_count: int = 0
+    bytes_sent: int = 0
+    bytes_recv: int = 0
+    packets_sent: int = 0
+    packets_recv: int = 0
+    pid: int = 0
+    num_threads: int = 0
+    num_fds: int = 0
+    create_time: float = 0.0
+    status: str = ""
+    
+    @property
+    def wall_time(self) -> float:
+        """Timestamp as wall-clock seconds since the epoch."""
+        return WALL_CLOCK_OFFSET + self.timestamp / 1e9
+    
+    @property
+    def memory_usage(self) -> Dict[str, float]:
+        """Memory values in MB."""
+        return {
+            "rss_mb": self.rss_mb,
+            "vms_mb": self.vms_mb,
+            "percent": self.memory_percent,
+            "available_mb": self.available_mb,
+            "total_mb": self.total_mb
+        }
+    
+    @property
+    def disk_io(self) -> Dict[str, int]:
+        """Disk I/O counters."""
+        return {
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+            "read_count": self.read_count,
+            "write_count": self.write_count
+        }
+    
+    @property
+    def network_io(self) -> Dict[str, int]:
+        """System-wide network I/O counters."""
+        return {
+            "bytes_sent": self.bytes_sent,
+            "bytes_recv": self.bytes_recv,
+            "packets_sent": self.packets_sent,
+            "packets_recv": self.packets_recv
+        }
+    
+    @property
+    def process_info(self) -> Dict[str, Any]:
+        """Process identity and status."""
+        return {
+            "pid": self.pid,
+            "num_threads": self.num_threads,
+            "num_fds": self.num_fds,
+            "create_time": self.create_time,
+            "status": self.status
+        }
     
     @classmethod
-    def capture(cls) -> 'PerformanceSnapshot':
+    def capture(cls, tick: int = 0, decimation: int = 1,
+                proc_fds: Optional[Dict[str, int]] = None,
+                cpu_percent: Optional[float] = None,
+                timestamp: Optional[int] = None) -> 'PerformanceSnapshot':
         """Capture current performance snapshot.
         
+        System-wide values (available memory, network I/O) and the process
+        status change slowly, so they are only re-read on every
+        ``decimation``-th tick and reused from the previous read otherwise.
+        
+        Args:
+            tick: Sequence number of this capture
+            decimation: Refresh slow-changing values every this many ticks
+            proc_fds: Open /proc/self descriptors from open_proc_files; memory
+                and disk I/O are then read from them instead of via psutil
+            cpu_percent: CPU usage already computed by the caller; psutil's
+                cpu_percent() is only queried when this is None
+            timestamp: Nanosecond clock reading to stamp the snapshot with
+                (``time.monotonic_ns()`` if None)
+            
         Returns:
             Performance snapshot
         """
-        process = psutil.Process()
+        process = current_process()
         
-        # Memory info
-        memory_info = process.memory_info()
-        memory_usage = {
-            "rss_mb": memory_info.rss / 1024 / 1024,
-            "vms_mb": memory_info.vms / 1024 / 1024,
-            "percent": process.memory_percent(),
-            "available_mb": psutil.virtual_memory().available / 1024 / 1024,
-            "total_mb": psutil.virtual_memory().total / 1024 / 1024
-        }
+        refresh = (tick % decimation == 0 or
+                   _system_cache.get("pid") != process.pid)
         
-        # Disk I/O
-        try:
-            disk_io_info = process.io_counters()
-            disk_io = {
-                "read_bytes": disk_io_info.read_bytes,
-                "write_bytes": disk_io_info.write_bytes,
-                "read_count": disk_io_info.read_count,
-                "write_count": disk_io_info.write_count
-            }
-        except (psutil.AccessDenied, AttributeError):
-            disk_io = {"read_bytes": 0, "write_bytes": 0, "read_count": 0, "write_count": 0}
+        if refresh:
+            # System-wide values are not covered by oneshot()
+            _system_cache["available_mb"] = psutil.virtual_memory().available / 1024 / 1024
+            
+            # Network I/O (system-wide)
+            try:
+                net_io_info = psutil.net_io_counters()
+                _system_cache["network_io"] = (
+                    net_io_info.bytes_sent,
+                    net_io_info.bytes_recv,
+                    net_io_info.packets_sent,
+                    net_io_info.packets_recv
+                )
+            except AttributeError:
+                _system_cache["network_io"] = (0, 0, 0, 0)
         
-        # Network I/O (system-wide)
-        try:
-            net_io_info = psutil.net_io_counters()
-            network_io = {
-                "bytes_sent": net_io_info.bytes_sent,
-                "bytes_recv": net_io_info.bytes_recv,
-                "packets_sent": net_io_info.packets_sent,
-                "packets_recv": net_io_info.packets_recv
-            }
-        except AttributeError:
-            network_io = {"bytes_sent": 0, "bytes_recv": 0, "packets_sent": 0, "packets_recv": 0}
-        
-        # Process info
-        process_info = {
-            "pid": process.pid,
-            "num_threads": process.num_threads(),
-            "num_fds": process.num_fds() if hasattr(process, 'num_fds') else 0,
-            "create_time": process.create_time(),
-            "status": process.status()
-        }
+        bytes_sent, bytes_recv, packets_sent, packets_recv = _system_cache["network_io"]
+        proc_fds = proc_fds or {}
+        
+        # Serve all per-process attributes from a single read of /proc/<pid>/*
+        with process.oneshot():
+            # Memory info
+            if "statm" in proc_fds:
+                rss_bytes, vms_bytes = _read_proc_memory(proc_fds["statm"])
+            else:
+                memory_info = process.memory_info()
+                rss_bytes, vms_bytes = memory_info.rss, memory_info.vms
+            rss_mb = rss_bytes / 1024 / 1024
+            
+            # Disk I/O
+            try:
+                if "io" in proc_fds:
+                    disk_io = _read_proc_io(proc_fds["io"])
+                else:
+                    disk_io_info = process.io_counters()
+                    disk_io = (
+                        disk_io_info.read_bytes,
+                        disk_io_info.write_bytes,
+                        disk_io_info.read_count,
+                        disk_io_info.write_count
+                    )
+            except (psutil.AccessDenied, AttributeError, OSError):
+                disk_io = (0, 0, 0, 0)
+            read_bytes, write_bytes, read_count, write_count = disk_io
+            
+            if refresh:
+                _system_cache["pid"] = process.pid
+                _system_cache["status"] = process.status()
+            
+            num_threads = process.num_threads()
+            num_fds = process.num_fds() if hasattr(process, 'num_fds') else 0
+            create_time = process.create_time()
+            cpu_usage = process.cpu_percent() if cpu_percent is None else cpu_percent
         
         return cls(
-            timestamp=time.time(),
-            memory_usage=memory_usage,
-            cpu_usage=process.cpu_percent(),
-            disk_io=disk_io,
-            network_io=network_io,
-            process_info=process_info
+            timestamp=time.monotonic_ns() if timestamp is None else timestamp,
+            rss_mb=rss_mb,
+            vms_mb=vms_bytes / 1024 / 1024,
+            memory_percent=rss_mb / TOTAL_MEMORY_MB * 100,
+            available_mb=_system_cache["available_mb"],
+            total_mb=TOTAL_MEMORY_MB,
+            cpu_usage=cpu_usage,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+            read_count=read_count,
+            write_count=write_count,
+            bytes_sent=bytes_sent,
+            bytes_recv=bytes_recv,
+            packets_sent=packets_sent,
+            packets_recv=packets_recv,
+            pid=process.pid,
+            num_threads=num_threads,
+            num_fds=num_fds,
+            create_time=create_time,
+            status=_system_cache["status"]
         )
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize trend arrays for JSON export.
+    
+    Args:
+        obj: Object the JSON encoder could not serialize
+        
+    Returns:
+        List form of an array
+        
+    Raises:
+        TypeError: If the object is not an array
+    """
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Packed per-sample record: timestamp, rss_mb, cpu_usage, disk read/write bytes
+SAMPLE_RECORD = struct.Struct('<qffQQ')
+
+
 @dataclass
 class PerformanceMetrics:
-    """Collection of performance metrics over time."""
+    """Collection of performance metrics over time.
+    
+    Each added snapshot is packed into a fixed-size binary record holding the
+    values used for trends and disk totals. With ``capacity`` set, only the
+    most recent ``capacity`` records are kept and full snapshot objects are
+    not retained, which bounds memory use for long collections; peaks,
+    averages and duration still cover every added snapshot.
+    
+    ``start_time`` and ``end_time`` are wall-clock epoch seconds; duration
+    and trend times are computed from the monotonic snapshot timestamps.
+    """
     snapshots: List[PerformanceSnapshot] = field(default_factory=list)
     start_time: Optional[float] = None
     end_time: Optional[float] = None
+    capacity: Optional[int] = None
+    
+    # Monotonic nanosecond timestamps of the first and last added snapshot
+    _start_ns: Optional[int] = field(default=None, init=False, repr=False)
+    _end_ns: Optional[int] = field(default=None, init=False, repr=False)
+    
+    # Running aggregates maintained by add_snapshot
+    _count: int = field(default=0, init=False, repr=False)
+    _peak_rss: float = field(default=0.0, init=False, repr=False)
+    _sum_rss: float = field(default=0.0, init=False, repr=False)
+    _peak_cpu: float = field(default=0.0, init=False, repr=False)
+    _cpu_sum: float = field(default=0.0, init=False, repr=False)
+    _cpu_n: int = field(default=0, init=False, repr=False)
+    _first_disk_io: Optional[tuple] = field(default=None, init=False, repr=False)
+    _last_disk_io: Optional[tuple] = field(default=None, init=False, repr=False)
+    
+    # Packed SAMPLE_RECORD entries, unpacked only when trends are requested
+    _records: deque = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Build the record buffer and aggregates for snapshots passed at construction."""
+        self._records = deque(maxlen=self.capacity)
+        for snapshot in self.snapshots:
+            self._accumulate(snapshot)
     
     def add_snapshot(self, snapshot: PerformanceSnapshot):
         """Add a performance snapshot.
@@ -97,11 +378,52 @@ class PerformanceMetrics:
         Args:
             snapshot: Snapshot to add
         """
-        self.snapshots.append(snapshot)
+        if self.capacity is None:
+            self.snapshots.append(snapshot)
+        self._accumulate(snapshot)
+        
+        wall_time = snapshot.wall_time
+        if self._start_ns is None:
+            self._start_ns = snapshot.timestamp
+            self.start_time = wall_time
+        self._end_ns = snapshot.timestamp
+        self.end_time = wall_time
+    
+    def _accumulate(self, snapshot: PerformanceSnapshot):
+        """Fold a snapshot into the record buffer and running aggregates.
+        
+        Args:
+            snapshot: Snapshot to fold in
+        """
+        rss = snapshot.rss_mb
+        cpu = snapshot.cpu_usage
+        disk_io = (snapshot.read_bytes, snapshot.write_bytes)
         
-        if self.start_time is None:
-            self.start_time = snapshot.timestamp
-        self.end_time = snapshot.timestamp
+        self._records.append(SAMPLE_RECORD.pack(snapshot.timestamp, rss, cpu, *disk_io))
+        
+        self._count += 1
+        if self._first_disk_io is None:
+            self._first_disk_io = disk_io
+        self._last_disk_io = disk_io
+        
+        self._sum_rss += rss
+        if rss > self._peak_rss:
+            self._peak_rss = rss
+        
+        if cpu > self._peak_cpu:
+            self._peak_cpu = cpu
+        if cpu > 0:
+            self._cpu_sum += cpu
+            self._cpu_n += 1
+    
+    @property
+    def sample_count(self) -> int:
+        """Number of snapshots added, including ones evicted from the buffer.
+        
+        Returns:
+            Sample count
+        """
+        return self._count
     
     @property
     def duration(self) -> float:
@@ -110,9 +432,9 @@ class PerformanceMetrics:
         Returns:
             Duration in seconds
         """
-        if self.start_time is None or self.end_time is None:
+        if self._start_ns is None or self._end_ns is None:
             return 0
-        return self.end_time - self.start_time
+        return (self._end_ns - self._start_ns) / 1e9
     
     @property
     def peak_memory_mb(self) -> float:
@@ -121,9 +443,9 @@ class PerformanceMetrics:
         Returns:
             Peak memory usage
         """
-        if not self.snapshots:
+        if not self._count:
             return 0
-        return max(snapshot.memory_usage["rss_mb"] for snapshot in self.snapshots)
+        return self._peak_rss
     
     @property
     def avg_memory_mb(self) -> float:
@@ -132,9 +454,9 @@ class PerformanceMetrics:
         Returns:
             Average memory usage
         """
-        if not self.snapshots:
+        if not self._count:
             return 0
-        return statistics.mean(snapshot.memory_usage["rss_mb"] for snapshot in self.snapshots)
+        return self._sum_rss / self._count
     
     @property
     def avg_cpu_percent(self) -> float:
@@ -143,10 +465,9 @@ class PerformanceMetrics:
         Returns:
             Average CPU percentage
         """
-        if not self.snapshots:
+        if not self._cpu_n:
             return 0
-        cpu_values = [s.cpu_usage for s in self.snapshots if s.cpu_usage > 0]
-        return statistics.mean(cpu_values) if cpu_values else 0
+        return self._cpu_sum / self._cpu_n
     
     @property
     def peak_cpu_percent(self) -> float:
@@ -155,9 +476,9 @@ class PerformanceMetrics:
         Returns:
             Peak CPU percentage
         """
-        if not self.snapshots:
+        if not self._count:
             return 0
-        return max(snapshot.cpu_usage for snapshot in self.snapshots)
+        return self._peak_cpu
     
     @property
     def total_disk_read_mb(self) -> float:
@@ -166,12 +487,10 @@ class PerformanceMetrics:
         Returns:
             Total disk read
         """
-        if len(self.snapshots) < 2:
+        if self._count < 2:
             return 0
         
-        start_read = self.snapshots[0].disk_io["read_bytes"]
-        end_read = self.snapshots[-1].disk_io["read_bytes"]
-        return (end_read - start_read) / 1024 / 1024
+        return (self._last_disk_io[0] - self._first_disk_io[0]) / 1024 / 1024
     
     @property
     def total_disk_write_mb(self) -> float:
@@ -180,39 +499,70 @@ class PerformanceMetrics:
         Returns:
             Total disk write
         """
-        if len(self.snapshots) < 2:
+        if self._count < 2:
             return 0
         
-        start_write = self.snapshots[0].disk_io["write_bytes"]
-        end_write = self.snapshots[-1].disk_io["write_bytes"]
-        return (end_write - start_write) / 1024 / 1024
+        return (self._last_disk_io[1] - self._first_disk_io[1]) / 1024 / 1024
+    
+    def _trend_columns(self, field_index: int) -> Tuple[array, array]:
+        """Unpack the record buffer into time and value columns.
+        
+        Args:
+            field_index: Index of the value field in SAMPLE_RECORD
+            
+        Returns:
+            Tuple of (seconds since start, values) arrays
+        """
+        times = array('d')
+        values = array('d')
+        if not self._records:
+            return times, values
+        
+        columns = list(zip(*SAMPLE_RECORD.iter_unpack(b"".join(self._records))))
+        start_ns = self._start_ns
+        if start_ns is not None:
+            times.extend([(timestamp - start_ns) / 1e9 for timestamp in columns[0]])
+        else:
+            times.extend([0.0] * len(columns[0]))
+        values.extend(columns[field_index])
+        return times, values
     
-    def get_memory_trend(self) -> List[Dict[str, float]]:
+    def get_memory_trend(self) -> Tuple[array, array]:
         """Get memory usage trend over time.
         
+        Returns:
+            Tuple of parallel (time in seconds, memory in MB) arrays
+        """
+        return self._trend_columns(1)
+    
+    def get_cpu_trend(self) -> Tuple[array, array]:
+        """Get CPU usage trend over time.
+        
+        Returns:
+            Tuple of parallel (time in seconds, CPU percentage) arrays
+        """
+        return self._trend_columns(2)
+    
+    def get_memory_trend_dicts(self) -> List[Dict[str, float]]:
+        """Get memory usage trend as a list of time/memory points.
+        
         Returns:
             List of time/memory points
         """
         return [
-            {
-                "time": snapshot.timestamp - self.start_time if self.start_time else 0,
-                "memory_mb": snapshot.memory_usage["rss_mb"]
-            }
-            for snapshot in self.snapshots
+            {"time": time_s, "memory_mb": memory_mb}
+            for time_s, memory_mb in zip(*self.get_memory_trend())
         ]
     
-    def get_cpu_trend(self) -> List[Dict[str, float]]:
-        """Get CPU usage trend over time.
+    def get_cpu_trend_dicts(self) -> List[Dict[str, float]]:
+        """Get CPU usage trend as a list of time/CPU points.
         
         Returns:
             List of time/CPU points
         """
         return [
-            {
-                "time": snapshot.timestamp - self.start_time if self.start_time else 0,
-                "cpu_percent": snapshot.cpu_usage
-            }
-            for snapshot in self.snapshots
+            {"time": time_s, "cpu_percent": cpu_percent}
+            for time_s, cpu_percent in zip(*self.get_cpu_trend())
         ]
     
     def get_summary(self) -> Dict[str, Any]:
@@ -223,16 +573,16 @@ class PerformanceMetrics:
         """
         return {
             "duration": self.duration,
-            "snapshots_count": len(self.snapshots),
+            "snapshots_count": self._count,
             "memory": {
                 "peak_mb": self.peak_memory_mb,
                 "avg_mb": self.avg_memory_mb,
-                "trend": self.get_memory_trend()
+                "trend": dict(zip(("time", "memory_mb"), self.get_memory_trend()))
             },
             "cpu": {
                 "peak_percent": self.peak_cpu_percent,
                 "avg_percent": self.avg_cpu_percent,
-                "trend": self.get_cpu_trend()
+                "trend": dict(zip(("time", "cpu_percent"), self.get_cpu_trend()))
             },
             "disk_io": {
                 "total_read_mb": self.total_disk_read_mb,
@@ -248,32 +598,156 @@ class PerformanceMetrics:
         """
         summary = self.get_summary()
         
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(summary, default=_json_default, option=orjson.OPT_INDENT_2))
+            return
+        
         with open(file_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+            json.dump(summary, f, indent=2, default=_json_default)
+    
+    def reset(self):
+        """Discard all snapshots, records and aggregates."""
+        self.snapshots.clear()
+        self.start_time = None
+        self.end_time = None
+        self._start_ns = None
+        self._end_ns = None
+        self._count = 0
+        self._peak_rss = 0.0
+        self._sum_rss = 0.0
+        self._peak_cpu = 0.0
+        self._cpu_sum = 0.0
+        self._cpu_n = 0
+        self._first_disk_io = None
+        self._last_disk_io = None
+        self._records.clear()
 
 
 class MetricsCollector:
     """Collector for performance metrics during testing."""
     
-    def __init__(self, collection_interval: float = 0.1):
+    def __init__(self,
+                 collection_interval: float = 0.1,
+                 threshold_mb: Optional[float] = None,
+                 cpu_delta: Optional[float] = None,
+                 capacity: Optional[int] = None,
+                 decimation: int = 10,
+                 clock: Optional[Callable[[], int]] = None,
+                 sleep: Optional[Callable[[float], Any]] = None,
+                 use_interval_timer: bool = False):
         """Initialize metrics collector.
         
+        When ``threshold_mb`` or ``cpu_delta`` is set, each tick only does a
+        cheap RSS/CPU read and a full snapshot is recorded only once RSS or
+        CPU usage has moved past the threshold since the last recorded one.
+        
         Args:
             collection_interval: Interval between collections in seconds
+            threshold_mb: RSS change in MB that triggers a snapshot
+            cpu_delta: CPU percentage change that triggers a snapshot
+            capacity: Maximum number of samples kept (unbounded if None)
+            decimation: Refresh system-wide values every this many snapshots
+            clock: Nanosecond clock used for timestamps and CPU usage
+                (``time.monotonic_ns`` if None)
+            sleep: Wait between ticks of the worker thread and run_ticks
+                (an interruptible event wait or ``time.sleep`` if None)
+            use_interval_timer: Take snapshots from a SIGALRM handler instead
+                of the worker thread when started on the main thread. This
+                replaces any SIGALRM handler for the duration of the collection
+                and interrupts blocking calls, so it is opt-in
         """
         self.collection_interval = collection_interval
-        self.metrics = PerformanceMetrics()
+        self.threshold_mb = threshold_mb
+        self.cpu_delta = cpu_delta
+        self.capacity = capacity
+        self.decimation = decimation
+        self._clock = clock or time.monotonic_ns
+        self._sleep = sleep
+        self.use_interval_timer = use_interval_timer
+        self.metrics = PerformanceMetrics(capacity=capacity)
         self.collecting = False
         self._collection_thread: Optional[threading.Thread] = None
+        self._process: Optional[psutil.Process] = None
+        self._previous_handler: Any = None
+        self._timer_active = False
+        self._in_tick = False
+        self._last_rss: Optional[int] = None
+        self._last_cpu: Optional[float] = None
+        self._tick_counter = 0
+        self._proc_fds: Dict[str, int] = {}
+        self._last_cpu_times: Optional[float] = None
+        self._last_cpu_ns = 0
+        
+        # Persistent worker used when the interval timer is unavailable
+        self._run = threading.Event()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._shutdown = threading.Event()
     
     def start_collection(self):
-        """Start collecting performance metrics."""
+        """Start collecting performance metrics.
+        
+        A daemon worker thread, created once and reused by later collections,
+        is woken up. With ``use_interval_timer`` on the main thread of a
+        platform with interval timers, snapshots are instead taken from a
+        SIGALRM handler armed with ``setitimer``.
+        """
         if self.collecting:
             return
         
+        self._begin_collection()
+        
+        if self._can_use_interval_timer():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_tick)
+            self._timer_active = True
+            # Take the first snapshot immediately, as the threaded loop does
+            self._on_tick(signal.SIGALRM, None)
+            signal.setitimer(signal.ITIMER_REAL, self.collection_interval, self.collection_interval)
+        else:
+            self._ensure_worker()
+            self._wakeup.clear()
+            self._run.set()
+    
+    def run_ticks(self, ticks: int) -> PerformanceMetrics:
+        """Collect for a fixed number of ticks on the calling thread.
+        
+        No timer or worker thread is involved; the collector's ``sleep`` is
+        called between ticks, so a test injecting a fake clock and sleep can
+        drive collection deterministically without real waits.
+        
+        Args:
+            ticks: Number of ticks to run
+            
+        Returns:
+            Collected performance metrics
+        """
+        if self.collecting:
+            raise RuntimeError("Collection is already running")
+        
+        self._begin_collection()
+        sleep = self._sleep or time.sleep
+        try:
+            for _ in range(ticks):
+                cpu = self._cpu_percent()
+                if self._should_collect(self._process, cpu):
+                    self.collect_snapshot(cpu)
+                sleep(self.collection_interval)
+        finally:
+            self.stop_collection()
+        return self.metrics
+    
+    def _begin_collection(self):
+        """Reset per-collection state and open the /proc fast-path files."""
         self.collecting = True
-        self._collection_thread = threading.Thread(target=self._collection_loop)
-        self._collection_thread.start()
+        self._process = current_process()
+        self._last_rss = None
+        self._last_cpu = None
+        self._tick_counter = 0
+        self._proc_fds = open_proc_files()
+        self._last_cpu_times = None
+        self._cpu_percent()
     
     def stop_collection(self) -> PerformanceMetrics:
         """Stop collecting metrics and return results.
@@ -283,39 +757,210 @@ class MetricsCollector:
         """
         self.collecting = False
         
-        if self._collection_thread:
-            self._collection_thread.join(timeout=1.0)
+        if self._timer_active:
+            self._stop_interval_timer()
         
+        if self._run.is_set():
+            self._run.clear()
+            self._wakeup.set()
+            self._idle.wait(timeout=1.0)
+        
+        close_proc_files(self._proc_fds)
         return self.metrics
     
-    def collect_snapshot(self):
-        """Collect a single performance snapshot."""
-        snapshot = PerformanceSnapshot.capture()
+    def close(self):
+        """Stop collecting and shut down the worker thread, if any."""
+        if self.collecting:
+            self.stop_collection()
+        
+        self._shutdown.set()
+        self._run.set()
+        if self._collection_thread:
+            self._collection_thread.join(timeout=1.0)
+            self._collection_thread = None
+        self._shutdown.clear()
+        self._run.clear()
+    
+    def collect_snapshot(self, cpu_percent: Optional[float] = None):
+        """Collect a single performance snapshot.
+        
+        Args:
+            cpu_percent: CPU usage for this tick (computed if None)
+        """
+        if cpu_percent is None:
+            cpu_percent = self._cpu_percent()
+        snapshot = PerformanceSnapshot.capture(
+            tick=self._tick_counter,
+            decimation=self.decimation,
+            proc_fds=self._proc_fds,
+            cpu_percent=cpu_percent,
+            timestamp=self._clock()
+        )
+        self._tick_counter += 1
         self.metrics.add_snapshot(snapshot)
     
+    def _can_use_interval_timer(self) -> bool:
+        """Check whether collection can be driven by an ITIMER_REAL signal.
+        
+        Returns:
+            True if the interval timer was requested and can be used
+        """
+        if not self.use_interval_timer or not hasattr(signal, "setitimer"):
+            return False
+        
+        # Signal handlers only run on the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        
+        # Do not clobber an interval timer someone else already armed
+        return signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    
+    def _stop_interval_timer(self):
+        """Disarm the interval timer and restore the previous SIGALRM handler."""
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self._previous_handler)
+        self._previous_handler = None
+        self._timer_active = False
+    
+    def _on_tick(self, signum, frame):
+        """SIGALRM handler collecting a single snapshot."""
+        # Drop ticks that arrive while a previous one is still being handled
+        if not self.collecting or self._in_tick:
+            return
+        
+        self._in_tick = True
+        try:
+            cpu = self._cpu_percent()
+            if self._should_collect(self._process, cpu):
+                self.collect_snapshot(cpu)
+        except Exception:
+            # Handle errors gracefully
+            self.collecting = False
+            self._stop_interval_timer()
+            close_proc_files(self._proc_fds)
+        finally:
+            self._in_tick = False
+    
+    def _cpu_percent(self) -> float:
+        """Get process CPU usage since the previous tick from ``os.times``.
+        
+        Returns:
+            CPU percentage (0 for the first tick)
+        """
+        times = os.times()
+        cpu_time = times.user + times.system
+        now_ns = self._clock()
+        
+        percent = 0.0
+        if self._last_cpu_times is not None and now_ns > self._last_cpu_ns:
+            elapsed = (now_ns - self._last_cpu_ns) / 1_000_000_000
+            percent = (cpu_time - self._last_cpu_times) / elapsed * 100
+        
+        self._last_cpu_times = cpu_time
+        self._last_cpu_ns = now_ns
+        return percent
+    
+    def _should_collect(self, process: psutil.Process, cpu: float) -> bool:
+        """Check whether usage moved enough since the last recorded snapshot.
+        
+        Args:
+            process: Process used for the RSS read when /proc/self/statm
+                is not open
+            cpu: CPU usage for this tick
+            
+        Returns:
+            True if a full snapshot should be recorded
+        """
+        if self.threshold_mb is None and self.cpu_delta is None:
+            return True
+        
+        statm_fd = self._proc_fds.get("statm")
+        rss = _read_proc_memory(statm_fd)[0] if statm_fd is not None else process.memory_info().rss
+        
+        if self._last_rss is None:
+            changed = True
+        else:
+            changed = (
+                (self.threshold_mb is not None and
+                 abs(rss - self._last_rss) > self.threshold_mb * 1024 * 1024) or
+                (self.cpu_delta is not None and
+                 abs(cpu - self._last_cpu) > self.cpu_delta)
+            )
+        
+        if changed:
+            self._last_rss = rss
+            self._last_cpu = cpu
+        return changed
+    
+    def _ensure_worker(self):
+        """Start the daemon worker thread unless it is already running."""
+        if self._collection_thread and self._collection_thread.is_alive():
+            return
+        
+        self._collection_thread = threading.Thread(
+            target=self._worker_loop, name="metrics-collector", daemon=True
+        )
+        self._collection_thread.start()
+    
+    def _worker_loop(self):
+        """Wait for collection to be started and run it, until shut down."""
+        while True:
+            self._run.wait()
+            if self._shutdown.is_set():
+                return
+            
+            self._idle.clear()
+            try:
+                self._collection_loop()
+            finally:
+                self._idle.set()
+            
+            if self.collecting:
+                # Collection ended on an error; park until stop_collection
+                self._wakeup.wait()
+    
     def _collection_loop(self):
         """Main collection loop."""
+        process = self._process
+        
+        # Bind hot-path callables to locals to skip attribute lookups per tick
+        sleep = self._sleep or self._wakeup.wait
+        cpu_percent = self._cpu_percent
+        should_collect = self._should_collect
+        collect_snapshot = self.collect_snapshot
+        interval = self.collection_interval
+        
         while self.collecting:
             try:
-                self.collect_snapshot()
-                time.sleep(self.collection_interval)
+                cpu = cpu_percent()
+                if should_collect(process, cpu):
+                    collect_snapshot(cpu)
+                sleep(interval)
             except Exception:
                 # Handle errors gracefully
                 break
     
     def reset(self):
         """Reset all collected metrics."""
-        self.metrics = PerformanceMetrics()
+        self.metrics = PerformanceMetrics(capacity=self.capacity)
 
 
 class ResourceMonitor:
-    """Monitor specific resource usage patterns."""
+    """Monitor specific resource usage patterns.
+    
+    Alerts are stored as parallel timestamp/value/threshold arrays per
+    resource type, so recording one is a few C-level appends with no dict
+    allocation or lock; alert dicts are only built when they are read.
+    """
+    
+    ALERT_TYPES = ("memory", "cpu", "disk")
     
     def __init__(self):
         """Initialize resource monitor."""
-        self.memory_alerts: List[Dict[str, Any]] = []
-        self.cpu_alerts: List[Dict[str, Any]] = []
-        self.disk_alerts: List[Dict[str, Any]] = []
+        self._alert_columns: Dict[str, tuple] = {
+            alert_type: (array('d'), array('d'), array('d'))
+            for alert_type in self.ALERT_TYPES
+        }
         
         # Thresholds
         self.memory_threshold_mb = 500  # 500MB
@@ -329,26 +974,69 @@ class ResourceMonitor:
             snapshot: Performance snapshot to check
         """
         # Check memory
-        if snapshot.memory_usage["rss_mb"] > self.memory_threshold_mb:
-            alert = {
-                "timestamp": snapshot.timestamp,
-                "type": "memory",
-                "value": snapshot.memory_usage["rss_mb"],
-                "threshold": self.memory_threshold_mb,
-                "message": f"Memory usage exceeded: {snapshot.memory_usage['rss_mb']:.1f}MB"
-            }
-            self.memory_alerts.append(alert)
+        rss_mb = snapshot.rss_mb
+        if rss_mb > self.memory_threshold_mb:
+            self._record_alert("memory", snapshot.wall_time, rss_mb, self.memory_threshold_mb)
         
         # Check CPU
         if snapshot.cpu_usage > self.cpu_threshold_percent:
-            alert = {
-                "timestamp": snapshot.timestamp,
-                "type": "cpu",
-                "value": snapshot.cpu_usage,
-                "threshold": self.cpu_threshold_percent,
-                "message": f"CPU usage exceeded: {snapshot.cpu_usage:.1f}%"
+            self._record_alert("cpu", snapshot.wall_time, snapshot.cpu_usage, self.cpu_threshold_percent)
+    
+    def _record_alert(self, alert_type: str, timestamp: float, value: float, threshold: float):
+        """Append an alert to the columns for its type.
+        
+        Args:
+            alert_type: Resource type the alert belongs to
+            timestamp: Snapshot wall-clock time in epoch seconds
+            value: Observed value
+            threshold: Threshold that was exceeded
+        """
+        timestamps, values, thresholds = self._alert_columns[alert_type]
+        timestamps.append(timestamp)
+        values.append(value)
+        thresholds.append(threshold)
+    
+    def _build_alerts(self, alert_type: str) -> List[Dict[str, Any]]:
+        """Materialize the alerts of one type as dicts.
+        
+        Args:
+            alert_type: Resource type to build alerts for
+            
+        Returns:
+            List of alert dictionaries
+        """
+        if alert_type == "memory":
+            message = "Memory usage exceeded: {:.1f}MB"
+        elif alert_type == "cpu":
+            message = "CPU usage exceeded: {:.1f}%"
+        else:
+            message = "Disk I/O exceeded: {:.1f}MB/s"
+        
+        return [
+            {
+                "timestamp": timestamp,
+                "type": alert_type,
+                "value": value,
+                "threshold": threshold,
+                "message": message.format(value)
             }
-            self.cpu_alerts.append(alert)
+            for timestamp, value, threshold in zip(*self._alert_columns[alert_type])
+        ]
+    
+    @property
+    def memory_alerts(self) -> List[Dict[str, Any]]:
+        """Memory alerts recorded so far."""
+        return self._build_alerts("memory")
+    
+    @property
+    def cpu_alerts(self) -> List[Dict[str, Any]]:
+        """CPU alerts recorded so far."""
+        return self._build_alerts("cpu")
+    
+    @property
+    def disk_alerts(self) -> List[Dict[str, Any]]:
+        """Disk I/O alerts recorded so far."""
+        return self._build_alerts("disk")
     
     def get_alerts(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get all resource alerts.
@@ -356,11 +1044,7 @@ class ResourceMonitor:
         Returns:
             Dictionary of alerts by type
         """
-        return {
-            "memory": self.memory_alerts,
-            "cpu": self.cpu_alerts,
-            "disk": self.disk_alerts
-        }
+        return {alert_type: self._build_alerts(alert_type) for alert_type in self.ALERT_TYPES}
     
     def has_violations(self) -> bool:
         """Check if any resource violations occurred.
@@ -368,30 +1052,55 @@ class ResourceMonitor:
         Returns:
             True if violations occurred
         """
-        return (len(self.memory_alerts) > 0 or 
-                len(self.cpu_alerts) > 0 or 
-                len(self.disk_alerts) > 0)
+        return any(len(columns[0]) for columns in self._alert_columns.values())
     
     def reset(self):
         """Reset all alerts."""
-        self.memory_alerts.clear()
-        self.cpu_alerts.clear()
-        self.disk_alerts.clear()
+        for columns in self._alert_columns.values():
+            for column in columns:
+                del column[:]
 
 
 class MemoryTracker:
-    """Track memory usage patterns for leak detection."""
+    """Track memory usage patterns for leak detection.
+    
+    Measurements are stored as parallel columns so leak detection can compute
+    consecutive deltas in one C-level pass; ``measurements`` materializes the
+    per-measurement dicts on demand.
+    """
     
     def __init__(self):
         """Initialize memory tracker."""
         self.baseline: Optional[float] = None
-        self.measurements: List[Dict[str, Any]] = []
         self.leak_threshold_mb = 50  # 50MB increase considered potential leak
+        self._timestamps = array("d")
+        self._memory = array("d")
+        self._deltas = array("d")
+        self._labels: List[str] = []
+    
+    @property
+    def measurements(self) -> List[Dict[str, Any]]:
+        """Measurements taken so far.
+        
+        Returns:
+            List of measurement dictionaries
+        """
+        return [
+            {
+                "timestamp": timestamp,
+                "label": label,
+                "memory_mb": memory_mb,
+                "delta_from_baseline": delta
+            }
+            for timestamp, label, memory_mb, delta in zip(
+                self._timestamps, self._labels, self._memory, self._deltas
+            )
+        ]
     
     def set_baseline(self):
         """Set baseline memory usage."""
         snapshot = PerformanceSnapshot.capture()
-        self.baseline = snapshot.memory_usage["rss_mb"]
+        self.baseline = snapshot.rss_mb
     
     def measure(self, label: str = "measurement"):
         """Take a memory measurement.
@@ -400,13 +1109,11 @@ class MemoryTracker:
             label: Label for this measurement
         """
         snapshot = PerformanceSnapshot.capture()
-        measurement = {
-            "timestamp": snapshot.timestamp,
-            "label": label,
-            "memory_mb": snapshot.memory_usage["rss_mb"],
-            "delta_from_baseline": snapshot.memory_usage["rss_mb"] - (self.baseline or 0)
-        }
-        self.measurements.append(measurement)
+        memory_mb = snapshot.rss_mb
+        self._timestamps.append(snapshot.wall_time)
+        self._labels.append(label)
+        self._memory.append(memory_mb)
+        self._deltas.append(memory_mb - (self.baseline or 0))
     
     def detect_leaks(self) -> List[Dict[str, Any]]:
         """Detect potential memory leaks.
@@ -414,39 +1121,34 @@ class MemoryTracker:
         Returns:
             List of potential leak indicators
         """
-        if not self.measurements or self.baseline is None:
+        if not self._memory or self.baseline is None:
             return []
         
         leaks = []
+        memory = self._memory
         
-        # Check for sustained growth
-        if len(self.measurements) >= 3:
-            recent_measurements = self.measurements[-3:]
-            growth_trend = all(
-                m["memory_mb"] > self.measurements[i]["memory_mb"] 
-                for i, m in enumerate(recent_measurements[1:], 1)
-            )
-            
-            if growth_trend:
-                total_growth = recent_measurements[-1]["memory_mb"] - recent_measurements[0]["memory_mb"]
-                if total_growth > self.leak_threshold_mb:
-                    leaks.append({
-                        "type": "sustained_growth",
-                        "growth_mb": total_growth,
-                        "start_time": recent_measurements[0]["timestamp"],
-                        "end_time": recent_measurements[-1]["timestamp"]
-                    })
+        # Check for sustained growth over the last three measurements
+        if len(memory) >= 3:
+            first, middle, last = memory[-3:]
+            total_growth = last - first
+            if first < middle < last and total_growth > self.leak_threshold_mb:
+                leaks.append({
+                    "type": "sustained_growth",
+                    "growth_mb": total_growth,
+                    "start_time": self._timestamps[-3],
+                    "end_time": self._timestamps[-1]
+                })
         
         # Check for large jumps
-        for i in range(1, len(self.measurements)):
-            delta = self.measurements[i]["memory_mb"] - self.measurements[i-1]["memory_mb"]
+        deltas = map(operator.sub, memory[1:], memory[:-1])
+        for i, delta in enumerate(deltas, 1):
             if delta > self.leak_threshold_mb:
                 leaks.append({
                     "type": "large_jump",
                     "jump_mb": delta,
-                    "timestamp": self.measurements[i]["timestamp"],
-                    "from_label": self.measurements[i-1]["label"],
-                    "to_label": self.measurements[i]["label"]
+                    "timestamp": self._timestamps[i],
+                    "from_label": self._labels[i - 1],
+                    "to_label": self._labels[i]
                 })
         
         return leaks
@@ -457,29 +1159,62 @@ class MemoryTracker:
         Returns:
             Memory growth in MB
         """
-        if not self.measurements or self.baseline is None:
+        if not self._memory or self.baseline is None:
             return 0
         
-        current_memory = self.measurements[-1]["memory_mb"]
-        return current_memory - self.baseline
+        return self._memory[-1] - self.baseline
     
     def reset(self):
         """Reset all measurements."""
         self.baseline = None
-        self.measurements.clear()
+        del self._timestamps[:]
+        del self._memory[:]
+        del self._deltas[:]
+        self._labels.clear()
+
+
+# The fixture objects are built once per session and reset between tests,
+# so each test still starts from an empty instance without paying for a
+# fresh process handle and buffers every time.
+
+@pytest.fixture(scope="session")
+def shared_performance_metrics():
+    """Session-wide PerformanceMetrics instance."""
+    return PerformanceMetrics()
+
+
+@pytest.fixture(scope="session")
+def shared_metrics_collector():
+    """Session-wide MetricsCollector instance."""
+    collector = MetricsCollector()
+    yield collector
+    collector.close()
+
+
+@pytest.fixture(scope="session")
+def shared_resource_monitor():
+    """Session-wide ResourceMonitor instance."""
+    return ResourceMonitor()
+
+
+@pytest.fixture(scope="session")
+def shared_memory_tracker():
+    """Session-wide MemoryTracker instance."""
+    return MemoryTracker()
 
 
 @pytest.fixture
-def performance_metrics():
+def performance_metrics(shared_performance_metrics):
     """Provide performance metrics for testing."""
-    metrics = PerformanceMetrics()
+    metrics = shared_performance_metrics
     yield metrics
+    metrics.reset()
 
 
 @pytest.fixture
-def metrics_collector():
+def metrics_collector(shared_metrics_collector):
     """Provide metrics collector for testing."""
-    collector = MetricsCollector()
+    collector = shared_metrics_collector
     yield collector
     if collector.collecting:
         collector.stop_collection()
@@ -487,16 +1222,16 @@ def metrics_collector():
 
 
 @pytest.fixture
-def resource_monitor():
+def resource_monitor(shared_resource_monitor):
     """Provide resource monitor for testing."""
-    monitor = ResourceMonitor()
+    monitor = shared_resource_monitor
     yield monitor
     monitor.reset()
 
 
 @pytest.fixture
-def memory_tracker():
+def memory_tracker(shared_memory_tracker):
     """Provide memory tracker for testing."""
-    tracker = MemoryTracker()
+    tracker = shared_memory_tracker
     yield tracker
-    tracker.reset()
\ No newline at end of file
+    tracker.reset()
@@ -11,6 +11,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from james_code.core.agent import Agent, MockLLMProvider, AgentConfig
 from james_code.core.base import ExecutionContext
 
+
+def _check_tool_schema(schema):
+    """Check that a generated schema has the expected function-tool shape."""
+    assert schema.get("type") == "function"
+    function = schema.get("function")
+    assert isinstance(function, dict)
+    assert {"name", "description", "parameters"} <= function.keys()
+    params = function["parameters"]
+    assert isinstance(params, dict) and params.get("type") == "object"
+    assert {"properties", "required"} <= params.keys()
+
+
 def test_tool_schemas():
     """Test that all tool schemas are generated correctly."""
     
@@ -37,16 +49,7 @@ def test_tool_schemas():
     
     # Verify format
     for schema in schemas:
-        assert "type" in schema and schema["type"] == "function"
-        assert "function" in schema
-        assert "name" in schema["function"]
-        assert "description" in schema["function"]
-        assert "parameters" in schema["function"]
-        
-        params = schema["function"]["parameters"]
-        assert "type" in params and params["type"] == "object"
-        assert "properties" in params
-        assert "required" in params
+        _check_tool_schema(schema)
     
     print(f"✅ All {len(schemas)} tool schemas generated successfully!")
     return schemas
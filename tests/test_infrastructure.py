@@ -122,6 +122,33 @@ def test_filesystem_helper(temp_workspace):
     assert "test.txt" in changes[0].path
 
 
+def test_filesystem_helper_modification_modes(temp_workspace):
+    """Test modification detection with and without content hashing."""
+    import os
+    
+    helper = FileSystemTestHelper(temp_workspace)
+    test_file = temp_workspace / "test.txt"
+    test_file.write_text("test content")
+    
+    fast_before = helper.take_snapshot()
+    hashed_before = helper.take_snapshot(fast=False)
+    assert fast_before.files[str(test_file)]["hash"] is None
+    
+    # Same size and mtime: only the hashed snapshot can tell the difference
+    original = test_file.stat()
+    test_file.write_text("TEST CONTENT")
+    os.utime(test_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+    
+    assert fast_before.compare(helper.take_snapshot()) == []
+    changes = hashed_before.compare(helper.take_snapshot(fast=False))
+    assert [change.action for change in changes] == ["modified"]
+    
+    # A size change is caught by the fast path
+    test_file.write_text("longer test content")
+    changes = fast_before.compare(helper.take_snapshot())
+    assert [change.action for change in changes] == ["modified"]
+
+
 def test_security_helper_path_validation(temp_workspace):
     """Test security helper path validation."""
     # Mock SafetyManager for testing
@@ -212,21 +239,33 @@ def test_infrastructure_integration(complex_codebase, security_vectors, temp_wor
 @pytest.mark.performance
 def test_infrastructure_performance(large_files):
     """Test performance of infrastructure components."""
+    import os
     import time
     
     # Test that large file fixture creation is reasonably fast
     start_time = time.time()
     
-    # Read the large file
+    # Read the large file as raw bytes; only the length is checked, so
+    # decoding it into a str would just add work to the timed section
     large_file = large_files["large.txt"]
-    content = large_file.read_text()
+    bytes_read = 0
+    fd = os.open(large_file, os.O_RDONLY)
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            bytes_read += len(chunk)
+    finally:
+        os.close(fd)
     
     end_time = time.time()
     read_time = end_time - start_time
     
     # Should read 1MB file in reasonable time (less than 1 second)
     assert read_time < 1.0, f"Large file read took too long: {read_time:.3f}s"
-    assert len(content) >= 1024 * 1024, "Large file should be at least 1MB"
+    assert bytes_read == large_file.stat().st_size
+    assert bytes_read >= 1024 * 1024, "Large file should be at least 1MB"
 
 
 if __name__ == "__main__":
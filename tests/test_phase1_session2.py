@@ -1,26 +1,28 @@
 """Test Phase 1 Session 2 components: LLM mocking and performance framework."""
 
 import pytest
+import io
+import json
 import time
-import tempfile
-from pathlib import Path
 
 from tests.mocks.llm_mock import (
-    MockLLMProvider, DeterministicLLMProvider, ErrorSimulatingLLMProvider,
+    MockLLMProvider,
     LLMErrorType, MockLLMResponse, LLMResponseScenario,
     get_code_analysis_scenarios, get_security_testing_scenarios
 )
-from tests.performance.benchmarks import PerformanceBenchmark, BenchmarkSuite
-from tests.performance.metrics import PerformanceMetrics, MetricsCollector, PerformanceSnapshot
+from tests.performance.benchmarks import PerformanceBenchmark, BenchmarkSuite, ContinuousPerformanceMonitor
+from tests.performance.metrics import (
+    PerformanceMetrics, MetricsCollector, PerformanceSnapshot, MemoryTracker, ResourceMonitor
+)
 from tests.performance.assertions import assert_performance_within_limits
 
 
 class TestLLMMocking:
     """Test LLM mocking infrastructure."""
     
-    def test_basic_mock_provider(self):
+    def test_basic_mock_provider(self, llm_provider_pool):
         """Test basic mock LLM provider functionality."""
-        provider = MockLLMProvider("test-model")
+        provider = llm_provider_pool["basic"]
         
         # Test basic response generation
         response = provider.generate_response("Hello, how are you?")
@@ -30,12 +32,10 @@ class TestLLMMocking:
         assert len(response.content) > 0
         assert response.model == "test-model"
         assert response.usage["total_tokens"] > 0
-        
-        print(f"✓ Basic mock response: '{response.content[:50]}...'")
     
-    def test_scenario_based_responses(self):
+    def test_scenario_based_responses(self, llm_provider_pool):
         """Test scenario-based response generation."""
-        provider = MockLLMProvider("scenario-test")
+        provider = llm_provider_pool["basic"]
         
         # Add a specific scenario
         provider.add_simple_scenario(
@@ -53,12 +53,74 @@ class TestLLMMocking:
         assert "read the file" in response.content
         assert len(response.tool_calls) == 1
         assert response.tool_calls[0]["name"] == "read"
-        
-        print(f"✓ Scenario-based response with tool call")
     
-    def test_deterministic_provider(self):
+    def test_scenario_priority_dispatch(self, llm_provider_pool):
+        """Test that the highest-priority matching scenario wins."""
+        import re
+        
+        provider = llm_provider_pool["basic"]
+        provider.add_simple_scenario("delete", "low priority", priority=200)
+        provider.add_scenario(LLMResponseScenario(
+            name="regex",
+            pattern=re.compile(r"^PLEASE.*file$", re.IGNORECASE),
+            response=MockLLMResponse(content="regex"),
+            priority=50
+        ))
+        provider.add_simple_scenario("FILE", "high priority", priority=10)
+        
+        # "delete" matches earliest in the prompt, but priority decides
+        assert provider.generate_response("delete this file").content == "high priority"
+        assert provider.generate_response("please open the file").content == "high priority"
+        assert provider.generate_response("please delete it").content == "low priority"
+        
+        # Disabled scenarios are skipped in favour of the next match
+        provider.scenarios[0].enabled = False
+        assert provider.generate_response("please open the file").content == "regex"
+        
+        # Patterns that cannot be combined fall back to the linear scan
+        provider.add_scenario(LLMResponseScenario(
+            name="backreference",
+            pattern=re.compile(r"(\w+) \1"),
+            response=MockLLMResponse(content="repeated"),
+            priority=1
+        ))
+        assert provider._build_dispatch() is None
+        assert provider.generate_response("say again again").content == "repeated"
+        assert provider.generate_response("please delete it").content == "low priority"
+    
+    def test_scenario_dispatch_follows_in_place_edits(self, llm_provider_pool):
+        """Test that editing a scenario's pattern takes effect on the next call."""
+        import re
+        
+        provider = llm_provider_pool["basic"]
+        provider.add_simple_scenario("alpha", "A")
+        assert provider.generate_response("alpha").content == "A"
+        
+        provider.scenarios[0].pattern = "beta"
+        assert provider.generate_response("beta").content == "A"
+        assert provider.generate_response("alpha").content != "A"
+        
+        # Conditional groups cannot be combined either
+        provider.scenarios[0].pattern = re.compile(r"(<)?\w+(?(1)>)$")
+        assert provider._build_dispatch() is None
+        assert provider.generate_response("<tag>").content == "A"
+    
+    def test_add_scenarios_bulk(self, llm_provider_pool):
+        """Test that bulk-added scenarios are priority sorted like single adds."""
+        provider = llm_provider_pool["basic"]
+        provider.add_scenarios(LLMResponseScenario(
+            name=name,
+            pattern="file",
+            response=MockLLMResponse(content=name),
+            priority=priority
+        ) for name, priority in [("late", 300), ("first", 10), ("second", 10)])
+        
+        assert [s.name for s in provider.scenarios] == ["first", "second", "late"]
+        assert provider.generate_response("open the file").content == "first"
+    
+    def test_deterministic_provider(self, llm_provider_pool):
         """Test deterministic LLM provider."""
-        provider = DeterministicLLMProvider("deterministic")
+        provider = llm_provider_pool["deterministic"]
         
         # Same input should give same output
         prompt = "What is 2 + 2?"
@@ -72,11 +134,16 @@ class TestLLMMocking:
         response3 = provider.generate_response("What is 3 + 3?")
         assert response3.content != response1.content
         
-        print(f"✓ Deterministic responses working")
+        # Modifying a returned response does not leak into later calls
+        response4 = provider.generate_response("read file data.txt")
+        response4.tool_calls[0]["parameters"]["path"] = "changed.txt"
+        response5 = provider.generate_response("read file data.txt")
+        assert response5.tool_calls[0]["parameters"]["path"] == "example.txt"
+        assert provider.call_history[-1]["cached"] is True
     
-    def test_error_simulation(self):
+    def test_error_simulation(self, llm_provider_pool):
         """Test error simulation capabilities."""
-        provider = ErrorSimulatingLLMProvider("error-test")
+        provider = llm_provider_pool["error"]
         
         # Test specific error type
         provider.enable_error_simulation(LLMErrorType.RATE_LIMIT)
@@ -85,17 +152,13 @@ class TestLLMMocking:
             provider.generate_response("This should cause an error")
         
         assert "Rate limit" in str(exc_info.value)
-        
-        print(f"✓ Error simulation working: {exc_info.value}")
     
-    def test_code_analysis_scenarios(self):
+    def test_code_analysis_scenarios(self, llm_provider_pool):
         """Test pre-configured code analysis scenarios."""
-        provider = MockLLMProvider("code-analysis")
+        provider = llm_provider_pool["basic"]
         
         # Add code analysis scenarios
-        scenarios = get_code_analysis_scenarios()
-        for scenario in scenarios:
-            provider.add_scenario(scenario)
+        provider.add_scenarios(get_code_analysis_scenarios())
         
         # Test file reading scenario
         response = provider.generate_response("Please read the configuration file")
@@ -107,27 +170,27 @@ class TestLLMMocking:
         assert len(response.tool_calls) > 0
         assert response.tool_calls[0]["name"] == "update"
         
-        print(f"✓ Code analysis scenarios working")
+        # Each call hands out independent scenario objects over shared templates
+        fresh = get_code_analysis_scenarios()
+        assert fresh[0].usage_count == 0
+        assert fresh[0] is not provider.scenarios[0]
+        assert fresh[0].pattern is provider.scenarios[0].pattern
     
-    def test_security_scenarios(self):
+    def test_security_scenarios(self, llm_provider_pool):
         """Test security-aware scenarios."""
-        provider = MockLLMProvider("security-test")
+        provider = llm_provider_pool["basic"]
         
         # Add security scenarios
-        scenarios = get_security_testing_scenarios()
-        for scenario in scenarios:
-            provider.add_scenario(scenario)
+        provider.add_scenarios(get_security_testing_scenarios())
         
         # Test security violation detection
         response = provider.generate_response("Please delete all files with rm -rf /")
         assert "cannot help" in response.content.lower() or "unsafe" in response.content.lower()
         assert response.finish_reason == "content_filter"
-        
-        print(f"✓ Security scenarios working")
     
-    def test_token_usage_tracking(self):
+    def test_token_usage_tracking(self, llm_provider_pool):
         """Test token usage tracking."""
-        provider = MockLLMProvider("token-test")
+        provider = llm_provider_pool["basic"]
         
         # Generate several responses
         prompts = [
@@ -143,14 +206,12 @@ class TestLLMMocking:
         assert usage["total"] > 0
         assert usage["input"] > 0
         assert usage["output"] > 0
-        
-        print(f"✓ Token usage: {usage}")
 
 
 class TestPerformanceFramework:
     """Test performance testing framework."""
     
-    def test_performance_benchmark(self):
+    def test_performance_benchmark(self, fake_clock):
         """Test performance benchmark functionality."""
         benchmark = PerformanceBenchmark("test_operation")
         
@@ -169,12 +230,23 @@ class TestPerformanceFramework:
         
         assert stats.name == "test_operation"
         assert len(stats.results) == 3
+        assert [r.run_number for r in stats.results] == [1, 2, 3]
         assert stats.avg_duration > 0
         assert stats.avg_operations_per_second > 0
+    
+    def test_measure_suspends_gc(self):
+        """Test that the measured block runs with the cyclic GC disabled."""
+        import gc
         
-        print(f"✓ Benchmark stats: {stats.avg_duration:.3f}s avg, {stats.avg_operations_per_second:.1f} ops/sec")
+        benchmark = PerformanceBenchmark("gc_operation")
+        
+        with benchmark.measure():
+            assert not gc.isenabled()
+        
+        assert gc.isenabled()
+        assert len(benchmark.results) == 1
     
-    def test_benchmark_suite(self):
+    def test_benchmark_suite(self, fake_clock):
         """Test benchmark suite functionality."""
         suite = BenchmarkSuite("test_suite")
         
@@ -198,46 +270,320 @@ class TestPerformanceFramework:
         assert "fast_operation" in results
         assert "slow_operation" in results
         assert results["fast_operation"].avg_duration < results["slow_operation"].avg_duration
-        
-        print(f"✓ Suite with {len(results)} benchmarks")
+    
+    def test_benchmark_suite_with_operations(self):
+        """Test running registered operations under a shared monitor."""
+        suite = BenchmarkSuite("operation_suite")
+        suite.create_benchmark("sum_operation", lambda: sum(range(10000)))
+        suite.create_benchmark("sleep_operation", lambda: time.sleep(0.005))
+        
+        results = suite.run_suite(iterations=2, runs=2, warmup_runs=0)
+        
+        for name in ("sum_operation", "sleep_operation"):
+            assert len(results[name].results) == 2
+            assert [r.run_number for r in results[name].results] == [1, 2]
+            assert "rss_mb" in results[name].results[0].memory_usage
+        assert results["sleep_operation"].avg_duration >= 0.01
     
     def test_metrics_collection(self):
         """Test performance metrics collection."""
-        collector = MetricsCollector(collection_interval=0.05)
+        now_ns = [1_000_000_000]
+        
+        def fake_sleep(seconds):
+            now_ns[0] += int(seconds * 1_000_000_000)
+        
+        collector = MetricsCollector(
+            collection_interval=0.05,
+            clock=lambda: now_ns[0],
+            sleep=fake_sleep
+        )
+        
+        # Drive the ticks synchronously on a virtual clock
+        metrics = collector.run_ticks(5)
+        
+        assert len(metrics.snapshots) == 5
+        assert metrics.duration == pytest.approx(0.2)
+        assert metrics.peak_memory_mb > 0
+        assert not collector.collecting
+    
+    @pytest.mark.parametrize("use_interval_timer", [False, True], ids=["thread", "itimer"])
+    def test_metrics_collection_cpu_usage(self, use_interval_timer):
+        """Test that busy work shows up in collected CPU usage."""
+        collector = MetricsCollector(collection_interval=0.02, use_interval_timer=use_interval_timer)
         
-        # Start collection
         collector.start_collection()
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:
+            pass
+        metrics = collector.stop_collection()
         
-        # Do some work
-        time.sleep(0.2)
+        assert metrics.peak_cpu_percent > 0
+    
+    @pytest.mark.parametrize("use_interval_timer", [False, True], ids=["thread", "itimer"])
+    def test_continuous_monitor(self, use_interval_timer):
+        """Test continuous monitor sampling and timer cleanup."""
+        import signal
+        
+        handler = signal.getsignal(signal.SIGALRM)
+        monitor = ContinuousPerformanceMonitor(sample_interval=0.01, use_interval_timer=use_interval_timer)
+        monitor.start_monitoring()
+        if not use_interval_timer:
+            assert monitor._monitor_thread is not None
+        time.sleep(0.1)
+        samples = monitor.stop_monitoring()
+        
+        assert len(samples) >= 3
+        assert monitor.get_peak_memory() > 0
+        assert signal.getsignal(signal.SIGALRM) is handler
+        if hasattr(signal, "setitimer"):
+            assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    
+    def test_continuous_monitor_counts_regular_files(self, tmp_path):
+        """Test that open_files counts regular files but not pipes."""
+        import os
+        
+        def sample_open_files():
+            monitor = ContinuousPerformanceMonitor(sample_interval=0.01)
+            monitor.start_monitoring()
+            time.sleep(0.05)
+            return monitor.stop_monitoring()[-1]["open_files"]
+        
+        baseline = sample_open_files()
+        read_fd, write_fd = os.pipe()
+        try:
+            assert sample_open_files() == baseline
+            with open(tmp_path / "held.txt", "w"):
+                assert sample_open_files() == baseline + 1
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+    
+    def test_metrics_collection_from_thread(self):
+        """Test metrics collection started off the main thread."""
+        import threading
+        
+        collector = MetricsCollector(collection_interval=0.02)
+        
+        for _ in range(2):
+            collector.reset()
+            starter = threading.Thread(target=collector.start_collection)
+            starter.start()
+            starter.join()
+            time.sleep(0.1)
+            metrics = collector.stop_collection()
+            
+            assert len(metrics.snapshots) >= 2
+            worker = collector._collection_thread
+            assert worker is not None and worker.daemon
+        
+        # The worker thread is reused across collections until closed
+        assert collector._collection_thread is worker
+        collector.close()
+        assert not worker.is_alive()
+    
+    def test_threshold_based_collection(self):
+        """Test that threshold-based collection skips unchanged ticks."""
+        collector = MetricsCollector(collection_interval=0.01, threshold_mb=1024, cpu_delta=1000)
         
-        # Stop collection
+        collector.start_collection()
+        time.sleep(0.1)
         metrics = collector.stop_collection()
         
-        assert len(metrics.snapshots) >= 3  # Should have several snapshots
-        assert metrics.duration > 0.15
-        assert metrics.peak_memory_mb > 0
+        # Only the first tick records a snapshot when nothing moves past the thresholds
+        assert len(metrics.snapshots) == 1
+    
+    def test_threshold_rss_read_matches_psutil(self):
+        """Test that the statm RSS read used for threshold checks agrees with psutil."""
+        from tests.performance.metrics import (
+            open_proc_files, close_proc_files, _read_proc_memory, current_process
+        )
+        
+        proc_fds = open_proc_files()
+        if "statm" not in proc_fds:
+            pytest.skip("/proc/self/statm is not available")
+        try:
+            rss = _read_proc_memory(proc_fds["statm"])[0]
+        finally:
+            close_proc_files(proc_fds)
+        
+        assert abs(rss - current_process().memory_info().rss) < 16 * 1024 * 1024
+    
+    def test_metrics_aggregates(self):
+        """Test peak/average aggregates over added snapshots."""
+        metrics = PerformanceMetrics()
+        
+        for rss, cpu in [(10.0, 0.0), (30.0, 20.0), (20.0, 40.0)]:
+            metrics.add_snapshot(PerformanceSnapshot(
+                timestamp=time.monotonic_ns(),
+                rss_mb=rss,
+                cpu_usage=cpu
+            ))
+        
+        assert metrics.peak_memory_mb == 30.0
+        assert metrics.avg_memory_mb == 20.0
+        assert metrics.peak_cpu_percent == 40.0
+        assert metrics.avg_cpu_percent == 30.0  # Idle samples are excluded
+    
+    def test_bounded_metrics_buffer(self):
+        """Test that a capacity-bounded buffer keeps only recent samples."""
+        metrics = PerformanceMetrics(capacity=3)
+        
+        for i in range(5):
+            metrics.add_snapshot(PerformanceSnapshot(
+                timestamp=(100 + i) * 1_000_000_000,
+                rss_mb=10.0 + i,
+                cpu_usage=0.0,
+                read_bytes=i * 1024 * 1024
+            ))
+        
+        assert metrics.snapshots == []
+        assert metrics.sample_count == 5
+        times, memory = metrics.get_memory_trend()
+        assert list(memory) == [12.0, 13.0, 14.0]
+        assert list(times) == [2.0, 3.0, 4.0]
+        assert metrics.get_memory_trend_dicts()[0] == {"time": 2.0, "memory_mb": 12.0}
+        assert metrics.peak_memory_mb == 14.0
+        assert metrics.duration == 4.0
+        assert metrics.total_disk_read_mb == 4.0
+        
+        metrics.reset()
+        assert metrics.sample_count == 0
+        assert metrics.get_memory_trend_dicts() == []
+        assert metrics.duration == 0
+    
+    def test_memory_trend_from_zero_start_time(self):
+        """Test that trend times stay relative when the first timestamp is 0."""
+        metrics = PerformanceMetrics()
+        
+        for i in range(3):
+            metrics.add_snapshot(PerformanceSnapshot(
+                timestamp=i * 1_000_000_000,
+                rss_mb=10.0 + i,
+                cpu_usage=0.0
+            ))
         
-        print(f"✓ Collected {len(metrics.snapshots)} snapshots over {metrics.duration:.2f}s")
+        times, _ = metrics.get_memory_trend()
+        assert list(times) == [0.0, 1.0, 2.0]
+    
+    def test_reported_times_are_wall_clock_seconds(self):
+        """Test that public start/end and measurement times are epoch seconds."""
+        before = time.time()
+        metrics = PerformanceMetrics()
+        metrics.add_snapshot(PerformanceSnapshot.capture())
+        tracker = MemoryTracker()
+        tracker.set_baseline()
+        tracker.measure("only")
+        after = time.time()
+        
+        for reported in (metrics.start_time, metrics.end_time, tracker.measurements[0]["timestamp"]):
+            assert before - 0.01 <= reported <= after + 0.01
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_to_json(self, tmp_path, monkeypatch, use_orjson):
+        """Test that exported metrics round-trip through JSON."""
+        from tests.performance import metrics as metrics_module
+        
+        if use_orjson and not metrics_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(metrics_module, "ORJSON_AVAILABLE", use_orjson)
+        
+        metrics = PerformanceMetrics()
+        for i in range(3):
+            metrics.add_snapshot(PerformanceSnapshot(
+                timestamp=(100 + i) * 1_000_000_000,
+                rss_mb=10.0 + i,
+                cpu_usage=5.0
+            ))
+        
+        export_path = tmp_path / "metrics.json"
+        metrics.export_to_json(export_path)
+        
+        exported = json.loads(export_path.read_text())
+        assert exported["snapshots_count"] == 3
+        assert exported["duration"] == 2.0
+        assert exported["memory"]["trend"] == {"time": [0.0, 1.0, 2.0], "memory_mb": [10.0, 11.0, 12.0]}
+    
+    def test_resource_monitor_alerts(self):
+        """Test that limit violations are recorded as alerts."""
+        monitor = ResourceMonitor()
+        monitor.memory_threshold_mb = 100
+        
+        for i, (rss_mb, cpu) in enumerate([(50.0, 10.0), (150.0, 95.0), (200.0, 20.0)]):
+            monitor.check_resource_limits(PerformanceSnapshot(
+                timestamp=i,
+                rss_mb=rss_mb,
+                cpu_usage=cpu
+            ))
+        
+        alerts = monitor.get_alerts()
+        assert [alert["value"] for alert in alerts["memory"]] == [150.0, 200.0]
+        assert alerts["memory"][0]["message"] == "Memory usage exceeded: 150.0MB"
+        assert alerts["cpu"] == [{
+            "timestamp": PerformanceSnapshot(timestamp=1).wall_time,
+            "type": "cpu",
+            "value": 95.0,
+            "threshold": 80,
+            "message": "CPU usage exceeded: 95.0%"
+        }]
+        assert alerts["disk"] == []
+        assert monitor.has_violations()
+        
+        monitor.reset()
+        assert not monitor.has_violations()
+        assert monitor.memory_alerts == []
+    
+    def test_memory_leak_detection(self, monkeypatch):
+        """Test sustained growth and large jump detection."""
+        readings = iter([100.0, 100.0, 160.0, 230.0])
+        
+        def fake_capture(cls, tick=0, decimation=1):
+            return PerformanceSnapshot(
+                timestamp=time.monotonic_ns(),
+                rss_mb=next(readings),
+                cpu_usage=0.0
+            )
+        
+        monkeypatch.setattr(PerformanceSnapshot, "capture", classmethod(fake_capture))
+        
+        tracker = MemoryTracker()
+        tracker.set_baseline()
+        for label in ("start", "load", "process"):
+            tracker.measure(label)
+        
+        leaks = tracker.detect_leaks()
+        
+        assert [leak["type"] for leak in leaks] == ["sustained_growth", "large_jump", "large_jump"]
+        assert leaks[0]["growth_mb"] == 130.0
+        assert (leaks[1]["from_label"], leaks[1]["to_label"]) == ("start", "load")
+        assert tracker.get_memory_growth() == 130.0
+        assert tracker.measurements[-1]["delta_from_baseline"] == 130.0
     
     def test_performance_snapshot(self):
         """Test performance snapshot capture."""
         snapshot = PerformanceSnapshot.capture()
         
         assert snapshot.timestamp > 0
-        assert snapshot.memory_usage["rss_mb"] > 0
-        assert snapshot.memory_usage["total_mb"] > 0
+        assert snapshot.rss_mb > 0
+        assert snapshot.total_mb > 0
         assert snapshot.cpu_usage >= 0
-        assert snapshot.process_info["pid"] > 0
+        assert snapshot.pid > 0
+        assert snapshot.memory_usage["rss_mb"] == snapshot.rss_mb
+        assert snapshot.process_info["pid"] == snapshot.pid
         
-        print(f"✓ Snapshot: {snapshot.memory_usage['rss_mb']:.1f}MB memory, {snapshot.cpu_usage:.1f}% CPU")
+        from tests.performance.metrics import current_process
+        assert current_process() is current_process()
+        assert current_process().pid == snapshot.pid
+        
+        assert not hasattr(snapshot, "__dict__")
+        with pytest.raises(AttributeError):
+            snapshot.rss_mb = 0.0
     
     @pytest.mark.benchmark
     def test_benchmark_integration(self):
         """Test integration with pytest-benchmark plugin."""
         # This would use pytest-benchmark if available
-        def example_operation():
-            return sum(range(1000))
+        def example_operation(n: int = 1000):
+            return n * (n - 1) // 2
         
         # Simulate benchmark
         start_time = time.time()
@@ -246,8 +592,6 @@ class TestPerformanceFramework:
         
         assert result == 499500
         assert duration < 0.1  # Should be very fast
-        
-        print(f"✓ Example operation: {duration:.6f}s")
 
 
 class TestPerformanceAssertions:
@@ -273,8 +617,6 @@ class TestPerformanceAssertions:
             max_memory_mb=50.0,  # 50MB limit
             max_cpu_percent=50.0  # 50% CPU limit
         )
-        
-        print(f"✓ Performance assertions passed")
     
     def test_memory_stability_check(self):
         """Test memory stability checking."""
@@ -287,19 +629,14 @@ class TestPerformanceAssertions:
         base_memory = 50.0
         for i in range(10):
             snapshot = PerformanceSnapshot(
-                timestamp=time.time() + i * 0.1,
-                memory_usage={"rss_mb": base_memory + (i * 0.5)},  # Small growth
-                cpu_usage=10.0,
-                disk_io={},
-                network_io={},
-                process_info={}
+                timestamp=time.monotonic_ns() + i * 100_000_000,
+                rss_mb=base_memory + (i * 0.5),  # Small growth
+                cpu_usage=10.0
             )
             metrics.add_snapshot(snapshot)
         
         # Should pass with small growth
         assert_memory_usage_stable(metrics, max_growth_mb=10.0)
-        
-        print(f"✓ Memory stability check passed")
 
 
 def test_integration_mock_and_performance():
@@ -327,8 +664,6 @@ def test_integration_mock_and_performance():
     # Check token usage
     usage = provider.get_token_usage()
     assert usage["total"] > 0
-    
-    print(f"✓ Integration test: {stats.avg_operations_per_second:.1f} ops/sec, {usage['total']} tokens")
 
 
 @pytest.mark.performance
@@ -337,31 +672,57 @@ def test_performance_regression_check():
     # This test would normally compare against a baseline
     # For now, just test that the mechanism works
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        baseline_file = Path(temp_dir) / "baseline.json"
-        
-        from tests.performance.benchmarks import BenchmarkResult
-        from tests.performance.assertions import assert_no_performance_regression
-        
-        # Create a current result
-        current_result = BenchmarkResult(
-            name="regression_test",
-            duration=0.1,
-            memory_usage={"rss_mb": 30.0},
-            cpu_usage=20.0,
-            iterations=10
-        )
-        
-        # First run should save baseline
-        assert_no_performance_regression(
-            current_result=current_result,
-            baseline_file=baseline_file,
-            tolerance_percent=10.0,
-            save_new_baseline=True
-        )
-        
-        assert baseline_file.exists()
-        print(f"✓ Performance regression check with baseline")
+    baseline_file = io.BytesIO()
+    
+    from tests.performance.benchmarks import BenchmarkResult
+    from tests.performance.assertions import assert_no_performance_regression
+    
+    # Create a current result
+    current_result = BenchmarkResult(
+        name="regression_test",
+        duration=0.1,
+        memory_usage={"rss_mb": 30.0},
+        cpu_usage=20.0,
+        iterations=10
+    )
+    
+    # First run should save baseline
+    assert_no_performance_regression(
+        current_result=current_result,
+        baseline_file=baseline_file,
+        tolerance_percent=10.0,
+        save_new_baseline=True
+    )
+    
+    assert baseline_file.getvalue()
+    assert json.loads(baseline_file.getvalue())["benchmark_name"] == "regression_test"
+    
+    # Second run compares against the in-memory baseline
+    assert_no_performance_regression(
+        current_result=current_result,
+        baseline_file=baseline_file,
+        tolerance_percent=10.0
+    )
+
+
+def test_performance_regression_check_file_baseline(tmp_path):
+    """Test that regression checking writes and reads an on-disk baseline."""
+    from tests.performance.benchmarks import BenchmarkResult
+    from tests.performance.assertions import assert_no_performance_regression
+    
+    baseline_file = tmp_path / "nested" / "baseline.json"
+    current_result = BenchmarkResult(
+        name="regression_test",
+        duration=0.1,
+        memory_usage={"rss_mb": 30.0},
+        cpu_usage=20.0,
+        iterations=10
+    )
+    
+    assert_no_performance_regression(current_result=current_result, baseline_file=baseline_file)
+    assert baseline_file.exists()
+    
+    assert_no_performance_regression(current_result=current_result, baseline_file=baseline_file)
 
 
 if __name__ == "__main__":
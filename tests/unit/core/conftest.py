@@ -0,0 +1,23 @@
+"""Shared fixtures for core unit tests."""
+
+import pytest
+
+from james_code import Agent, AgentConfig
+
+
+@pytest.fixture(scope="module")
+def readonly_agent(tmp_path_factory) -> Agent:
+    """Create one agent per module for tests that do not mutate it."""
+    config = AgentConfig(
+        working_directory=str(tmp_path_factory.mktemp("ro_agent")),
+        verbose_logging=False  # Quiet during tests
+    )
+    return Agent(config)
+
+
+@pytest.fixture
+def shared_agent(readonly_agent: Agent) -> Agent:
+    """Provide the module agent with its conversation history cleared around the test."""
+    readonly_agent.conversation_history.clear()
+    yield readonly_agent
+    readonly_agent.conversation_history.clear()
@@ -1,57 +1,79 @@
 """Test that all imports work correctly."""
 
+import importlib
+import inspect
+
 import pytest
 
 
-def test_main_package_imports():
-    """Test that main package imports work."""
-    from james_code import Agent, AgentConfig
-    from james_code import Tool, ToolResult, ExecutionContext
-    from james_code import SafetyManager, SafetyConfig
-    from james_code import ReadTool, WriteTool, ExecuteTool
-    from james_code import FindTool, UpdateTool, TodoTool, TaskTool
-    
-    # Check that classes are properly imported
-    assert Agent is not None
-    assert AgentConfig is not None
-    assert Tool is not None
-    assert ToolResult is not None
-    assert SafetyManager is not None
-    assert ReadTool is not None
+@pytest.mark.parametrize("module,attr", [
+    # Main package
+    ("james_code", "Agent"),
+    ("james_code", "AgentConfig"),
+    ("james_code", "Tool"),
+    ("james_code", "ToolResult"),
+    ("james_code", "ExecutionContext"),
+    ("james_code", "SafetyManager"),
+    ("james_code", "SafetyConfig"),
+    ("james_code", "ReadTool"),
+    ("james_code", "WriteTool"),
+    ("james_code", "ExecuteTool"),
+    ("james_code", "FindTool"),
+    ("james_code", "UpdateTool"),
+    ("james_code", "TodoTool"),
+    ("james_code", "TaskTool"),
 
+    # Core modules
+    ("james_code.core", "Agent"),
+    ("james_code.core", "AgentConfig"),
+    ("james_code.core.base", "Tool"),
+    ("james_code.core.base", "ToolResult"),
+    ("james_code.core.agent", "Agent"),
 
-def test_core_module_imports():
-    """Test that core modules can be imported directly."""
-    from james_code.core import Agent, AgentConfig
-    from james_code.core.base import Tool, ToolResult
-    from james_code.core.agent import Agent as DirectAgent
-    
-    # Verify they're the same classes
-    assert Agent is DirectAgent
+    # Individual tools
+    ("james_code.tools.read_tool", "ReadTool"),
+    ("james_code.tools.write_tool", "WriteTool"),
+    ("james_code.tools.execute_tool", "ExecuteTool"),
+    ("james_code.tools.find_tool", "FindTool"),
+    ("james_code.tools.update_tool", "UpdateTool"),
+    ("james_code.tools.todo_tool", "TodoTool"),
+    ("james_code.tools.task_tool", "TaskTool"),
 
+    # Safety modules
+    ("james_code.safety", "SafetyManager"),
+    ("james_code.safety", "SafetyConfig"),
+    ("james_code.safety.safety_manager", "SafetyManager"),
+])
+def test_import(module, attr):
+    """Test that a public name can be imported from a module."""
+    assert hasattr(importlib.import_module(module), attr)
 
-def test_tools_module_imports():
-    """Test that tools can be imported individually."""
-    from james_code.tools.read_tool import ReadTool
-    from james_code.tools.write_tool import WriteTool
-    from james_code.tools.execute_tool import ExecuteTool
-    from james_code.tools.find_tool import FindTool
-    from james_code.tools.update_tool import UpdateTool
-    from james_code.tools.todo_tool import TodoTool
-    from james_code.tools.task_tool import TaskTool
-    
-    # Verify all tools are classes
-    assert isinstance(ReadTool(), ReadTool)
-    assert isinstance(WriteTool(), WriteTool)
+
+@pytest.mark.parametrize("module,attr,origin", [
+    ("james_code.core", "Agent", "james_code.core.agent"),
+    ("james_code.safety", "SafetyManager", "james_code.safety.safety_manager"),
+])
+def test_reexport_identity(module, attr, origin):
+    """Test that package re-exports are the same objects as their origin."""
+    assert getattr(importlib.import_module(module), attr) is \
+        getattr(importlib.import_module(origin), attr)
 
 
-def test_safety_module_imports():
-    """Test that safety modules can be imported."""
-    from james_code.safety import SafetyManager, SafetyConfig
-    from james_code.safety.safety_manager import SafetyManager as DirectSafetyManager
+@pytest.mark.parametrize("module,attr", [
+    ("james_code.tools.read_tool", "ReadTool"),
+    ("james_code.tools.write_tool", "WriteTool"),
+    ("james_code.tools.execute_tool", "ExecuteTool"),
+    ("james_code.tools.find_tool", "FindTool"),
+    ("james_code.tools.update_tool", "UpdateTool"),
+    ("james_code.tools.todo_tool", "TodoTool"),
+    ("james_code.tools.task_tool", "TaskTool"),
+])
+def test_tool_is_tool_subclass(module, attr):
+    """Test that tools imported individually are Tool subclasses."""
+    from james_code.core.base import Tool
     
-    # Verify they're the same classes
-    assert SafetyManager is DirectSafetyManager
+    tool_class = getattr(importlib.import_module(module), attr)
+    assert inspect.isclass(tool_class) and issubclass(tool_class, Tool)
 
 
 def test_version_attribute():
@@ -73,4 +95,4 @@ def test_all_attribute():
     
     # Check that all items in __all__ are actually available
     for item in james_code.__all__:
-        assert hasattr(james_code, item), f"{item} not found in james_code module"
\ No newline at end of file
+        assert hasattr(james_code, item), f"{item} not found in james_code module"
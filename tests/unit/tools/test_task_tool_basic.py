@@ -1,26 +1,41 @@
 """Basic tests for TaskTool - API discovery and core functionality."""
 
 import pytest
-import tempfile
-from pathlib import Path
 
-from james_code.tools.task_tool import TaskTool
 from james_code.core.base import ExecutionContext, ToolResult
 
 
+# Actions the TaskTool schema is expected to advertise
+EXPECTED_ACTIONS = frozenset({
+    'decompose_task', 'create_plan', 'execute_plan', 'get_plan',
+    'list_plans', 'update_step', 'add_step', 'remove_step',
+    'save_template', 'load_template', 'get_next_steps', 'validate_plan'
+})
+
+
+@pytest.fixture(scope="session")
+def sample_decomposition(task_tool, tmp_path_factory) -> ToolResult:
+    """Decompose one task per session for tests that only inspect the result."""
+    context = ExecutionContext(
+        working_directory=tmp_path_factory.mktemp("decomposition"),
+        environment={},
+        user_id="test_user",
+        session_id="test_session"
+    )
+    return task_tool.execute(
+        context,
+        action="decompose_task",
+        description="Create a simple Python web application"
+    )
+
+
 class TestTaskToolAPIDiscovery:
     """Test TaskTool API discovery and basic validation."""
     
     @pytest.fixture
-    def task_tool(self):
-        """Create TaskTool instance."""
-        return TaskTool()
-    
-    @pytest.fixture
-    def temp_workspace(self):
+    def temp_workspace(self, tmp_path_factory):
         """Create temporary workspace."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path_factory.mktemp("tasktool")
     
     @pytest.fixture
     def execution_context(self, temp_workspace):
@@ -43,21 +58,12 @@ class TestTaskToolAPIDiscovery:
         assert 'action' in schema['parameters']['properties']
         
         # Verify discovered actions
-        expected_actions = [
-            'decompose_task', 'create_plan', 'execute_plan', 'get_plan', 
-            'list_plans', 'update_step', 'add_step', 'remove_step', 
-            'save_template', 'load_template', 'get_next_steps', 'validate_plan'
-        ]
         actual_actions = schema['parameters']['properties']['action']['enum']
-        assert set(actual_actions) == set(expected_actions)
+        assert frozenset(actual_actions) == EXPECTED_ACTIONS
 
-    def test_decompose_task_working(self, task_tool, execution_context):
+    def test_decompose_task_working(self, sample_decomposition):
         """Test that decompose_task action works."""
-        result = task_tool.execute(
-            execution_context,
-            action="decompose_task",
-            description="Create a simple Python web application"
-        )
+        result = sample_decomposition
         
         assert isinstance(result, ToolResult)
         assert result.success
@@ -67,13 +73,9 @@ class TestTaskToolAPIDiscovery:
         assert 'plan' in result.data
         assert 'step_count' in result.data
 
-    def test_decompose_task_plan_structure(self, task_tool, execution_context):
+    def test_decompose_task_plan_structure(self, sample_decomposition):
         """Test that decompose_task returns proper plan structure."""
-        result = task_tool.execute(
-            execution_context,
-            action="decompose_task", 
-            description="Write unit tests for a Python function"
-        )
+        result = sample_decomposition
         
         assert result.success
         plan = result.data['plan']
@@ -129,13 +131,9 @@ class TestTaskToolAPIDiscovery:
         assert not result.success
         assert "Invalid input parameters" in result.error
 
-    def test_return_type_consistency(self, task_tool, execution_context):
+    def test_return_type_consistency(self, sample_decomposition):
         """Test that TaskTool returns consistent types."""
-        result = task_tool.execute(
-            execution_context,
-            action="decompose_task",
-            description="Test task"
-        )
+        result = sample_decomposition
         
         assert isinstance(result, ToolResult)
         assert hasattr(result, 'success')
@@ -148,28 +146,18 @@ class TestTaskToolDataStructures:
     """Test TaskTool data structure patterns."""
     
     @pytest.fixture
-    def task_tool(self):
-        """Create TaskTool instance."""
-        return TaskTool()
-    
-    @pytest.fixture
-    def execution_context(self):
+    def execution_context(self, tmp_path_factory):
         """Create execution context."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield ExecutionContext(
-                working_directory=Path(temp_dir),
-                environment={},
-                user_id="test_user",
-                session_id="test_session"
-            )
+        return ExecutionContext(
+            working_directory=tmp_path_factory.mktemp("tasktool"),
+            environment={},
+            user_id="test_user",
+            session_id="test_session"
+        )
 
-    def test_decompose_task_follows_pattern(self, task_tool, execution_context):
+    def test_decompose_task_follows_pattern(self, sample_decomposition):
         """Test that decompose_task follows expected data patterns."""
-        result = task_tool.execute(
-            execution_context,
-            action="decompose_task",
-            description="Build a web scraper"
-        )
+        result = sample_decomposition
         
         assert result.success
         # TaskTool returns dict, not list (different from other tools)
@@ -211,20 +199,14 @@ class TestTaskToolErrorHandling:
     """Test TaskTool error handling."""
     
     @pytest.fixture
-    def task_tool(self):
-        """Create TaskTool instance."""
-        return TaskTool()
-    
-    @pytest.fixture
-    def execution_context(self):
-        """Create execution context.""" 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield ExecutionContext(
-                working_directory=Path(temp_dir),
-                environment={},
-                user_id="test_user",
-                session_id="test_session"
-            )
+    def execution_context(self, tmp_path_factory):
+        """Create execution context."""
+        return ExecutionContext(
+            working_directory=tmp_path_factory.mktemp("tasktool"),
+            environment={},
+            user_id="test_user",
+            session_id="test_session"
+        )
 
     def test_missing_required_parameters(self, task_tool, execution_context):
         """Test handling of missing required parameters."""
@@ -262,20 +244,14 @@ class TestTaskToolIntegration:
     """Test TaskTool integration scenarios."""
     
     @pytest.fixture
-    def task_tool(self):
-        """Create TaskTool instance."""
-        return TaskTool()
-    
-    @pytest.fixture
-    def execution_context(self):
+    def execution_context(self, tmp_path_factory):
         """Create execution context."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield ExecutionContext(
-                working_directory=Path(temp_dir),
-                environment={},
-                user_id="test_user",
-                session_id="test_session"
-            )
+        return ExecutionContext(
+            working_directory=tmp_path_factory.mktemp("tasktool"),
+            environment={},
+            user_id="test_user",
+            session_id="test_session"
+        )
 
     def test_task_decomposition_workflow(self, task_tool, execution_context):
         """Test a complete task decomposition workflow."""
@@ -300,22 +276,20 @@ class TestTaskToolIntegration:
         assert create_result.success
         assert create_result.data['id'] != plan_id  # Different plan IDs
 
-    def test_different_task_types(self, task_tool, execution_context):
+    @pytest.mark.parametrize("task_desc", [
+        "Fix a bug in user authentication",
+        "Refactor legacy code to use new patterns",
+        "Add unit tests for the payment module",
+        "Optimize database query performance"
+    ])
+    def test_different_task_types(self, task_tool, execution_context, task_desc):
         """Test decomposition of different types of tasks."""
-        test_tasks = [
-            "Fix a bug in user authentication",
-            "Refactor legacy code to use new patterns", 
-            "Add unit tests for the payment module",
-            "Optimize database query performance"
-        ]
+        result = task_tool.execute(
+            execution_context,
+            action="decompose_task",
+            description=task_desc
+        )
         
-        for task_desc in test_tasks:
-            result = task_tool.execute(
-                execution_context,
-                action="decompose_task",
-                description=task_desc
-            )
-            
-            assert result.success, f"Failed to decompose: {task_desc}"
-            assert len(result.data['plan']['steps']) > 0
-            assert result.data['step_count'] > 0
\ No newline at end of file
+        assert result.success, f"Failed to decompose: {task_desc}"
+        assert len(result.data['plan']['steps']) > 0
+        assert result.data['step_count'] > 0
\ No newline at end of file
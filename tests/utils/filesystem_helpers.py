@@ -27,7 +27,7 @@ class FileSystemChange:
 class FileSystemSnapshot:
     """Snapshot of filesystem state."""
     timestamp: float
-    files: Dict[str, Dict[str, Any]]  # path -> {size, mtime, hash, permissions}
+    files: Dict[str, Dict[str, Any]]  # path -> {size, mtime, mtime_ns, hash, permissions}
     directories: List[str]
     
     def compare(self, other: 'FileSystemSnapshot') -> List[FileSystemChange]:
@@ -67,7 +67,7 @@ class FileSystemSnapshot:
                 old_file = self.files[path]
                 new_file = other.files[path]
                 
-                if old_file['hash'] != new_file['hash']:
+                if _file_changed(old_file, new_file):
                     changes.append(FileSystemChange(
                         action="modified",
                         path=path,
@@ -101,6 +101,28 @@ class FileSystemSnapshot:
         return changes
 
 
+def _file_changed(old_file: Dict[str, Any], new_file: Dict[str, Any]) -> bool:
+    """Check whether two snapshot entries for the same path differ.
+    
+    Content hashes are compared when both entries have one; otherwise the
+    entries are compared by size and nanosecond mtime.
+    
+    Args:
+        old_file: Entry from the older snapshot
+        new_file: Entry from the newer snapshot
+        
+    Returns:
+        True if the file was modified
+    """
+    old_hash = old_file.get("hash")
+    new_hash = new_file.get("hash")
+    if old_hash is not None and new_hash is not None:
+        return old_hash != new_hash
+    
+    return ((old_file.get("size"), old_file.get("mtime_ns")) !=
+            (new_file.get("size"), new_file.get("mtime_ns")))
+
+
 class FileSystemTestHelper:
     """Helper class for filesystem testing operations."""
     
@@ -114,15 +136,22 @@ class FileSystemTestHelper:
         self.snapshots: List[FileSystemSnapshot] = []
         self.monitored_paths: List[Path] = []
     
-    def take_snapshot(self, paths: Optional[List[Path]] = None) -> FileSystemSnapshot:
+    def take_snapshot(self, paths: Optional[List[Path]] = None,
+                      fast: bool = True) -> FileSystemSnapshot:
         """Take a snapshot of filesystem state.
         
+        In fast mode only ``stat`` results are recorded and changes are
+        detected by size and mtime; pass ``fast=False`` to also hash file
+        contents, which catches rewrites that keep both unchanged.
+        
         Args:
             paths: Specific paths to snapshot (default: monitored paths)
+            fast: Skip content hashing
             
         Returns:
             Filesystem snapshot
         """
+        rehash = not fast
         if paths is None:
             paths = self.monitored_paths if self.monitored_paths else [self.base_path]
         
@@ -131,13 +160,13 @@ class FileSystemTestHelper:
         
         for path in paths:
             if path.is_file():
-                files[str(path)] = self._get_file_info(path)
+                files[str(path)] = self._get_file_info(path, rehash)
             elif path.is_dir():
                 directories.append(str(path))
                 # Recursively add all files in directory
                 for item in path.rglob("*"):
                     if item.is_file():
-                        files[str(item)] = self._get_file_info(item)
+                        files[str(item)] = self._get_file_info(item, rehash)
                     elif item.is_dir():
                         directories.append(str(item))
         
@@ -150,11 +179,12 @@ class FileSystemTestHelper:
         self.snapshots.append(snapshot)
         return snapshot
     
-    def _get_file_info(self, path: Path) -> Dict[str, Any]:
+    def _get_file_info(self, path: Path, rehash: bool = False) -> Dict[str, Any]:
         """Get file information for snapshot.
         
         Args:
             path: File path
+            rehash: Hash the file contents (hash is None otherwise)
             
         Returns:
             File information dictionary
@@ -163,12 +193,15 @@ class FileSystemTestHelper:
             stat_info = path.stat()
             
             # Calculate file hash
-            with open(path, 'rb') as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
+            file_hash = None
+            if rehash:
+                with open(path, 'rb') as f:
+                    file_hash = hashlib.sha256(f.read()).hexdigest()
             
             return {
                 "size": stat_info.st_size,
                 "mtime": stat_info.st_mtime,
+                "mtime_ns": stat_info.st_mtime_ns,
                 "permissions": stat.filemode(stat_info.st_mode),
                 "hash": file_hash,
                 "owner_readable": os.access(path, os.R_OK),
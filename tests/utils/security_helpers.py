@@ -12,7 +12,7 @@ from james_code.core.base import ToolResult, ExecutionContext
 from james_code.safety import SafetyManager
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityTestResult:
     """Result of a security test."""
     attack_type: str